@@ -0,0 +1,418 @@
+"""Unit tests for API route plumbing (converters, responses, caching, key mapping)."""
+from datetime import date
+from unittest.mock import Mock
+
+from flask import Blueprint, Flask
+
+from transferarr.web.routes.api.connections import (
+    _MARSHMALLOW_KEY_RENAMES,
+    _convert_marshmallow_keys,
+    register_routes as register_connection_routes,
+)
+from transferarr.web.routes.api.download_clients import register_routes as register_client_routes
+from transferarr.web.routes.api.responses import error_response, success_response, success_stream_response
+from transferarr.web.routes.api.system import _get_sanitized_config, register_routes as register_system_routes
+from transferarr.web.routes.api.utilities import register_routes as register_utility_routes
+from transferarr.web.routes.api.transfers import (
+    _decode_cursor,
+    _encode_cursor,
+    register_routes as register_transfer_routes,
+)
+
+
+def _make_manager():
+    manager = Mock()
+    manager.config = {"download_clients": {}, "connections": {}}
+    manager.download_clients = {}
+    manager.connections = {}
+    manager.save_config.return_value = True
+    return manager
+
+
+def _make_app(manager=None):
+    app = Flask(__name__)
+    app.config["TORRENT_MANAGER"] = manager or _make_manager()
+    bp = Blueprint("test_api", __name__, url_prefix="/api/v1")
+    register_client_routes(bp)
+    register_connection_routes(bp)
+    app.register_blueprint(bp)
+    return app
+
+
+def _make_transfers_app(history_service):
+    manager = _make_manager()
+    manager.history_service = history_service
+    app = Flask(__name__)
+    app.config["TORRENT_MANAGER"] = manager
+    bp = Blueprint("test_transfers_api", __name__, url_prefix="/api/v1")
+    register_transfer_routes(bp)
+    app.register_blueprint(bp)
+    return app
+
+
+class TestInternedNameConverter:
+    """Tests for the iname converter used by client/connection routes."""
+
+    def test_converter_registered_on_app(self):
+        app = _make_app()
+        assert "iname" in app.url_map.converters
+
+    def test_missing_connection_name_is_decoded(self):
+        app = _make_app()
+
+        response = app.test_client().delete("/api/v1/connections/My%20Conn")
+
+        assert response.status_code == 404
+        assert response.get_json()["error"]["message"] == "Connection 'My Conn' not found"
+
+    def test_missing_client_returns_404(self):
+        app = _make_app()
+
+        response = app.test_client().delete("/api/v1/download_clients/missing")
+
+        assert response.status_code == 404
+        assert response.get_json()["error"]["code"] == "CLIENT_NOT_FOUND"
+
+
+class TestSuccessResponse:
+    """Tests for the success envelope fast path."""
+
+    def test_bare_response_matches_envelope(self):
+        app = Flask(__name__)
+        with app.app_context():
+            response, status = success_response({"b": 1, "a": [None, "x"]})
+
+        assert status == 200
+        assert response.mimetype == "application/json"
+        assert response.get_json() == {"data": {"a": [None, "x"], "b": 1}}
+
+    def test_message_uses_full_envelope(self):
+        app = Flask(__name__)
+        with app.app_context():
+            response, status = success_response([], "done", status_code=201)
+
+        assert status == 201
+        assert response.get_json() == {"data": [], "message": "done"}
+
+    def test_bodies_are_compact(self):
+        app = Flask(__name__)
+        with app.app_context():
+            ok, _ = success_response({"a": [1, 2]})
+            err, status = error_response("BAD", "nope", {"field": "x"})
+
+        assert ok.get_data() == b'{"data":{"a":[1,2]}}\n'
+        assert status == 400
+        assert err.get_data() == b'{"error":{"code":"BAD","details":{"field":"x"},"message":"nope"}}\n'
+
+
+class TestConditionalListing:
+    """Tests for ETag handling on the list endpoints."""
+
+    def test_get_clients_sets_etag_and_returns_304_on_match(self):
+        client = _make_app().test_client()
+
+        first = client.get("/api/v1/download_clients")
+        etag = first.headers["ETag"]
+        second = client.get("/api/v1/download_clients", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+        assert second.status_code == 304
+        assert second.data == b""
+
+    def test_transfer_listing_returns_304_on_match(self):
+        history_service = Mock()
+        history_service.list_transfers.return_value = ([{"id": "x"}], 1)
+        client = _make_transfers_app(history_service).test_client()
+
+        etag = client.get("/api/v1/transfers").headers["ETag"]
+        response = client.get("/api/v1/transfers", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+
+    def test_get_connections_returns_200_on_stale_etag(self):
+        client = _make_app().test_client()
+
+        response = client.get("/api/v1/connections", headers={"If-None-Match": 'W/"stale"'})
+
+        assert response.status_code == 200
+        assert response.get_json() == {"data": []}
+
+
+class TestConvertMarshmallowKeys:
+    """Tests for mapping schema attribute names back to JSON keys."""
+
+    def test_renames_from_and_leaves_transfer_config_untouched(self):
+        transfer_config = {"from": {"type": "local"}, "to": {"type": "local"}}
+        data = _convert_marshmallow_keys({"from_": "a", "to": "b", "transfer_config": transfer_config})
+
+        assert data == {"from": "a", "to": "b", "transfer_config": transfer_config}
+
+    def test_rename_table_comes_from_schemas(self):
+        assert _MARSHMALLOW_KEY_RENAMES == (("from_", "from"),)
+
+
+class TestResponseCache:
+    """Tests for the short-TTL response cache on polled GET routes."""
+
+    def test_stats_served_from_cache_until_invalidated(self):
+        history_service = Mock()
+        history_service.get_stats.side_effect = [{"total": 1}, {"total": 0}]
+        history_service.clear_history.return_value = 1
+        client = _make_transfers_app(history_service).test_client()
+
+        first = client.get("/api/v1/transfers/stats").get_json()
+        second = client.get("/api/v1/transfers/stats").get_json()
+        client.delete("/api/v1/transfers")
+        third = client.get("/api/v1/transfers/stats").get_json()
+
+        assert first == second == {"data": {"total": 1}}
+        assert third == {"data": {"total": 0}}
+        assert history_service.get_stats.call_count == 2
+
+    def test_cached_hits_keep_etag_and_answer_304(self):
+        history_service = Mock()
+        history_service.get_stats.return_value = {"total": 1}
+        client = _make_transfers_app(history_service).test_client()
+
+        first = client.get("/api/v1/transfers/stats")
+        cached = client.get("/api/v1/transfers/stats")
+        not_modified = client.get(
+            "/api/v1/transfers/stats", headers={"If-None-Match": first.headers["ETag"]}
+        )
+
+        assert cached.headers["ETag"] == first.headers["ETag"]
+        assert not_modified.status_code == 304
+        assert history_service.get_stats.call_count == 1
+
+    def test_error_responses_are_not_cached(self):
+        history_service = Mock()
+        history_service.get_stats.side_effect = [RuntimeError("db locked"), {"total": 3}]
+        client = _make_transfers_app(history_service).test_client()
+
+        assert client.get("/api/v1/transfers/stats").status_code == 500
+        assert client.get("/api/v1/transfers/stats").get_json() == {"data": {"total": 3}}
+
+
+    def test_health_is_never_cached(self):
+        manager = _make_manager()
+        manager.tracker.get_status.side_effect = [{"enabled": True}, RuntimeError("tracker down")]
+        app = Flask(__name__)
+        app.config["TORRENT_MANAGER"] = manager
+        bp = Blueprint("test_system_api", __name__, url_prefix="/api/v1")
+        register_system_routes(bp)
+        app.register_blueprint(bp)
+        client = app.test_client()
+
+        assert client.get("/api/v1/health").status_code == 200
+        assert client.get("/api/v1/health").status_code == 500
+
+
+class TestHistoryServiceLookup:
+    """Tests for the app-scoped history service lookup."""
+
+    def test_resolved_once_per_app(self):
+        history_service = Mock()
+        history_service.get_active_transfers.return_value = []
+        app = _make_transfers_app(history_service)
+        client = app.test_client()
+
+        client.get("/api/v1/transfers/active")
+        app.config["TORRENT_MANAGER"].history_service = None
+        response = client.get("/api/v1/transfers/active")
+
+        assert app.extensions["history_service"] is history_service
+        assert response.status_code == 200
+
+    def test_missing_service_returns_503(self):
+        response = _make_transfers_app(None).test_client().get("/api/v1/transfers/active")
+
+        assert response.status_code == 503
+
+
+class TestTransferCursorPagination:
+    """Tests for cursor handling on GET /transfers."""
+
+    def test_cursor_round_trip(self):
+        key = ("2026-01-01T00:00:00+00:00", "abc")
+        assert _decode_cursor(_encode_cursor(key)) == key
+
+    def test_cursor_request_uses_keyset_listing(self):
+        history_service = Mock()
+        history_service.list_transfers_keyset.return_value = ([{"id": "x"}], 5, ("t", "x"))
+        client = _make_transfers_app(history_service).test_client()
+        cursor = _encode_cursor(("t0", "w"))
+
+        data = client.get(f"/api/v1/transfers?cursor={cursor}&per_page=1").get_json()["data"]
+
+        kwargs = history_service.list_transfers_keyset.call_args.kwargs
+        assert kwargs["after"] == ("t0", "w")
+        assert data["next_cursor"] == _encode_cursor(("t", "x"))
+        assert data["total"] == 5
+
+    def test_include_total_false_uses_probe(self):
+        history_service = Mock()
+        history_service.list_transfers_probe.return_value = ([{"id": "x", "created_at": "t"}], True)
+        client = _make_transfers_app(history_service).test_client()
+
+        data = client.get("/api/v1/transfers?include_total=false&per_page=1").get_json()["data"]
+
+        history_service.list_transfers.assert_not_called()
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["has_more"] is True
+        assert data["next_cursor"] == _encode_cursor(("t", "x"))
+
+    def test_dates_parsed_before_listing(self):
+        history_service = Mock()
+        history_service.list_transfers.return_value = ([], 0)
+        client = _make_transfers_app(history_service).test_client()
+
+        client.get("/api/v1/transfers?from_date=2025-01-01&to_date=2025-12-31")
+
+        kwargs = history_service.list_transfers.call_args.kwargs
+        assert kwargs["start_date"] == date(2025, 1, 1)
+        assert kwargs["end_date"] == date(2025, 12, 31)
+
+    def test_malformed_date_rejected(self):
+        history_service = Mock()
+        client = _make_transfers_app(history_service).test_client()
+
+        response = client.get("/api/v1/transfers?from_date=01/02/2025")
+
+        assert response.status_code == 400
+        history_service.list_transfers.assert_not_called()
+
+    def test_invalid_cursor_rejected(self):
+        client = _make_transfers_app(Mock()).test_client()
+
+        response = client.get("/api/v1/transfers?cursor=not-a-cursor")
+
+        assert response.status_code == 400
+
+    def test_cursor_with_other_sort_rejected(self):
+        client = _make_transfers_app(Mock()).test_client()
+        cursor = _encode_cursor(("t0", "w"))
+
+        response = client.get(f"/api/v1/transfers?cursor={cursor}&sort=size_bytes")
+
+        assert response.status_code == 400
+
+
+class TestStreamResponse:
+    """Tests for the streamed data envelope."""
+
+    def _get(self, mapping):
+        app = Flask(__name__)
+
+        @app.route("/stream")
+        def stream():
+            return success_stream_response(mapping)
+
+        return app.test_client().get("/stream")
+
+    def test_stream_matches_envelope_across_chunks(self):
+        mapping = {f"hash{i}": {"name": f"Torrent {i}", "progress": i / 10} for i in range(150)}
+
+        response = self._get(mapping)
+
+        assert response.status_code == 200
+        assert response.is_streamed
+        assert response.get_json() == {"data": mapping}
+
+    def test_empty_mapping(self):
+        assert self._get({}).get_json() == {"data": {}}
+
+
+class TestSanitizedConfig:
+    """Tests for the memoized /config payload."""
+
+    def _make_manager(self):
+        manager = Mock()
+        manager.config = {"download_clients": {"src": {"host": "h", "password": "secret"}}}
+        manager.config_version = 0
+        manager._sanitized_config_cache = None
+        return manager
+
+    def test_masks_passwords_without_touching_config(self):
+        manager = self._make_manager()
+
+        payload = _get_sanitized_config(manager)
+
+        assert payload == {"download_clients": {"src": {"host": "h", "password": "***"}}}
+        assert manager.config["download_clients"]["src"]["password"] == "secret"
+
+    def test_memoized_until_version_changes(self):
+        manager = self._make_manager()
+        first = _get_sanitized_config(manager)
+
+        manager.config["download_clients"]["dst"] = {"host": "d", "password": "x"}
+        assert _get_sanitized_config(manager) is first
+
+        manager.config_version += 1
+        assert "dst" in _get_sanitized_config(manager)["download_clients"]
+
+
+class TestValidateJson:
+    """Tests for the validate_json decorator."""
+
+    def test_non_json_body_rejected_with_415(self):
+        client = _make_app().test_client()
+
+        response = client.post("/api/v1/download_clients", data="name=x")
+
+        assert response.status_code == 415
+        assert response.get_json()["error"]["code"] == "UNSUPPORTED_MEDIA_TYPE"
+
+    def test_malformed_json_reports_validation_errors(self):
+        client = _make_app().test_client()
+
+        response = client.post(
+            "/api/v1/download_clients", data="{not json", content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert "name" in response.get_json()["error"]["details"]
+
+
+class TestBrowseDirectory:
+    """Tests for request body handling in POST /browse."""
+
+    def _client(self):
+        app = Flask(__name__)
+        bp = Blueprint("test_utilities_api", __name__, url_prefix="/api/v1")
+        register_utility_routes(bp)
+        app.register_blueprint(bp)
+        return app.test_client()
+
+    def test_malformed_json_is_validation_error(self):
+        response = self._client().post(
+            "/api/v1/browse", data="{not json", content_type="application/json"
+        )
+
+        assert response.status_code == 400
+        assert response.get_json()["error"]["code"] == "VALIDATION_ERROR"
+
+    def test_non_object_body_is_validation_error(self):
+        response = self._client().post("/api/v1/browse", json=["type"])
+
+        assert response.status_code == 400
+
+    def test_local_listing_returned_in_envelope(self, tmp_path):
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "file.txt").write_text("x")
+
+        response = self._client().post("/api/v1/browse", json={"type": "local", "path": str(tmp_path)})
+
+        data = response.get_json()["data"]
+        assert response.status_code == 200
+        assert [entry["name"] for entry in data["entries"]] == ["sub", "file.txt"]
+        assert data["current_path"] == str(tmp_path)
+
+    def test_missing_local_path_returns_404(self, tmp_path):
+        missing = str(tmp_path / "missing")
+
+        response = self._client().post("/api/v1/browse", json={"type": "local", "path": missing})
+
+        assert response.status_code == 404
+        assert response.get_json()["error"]["code"] == "PATH_NOT_FOUND"
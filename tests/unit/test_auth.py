@@ -4,22 +4,33 @@ import tempfile
 
 import pytest
 
+import transferarr.auth as auth_module
 from transferarr.auth import (
     API_KEY_LENGTH,
     API_KEY_PREFIX,
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    LoginRateLimiter,
     User,
+    calibrate_bcrypt_rounds,
+    configure_password_hashing,
     generate_api_key,
     get_api_config,
     get_auth_config,
+    get_auth_config_version,
+    get_auth_state,
+    get_hash_rounds,
     get_or_create_api_key,
     get_or_create_secret_key,
     hash_password,
     is_api_key_required,
     is_auth_configured,
     is_auth_enabled,
+    needs_rehash,
     save_api_config,
     save_auth_config,
     verify_api_key,
+    verify_credentials,
     verify_password,
 )
 
@@ -73,6 +84,83 @@ class TestPasswordHashing:
         assert verify_password("", None) is False
 
 
+class TestBcryptCost:
+    """Tests for bcrypt cost configuration and calibration."""
+
+    @pytest.fixture(autouse=True)
+    def restore_rounds(self, monkeypatch):
+        monkeypatch.setattr(auth_module, "_bcrypt_rounds", auth_module._bcrypt_rounds)
+
+    def test_hash_uses_requested_rounds(self):
+        assert get_hash_rounds(hash_password("password123", rounds=4)) == 4
+
+    def test_calibration_stays_within_bounds(self):
+        assert calibrate_bcrypt_rounds(target_seconds=0) == BCRYPT_MIN_ROUNDS
+        assert calibrate_bcrypt_rounds(target_seconds=1000) == BCRYPT_MAX_ROUNDS
+
+    def test_configured_rounds_override_calibration(self, monkeypatch):
+        monkeypatch.setattr(auth_module, "calibrate_bcrypt_rounds", lambda: pytest.fail("calibrated"))
+
+        assert configure_password_hashing({"auth": {"bcrypt_rounds": 4}}) == 4
+        assert get_hash_rounds(hash_password("password123")) == 4
+
+    def test_calibration_runs_once(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(auth_module, "_calibrated_rounds", None)
+        monkeypatch.setattr(auth_module, "calibrate_bcrypt_rounds", lambda: calls.append(1) or 11)
+
+        assert configure_password_hashing({}) == 11
+        assert configure_password_hashing({}) == 11
+        assert len(calls) == 1
+
+    def test_needs_rehash_only_when_weaker(self, monkeypatch):
+        monkeypatch.setattr(auth_module, "_bcrypt_rounds", 5)
+
+        assert needs_rehash(hash_password("password123", rounds=4)) is True
+        assert needs_rehash(hash_password("password123", rounds=5)) is False
+        assert needs_rehash(hash_password("password123", rounds=6)) is False
+
+    @pytest.mark.parametrize("value", [3, 32, "12", 12.0, True])
+    def test_invalid_configured_rounds_rejected(self, value):
+        with pytest.raises(ValueError, match="bcrypt_rounds"):
+            configure_password_hashing({"auth": {"bcrypt_rounds": value}})
+
+    @pytest.mark.parametrize("value", [None, "", "not-a-hash", "$2b$xx$abc"])
+    def test_get_hash_rounds_invalid(self, value):
+        assert get_hash_rounds(value) is None
+
+
+class TestVerifyCredentials:
+    """Tests for verify_credentials."""
+
+    @pytest.fixture
+    def config(self):
+        return {"auth": {"enabled": True, "username": "admin", "password_hash": hash_password("password123")}}
+
+    def test_correct_credentials(self, config):
+        assert verify_credentials(config, "admin", "password123") is True
+
+    def test_wrong_username(self, config):
+        assert verify_credentials(config, "admin2", "password123") is False
+
+    def test_wrong_password(self, config):
+        assert verify_credentials(config, "admin", "wrong") is False
+
+    def test_missing_password_hash(self):
+        config = {"auth": {"enabled": True, "username": "admin"}}
+        assert verify_credentials(config, "admin", "password123") is False
+
+    def test_password_checked_even_when_username_wrong(self, config, monkeypatch):
+        calls = []
+        monkeypatch.setattr("transferarr.auth.verify_password", lambda *args: calls.append(args) or True)
+
+        assert verify_credentials(config, "nobody", "password123") is False
+        assert len(calls) == 1
+
+    def test_non_ascii_username(self, config):
+        assert verify_credentials(config, "ädmin", "password123") is False
+
+
 class TestGetAuthConfig:
     """Tests for get_auth_config function."""
 
@@ -201,6 +289,23 @@ class TestIsAuthConfigured:
         assert is_auth_configured(config) is False
 
 
+class TestGetAuthState:
+    """Tests for get_auth_state (combined configured/enabled check)."""
+
+    @pytest.mark.parametrize("config", [
+        {},
+        {"auth": {}},
+        {"auth": {"enabled": False}},
+        {"auth": {"enabled": False, "password_hash": "h"}},
+        {"auth": {"enabled": True}},
+        {"auth": {"enabled": True, "password_hash": None}},
+        {"auth": {"enabled": True, "password_hash": "h"}},
+        {"auth": {"password_hash": "h"}},
+    ])
+    def test_matches_individual_checks(self, config):
+        assert get_auth_state(config) == (is_auth_configured(config), is_auth_enabled(config))
+
+
 class TestSaveAuthConfig:
     """Tests for save_auth_config function."""
 
@@ -539,3 +644,338 @@ class TestGetOrCreateApiKey:
             assert saved["api"]["key"] == key
         finally:
             os.unlink(config_path)
+
+
+class TestAuthRequiredState:
+    """Tests for the cached auth state used by the UI auth_required decorator."""
+
+    def _make_app(self, config):
+        from flask import Blueprint, Flask
+
+        from transferarr.web.routes.ui import auth_required
+
+        app = Flask(__name__)
+        app.config["APP_CONFIG"] = config
+        auth_bp = Blueprint("auth", __name__)
+        auth_bp.add_url_rule("/setup", "setup", lambda: "setup")
+        app.register_blueprint(auth_bp)
+        app.add_url_rule("/", "page", auth_required(lambda: "page"))
+        return app
+
+    def test_redirects_to_setup_until_auth_saved(self):
+        config = {}
+        client = self._make_app(config).test_client()
+
+        assert client.get("/").status_code == 302
+
+        save_auth_config(config, {"enabled": False})
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.data == b"page"
+
+    def test_state_cached_between_saves(self):
+        config = {"auth": {"enabled": False}}
+        app = self._make_app(config)
+        client = app.test_client()
+
+        client.get("/")
+        cached = app.extensions["auth_state"]
+        client.get("/")
+
+        assert app.extensions["auth_state"] is cached
+        assert cached == (get_auth_config_version(), True, False)
+
+    def test_enabled_auth_requires_login(self):
+        from flask_login import LoginManager
+
+        config = {"auth": {"enabled": True, "password_hash": hash_password("password123")}}
+        app = self._make_app(config)
+        app.secret_key = "test"
+        LoginManager(app).user_loader(lambda user_id: None)
+
+        assert app.test_client().get("/").status_code == 401
+
+
+class TestLoginRateLimiter:
+    """Tests for the per-client login token bucket."""
+
+    def _make(self, burst=3, window=60.0):
+        now = [0.0]
+        return LoginRateLimiter(burst, window, clock=lambda: now[0]), now
+
+    def test_burst_then_throttled(self):
+        limiter, _ = self._make()
+
+        assert [limiter.allow("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+
+    def test_clients_are_independent(self):
+        limiter, _ = self._make(burst=1)
+
+        assert limiter.allow("1.2.3.4") is True
+        assert limiter.allow("1.2.3.4") is False
+        assert limiter.allow("5.6.7.8") is True
+
+    def test_refills_over_window(self):
+        limiter, now = self._make(burst=3, window=60.0)
+        for _ in range(3):
+            limiter.allow("1.2.3.4")
+
+        now[0] = 19.0
+        assert limiter.allow("1.2.3.4") is False
+        now[0] = 20.0
+        assert limiter.allow("1.2.3.4") is True
+
+    def test_reset_restores_allowance(self):
+        limiter, _ = self._make(burst=1)
+        limiter.allow("1.2.3.4")
+
+        limiter.reset("1.2.3.4")
+
+        assert limiter.allow("1.2.3.4") is True
+
+    def test_prunes_full_buckets(self, monkeypatch):
+        limiter, now = self._make(burst=1, window=1.0)
+        monkeypatch.setattr(LoginRateLimiter, "PRUNE_THRESHOLD", 2)
+        limiter.allow("a")
+        limiter.allow("b")
+
+        now[0] = 5.0
+        limiter.allow("c")
+
+        assert set(limiter._buckets) == {"c"}
+
+
+class TestLoginRoute:
+    """Tests for the /login form handler."""
+
+    @staticmethod
+    def _make_app(tmp_path, **auth_settings):
+        from unittest.mock import Mock
+
+        from transferarr.web import create_app
+
+        config = {"auth": {
+            "enabled": True,
+            "username": "admin",
+            "password_hash": hash_password("password123", rounds=4),
+            "bcrypt_rounds": 5,
+            **auth_settings,
+        }}
+        return create_app(config, Mock(), str(tmp_path))
+
+    @pytest.fixture
+    def app(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(auth_module, "_bcrypt_rounds", auth_module._bcrypt_rounds)
+        app = self._make_app(tmp_path)
+        yield app
+        app.extensions["password_pool"].shutdown()
+
+    def _login(self, app, password, headers=None):
+        return app.test_client().post(
+            "/login", data={"username": "admin", "password": password}, headers=headers
+        )
+
+    def test_valid_login_verified_on_pool(self, app):
+        response = self._login(app, "password123")
+
+        assert response.status_code == 302
+        assert "password_pool" in app.extensions
+
+    def test_valid_login_sets_permanent_session(self, app):
+        client = app.test_client()
+        client.post("/login", data={"username": "admin", "password": "password123"})
+
+        with client.session_transaction() as session:
+            assert session.permanent is True
+            assert session["_user_id"] == "admin"
+
+    def test_valid_login_upgrades_weaker_hash(self, app):
+        self._login(app, "password123")
+
+        password_hash = app.config["APP_CONFIG"]["auth"]["password_hash"]
+        assert get_hash_rounds(password_hash) == 5
+        assert verify_password("password123", password_hash)
+
+    def test_valid_login_keeps_costlier_hash(self, app):
+        costlier = hash_password("password123", rounds=6)
+        app.config["APP_CONFIG"]["auth"]["password_hash"] = costlier
+
+        self._login(app, "password123")
+
+        assert app.config["APP_CONFIG"]["auth"]["password_hash"] == costlier
+
+    def test_invalid_login(self, app):
+        response = self._login(app, "wrong")
+
+        assert response.status_code == 200
+        assert get_hash_rounds(app.config["APP_CONFIG"]["auth"]["password_hash"]) == 4
+
+    def test_repeated_failures_throttled(self, app):
+        statuses = [self._login(app, "wrong").status_code for _ in range(6)]
+
+        assert statuses == [200] * 5 + [429]
+
+    def test_successful_login_resets_throttle(self, app):
+        for _ in range(4):
+            self._login(app, "wrong")
+        self._login(app, "password123")
+
+        assert all(self._login(app, "wrong").status_code == 200 for _ in range(5))
+
+    def test_throttle_shared_behind_untrusted_proxy(self, app):
+        statuses = [
+            self._login(app, "wrong", headers={"X-Forwarded-For": f"10.0.0.{i}"}).status_code
+            for i in range(6)
+        ]
+
+        assert statuses[-1] == 429
+
+    def test_trusted_proxy_throttles_per_forwarded_client(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(auth_module, "_bcrypt_rounds", auth_module._bcrypt_rounds)
+        app = self._make_app(tmp_path, trusted_proxies=1)
+        try:
+            for _ in range(5):
+                self._login(app, "wrong", headers={"X-Forwarded-For": "10.0.0.1"})
+            blocked = self._login(app, "wrong", headers={"X-Forwarded-For": "10.0.0.1"})
+            other = self._login(app, "wrong", headers={"X-Forwarded-For": "10.0.0.2"})
+        finally:
+            app.extensions["password_pool"].shutdown()
+
+        assert blocked.status_code == 429
+        assert other.status_code == 200
+
+    @pytest.mark.parametrize("trusted_proxies", [-1, "1", True])
+    def test_invalid_trusted_proxies_rejected(self, monkeypatch, tmp_path, trusted_proxies):
+        monkeypatch.setattr(auth_module, "_bcrypt_rounds", auth_module._bcrypt_rounds)
+        with pytest.raises(ValueError, match="trusted_proxies"):
+            self._make_app(tmp_path, trusted_proxies=trusted_proxies)
+
+    def test_verification_timeout(self, app, monkeypatch):
+        import threading
+
+        release = threading.Event()
+        monkeypatch.setattr("transferarr.web.routes.auth.PASSWORD_VERIFY_TIMEOUT", 0.05)
+        monkeypatch.setattr(
+            "transferarr.web.routes.auth.verify_credentials", lambda *args: release.wait(5)
+        )
+
+        try:
+            assert self._login(app, "password123").status_code == 503
+        finally:
+            release.set()
+
+
+    def test_timed_out_queued_check_cancelled(self, app, monkeypatch):
+        import threading
+
+        from transferarr.web.routes.auth import PASSWORD_VERIFY_WORKERS
+
+        release = threading.Event()
+        calls = []
+        monkeypatch.setattr("transferarr.web.routes.auth.PASSWORD_VERIFY_TIMEOUT", 0.05)
+        monkeypatch.setattr(
+            "transferarr.web.routes.auth.verify_credentials",
+            lambda *args: calls.append(args) or release.wait(5),
+        )
+
+        try:
+            statuses = [self._login(app, "wrong").status_code for _ in range(PASSWORD_VERIFY_WORKERS + 1)]
+        finally:
+            release.set()
+        app.extensions["password_pool"].shutdown(wait=True)
+
+        assert statuses == [503] * (PASSWORD_VERIFY_WORKERS + 1)
+        assert len(calls) == PASSWORD_VERIFY_WORKERS
+
+    def test_full_queue_rejected_without_queueing(self, app, monkeypatch):
+        import threading
+
+        release = threading.Event()
+        calls = []
+        monkeypatch.setattr("transferarr.web.routes.auth.PASSWORD_VERIFY_TIMEOUT", 0.05)
+        monkeypatch.setattr("transferarr.web.routes.auth.PASSWORD_VERIFY_MAX_PENDING", 1)
+        monkeypatch.setattr(
+            "transferarr.web.routes.auth.verify_credentials",
+            lambda *args: calls.append(args) or release.wait(5),
+        )
+
+        try:
+            assert self._login(app, "password123").status_code == 503
+            assert self._login(app, "password123").status_code == 503
+            assert len(calls) == 1
+        finally:
+            release.set()
+        # The slot is returned once the running check finishes
+        slots = app.extensions["password_slots"]
+        assert slots.acquire(timeout=5)
+        slots.release()
+
+        assert self._login(app, "password123").status_code == 302
+
+class TestUiPageCache:
+    """Tests for the rendered UI page cache."""
+
+    @pytest.fixture
+    def app(self, tmp_path):
+        from unittest.mock import Mock
+
+        from transferarr.web import create_app
+
+        return create_app({"auth": {"enabled": False, "bcrypt_rounds": 4}}, Mock(), str(tmp_path))
+
+    def test_page_rendered_once(self, app, monkeypatch):
+        from transferarr.web.routes import ui
+
+        client = app.test_client()
+        first = client.get("/torrents")
+        monkeypatch.setattr(ui, "render_template", lambda name: pytest.fail("re-rendered"))
+        second = client.get("/torrents")
+
+        assert first.status_code == second.status_code == 200
+        assert first.data == second.data
+        assert list(app.extensions["page_cache"][1]) == [("pages/torrents.html", None, "", "/torrents")]
+
+    def test_pages_cached_separately(self, app):
+        client = app.test_client()
+
+        dashboard = client.get("/").data
+        history = client.get("/history").data
+
+        assert dashboard != history
+        assert len(app.extensions["page_cache"][1]) == 2
+
+    def test_url_prefix_cached_separately(self, app):
+        client = app.test_client()
+
+        plain = client.get("/").data
+        prefixed = client.get("/", environ_overrides={"SCRIPT_NAME": "/transferarr"}).data
+
+        assert b'href="/transferarr/' in prefixed
+        assert plain != prefixed
+
+    def test_cache_dropped_when_auth_config_changes(self, app, monkeypatch):
+        client = app.test_client()
+        client.get("/")
+
+        monkeypatch.setattr(auth_module, "_auth_config_version", auth_module._auth_config_version + 1)
+        client.get("/history")
+
+        assert list(app.extensions["page_cache"][1]) == [("pages/history.html", None, "", "/history")]
+
+    def test_cache_size_bounded(self, app, monkeypatch):
+        from transferarr.web.routes import ui
+
+        monkeypatch.setattr(ui, "PAGE_CACHE_MAX_ENTRIES", 2)
+        client = app.test_client()
+        for path in ("/", "/history", "/torrents"):
+            client.get(path)
+
+        assert len(app.extensions["page_cache"][1]) == 1
+
+    def test_not_cached_when_templates_auto_reload(self, app):
+        app.config["TEMPLATES_AUTO_RELOAD"] = True
+
+        app.test_client().get("/")
+
+        assert not app.extensions.get("page_cache")
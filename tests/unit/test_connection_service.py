@@ -4,6 +4,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from transferarr.web.services import ConfigSaveError, ConflictError
 from transferarr.web.services.connection_service import ConnectionService
 
 
@@ -297,4 +298,172 @@ class TestConnectionServiceWarnings:
                 "Media -> EU",
                 "client-c",
             )
-        ]
\ No newline at end of file
+        ]
+
+class TestListConnections:
+    def _make_runtime(self, name, is_torrent):
+        connection = _make_runtime_connection(name, _make_client("client-a"), _make_client("client-b"))
+        connection.is_torrent_transfer = is_torrent
+        connection.transfer_config = (
+            {"type": "torrent"} if is_torrent
+            else {"from": {"type": "sftp", "sftp": {"password": "secret"}}, "to": {"type": "local"}}
+        )
+        connection.get_active_transfers_count.return_value = 1
+        connection.get_total_transfers_count.return_value = 5
+        connection.max_transfers = 3
+        connection.source_dot_torrent_path = "/src/state"
+        connection.source_torrent_download_path = "/src/downloads"
+        connection.destination_dot_torrent_tmp_dir = "/dst/tmp"
+        connection.destination_torrent_download_path = "/dst/downloads"
+        return connection
+
+    def test_file_connection_view_includes_paths_and_masks_password(self):
+        manager = _make_manager()
+        manager.connections = {"file-conn": self._make_runtime("file-conn", False)}
+
+        views = ConnectionService(manager).list_connections()
+
+        data = views[0].to_dict()
+        assert data["from"] == "client-a"
+        assert data["to"] == "client-b"
+        assert data["transfer_type"] == "file"
+        assert data["source_dot_torrent_path"] == "/src/state"
+        assert data["transfer_config"]["from"]["sftp"]["password"] == "***"
+
+    def test_torrent_connection_view_omits_paths(self):
+        manager = _make_manager()
+        manager.connections = {"torrent-conn": self._make_runtime("torrent-conn", True)}
+
+        views = ConnectionService(manager).list_connections()
+
+        data = views[0].to_dict()
+        assert data["transfer_type"] == "torrent"
+        assert "source_dot_torrent_path" not in data
+        assert not hasattr(views[0], "__dict__")
+
+    def test_masked_config_reused_until_connection_replaced(self):
+        manager = _make_manager()
+        manager.connections = {"file-conn": self._make_runtime("file-conn", False)}
+        service = ConnectionService(manager)
+
+        first = service.list_connections()[0].transfer_config
+        second = service.list_connections()[0].transfer_config
+        manager.connections = {"file-conn": self._make_runtime("file-conn", False)}
+        third = service.list_connections()[0].transfer_config
+
+        assert second is first
+        assert third is not first
+        assert third["from"]["sftp"]["password"] == "***"
+
+
+class TestConnectionNameIndex:
+    def test_lookup_is_case_insensitive(self):
+        service = ConnectionService(_make_manager([("My-Conn", "client-a", "client-b")]))
+
+        actual_name, connection = service._find_connection("my-conn")
+
+        assert actual_name == "My-Conn"
+        assert connection is service.torrent_manager.connections["My-Conn"]
+
+    def test_distinct_unicode_names_not_merged(self):
+        service = ConnectionService(_make_manager([
+            ("Straße", "client-a", "client-b"),
+            ("strasse", "client-c", "client-d"),
+        ]))
+
+        assert service._find_connection("Straße")[0] == "Straße"
+        assert service._find_connection("STRASSE")[0] == "strasse"
+
+    def test_exact_match_preferred_over_case_variants(self):
+        service = ConnectionService(_make_manager([
+            ("Conn", "client-a", "client-b"),
+            ("conn", "client-c", "client-d"),
+        ]))
+
+        assert service._find_connection("conn")[0] == "conn"
+        assert service._find_connection("Conn")[0] == "Conn"
+
+    def test_ambiguous_case_variants_rejected(self):
+        service = ConnectionService(_make_manager([
+            ("Conn", "client-a", "client-b"),
+            ("conn", "client-c", "client-d"),
+        ]))
+
+        with pytest.raises(ConflictError, match="ambiguous"):
+            service.delete_connection("CONN")
+
+        assert set(service.torrent_manager.connections) == {"Conn", "conn"}
+
+    def test_index_follows_rename_and_delete(self):
+        service = ConnectionService(_make_manager([("old", "client-a", "client-b")]))
+        service._find_connection("old")
+
+        service.update_connection("OLD", {
+            "name": "New",
+            "from": "client-a",
+            "to": "client-b",
+            "transfer_config": {"type": "torrent"},
+        })
+
+        assert service._find_connection("old") == (None, None)
+        assert service._find_connection("new")[0] == "New"
+
+        service.delete_connection("new")
+
+        assert service._find_connection("new") == (None, None)
+
+    def test_miss_does_not_rebuild_index(self):
+        service = ConnectionService(_make_manager([("Conn", "client-a", "client-b")]))
+        service._find_connection("conn")
+        index = service._name_index
+
+        assert service._find_connection("missing") == (None, None)
+        assert service._name_index is index
+
+    def test_concurrent_builds_do_not_duplicate_names(self):
+        import threading
+
+        service = ConnectionService(_make_manager([("Conn", "client-a", "client-b")]))
+        threads = [threading.Thread(target=service._find_connection, args=("conn",)) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert service._name_index == {"conn": ["Conn"]}
+        assert service._find_connection("CONN")[0] == "Conn"
+
+    def test_duplicate_name_rejected_case_insensitively(self):
+        service = ConnectionService(_make_manager([("Conn", "client-a", "client-b")]))
+
+        with pytest.raises(ConflictError):
+            service.add_connection({
+                "name": "CONN",
+                "from": "client-c",
+                "to": "client-d",
+                "transfer_config": {"type": "torrent"},
+            })
+
+
+class TestConnectionConfigCopies:
+    def test_failed_delete_leaves_runtime_config_untouched(self):
+        manager = _make_manager([("conn", "client-a", "client-b")])
+        manager.save_config.return_value = False
+        service = ConnectionService(manager)
+
+        with pytest.raises(ConfigSaveError):
+            service.delete_connection("conn")
+
+        assert "conn" in manager.config["connections"]
+        assert "conn" in manager.connections
+
+    def test_delete_saves_config_without_connection(self):
+        manager = _make_manager([("conn", "client-a", "client-b"), ("other", "client-c", "client-d")])
+        original_connections = manager.config["connections"]
+        service = ConnectionService(manager)
+
+        service.delete_connection("conn")
+
+        saved = manager.save_config.call_args.args[0]
+        assert list(saved["connections"]) == ["other"]
+        assert "conn" in original_connections
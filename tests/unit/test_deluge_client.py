@@ -128,6 +128,34 @@ class TestGetAllTorrentsStatus:
             }
 
 
+class TestDecodeRpc:
+    """Tests for skipping decode_bytes when rencode already decoded UTF-8."""
+
+    def _make_client(self, decode_utf8):
+        with patch("transferarr.clients.deluge.DelugeRPCClient") as mock_rpc_class:
+            mock_rpc = MagicMock()
+            mock_rpc_class.return_value = mock_rpc
+            mock_rpc.connected = True
+            mock_rpc.decode_utf8 = decode_utf8
+
+            client = DelugeClient(make_rpc_config())
+            client.rpc_client = mock_rpc
+            return client, mock_rpc
+
+    def test_decoded_reply_returned_as_is(self):
+        client, mock_rpc = self._make_client(decode_utf8=True)
+        status = {"abc123": {"name": "Example Torrent", "trackers": [{"url": "http://t"}]}}
+        mock_rpc.core.get_torrents_status.return_value = status
+
+        assert client.get_all_torrents_status() is status
+
+    def test_raw_reply_decoded(self):
+        client, mock_rpc = self._make_client(decode_utf8=False)
+        mock_rpc.core.get_torrents_status.return_value = {b"abc123": {b"name": b"Example Torrent"}}
+
+        assert client.get_all_torrents_status() == {"abc123": {"name": "Example Torrent"}}
+
+
 class TestStartCreateTorrent:
     """Tests for start_create_torrent — fires RPC and returns poll spec."""
 
@@ -825,6 +853,61 @@ class TestForceReannounce:
             assert result is False
 
 
+class TestRemoveTorrents:
+    """Tests for batched remove_torrents."""
+
+    def _make_client(self):
+        with patch("transferarr.clients.deluge.DelugeRPCClient") as mock_rpc_class:
+            mock_rpc = MagicMock()
+            mock_rpc_class.return_value = mock_rpc
+            mock_rpc.connected = True
+
+            client = DelugeClient(make_rpc_config())
+            client.rpc_client = mock_rpc
+            return client, mock_rpc
+
+    def test_single_rpc_call_for_all_torrents(self):
+        """RPC mode removes every torrent with one core.remove_torrents call."""
+        client, mock_rpc = self._make_client()
+        mock_rpc.core.remove_torrents.return_value = [(b"hash2", b"Torrent not found")]
+
+        failures = client.remove_torrents(["hash1", "hash2"], remove_data=True)
+
+        mock_rpc.core.remove_torrents.assert_called_once_with(["hash1", "hash2"], True)
+        mock_rpc.core.remove_torrent.assert_not_called()
+        assert failures == {"hash2": "Torrent not found"}
+
+    def test_falls_back_to_single_removals(self):
+        """A failing batch call falls back to one remove_torrent per torrent."""
+        client, mock_rpc = self._make_client()
+        mock_rpc.core.remove_torrents.side_effect = Exception("unknown method")
+
+        failures = client.remove_torrents(["hash1", "hash2"])
+
+        assert failures == {}
+        assert mock_rpc.core.remove_torrent.call_count == 2
+
+    def test_fallback_treats_missing_torrents_as_removed(self):
+        """Torrents the failed batch already removed are not reported as failures."""
+        client, mock_rpc = self._make_client()
+        mock_rpc.core.remove_torrents.side_effect = Exception("timed out")
+        InvalidTorrentError = type("InvalidTorrentError", (Exception,), {})
+        mock_rpc.core.remove_torrent.side_effect = [
+            InvalidTorrentError("torrent_id hash1 not in session."),
+            Exception("Permission denied"),
+        ]
+
+        failures = client.remove_torrents(["hash1", "hash2"])
+
+        assert failures == {"hash2": "Permission denied"}
+
+    def test_empty_list_makes_no_call(self):
+        client, mock_rpc = self._make_client()
+
+        assert client.remove_torrents([]) == {}
+        mock_rpc.core.remove_torrents.assert_not_called()
+
+
 # --- Test _apply_label (U8) ---
 
 class TestApplyLabel:
@@ -385,6 +385,20 @@ class TestClientRegistry:
         assert "deluge" in supported
         assert isinstance(supported, list)
     
+    def test_get_supported_types_text(self):
+        """get_supported_types_text() joins the registered types."""
+        assert ClientRegistry.get_supported_types_text() == ", ".join(ClientRegistry.get_supported_types())
+    
+    def test_supported_types_text_refreshed_on_register(self, monkeypatch):
+        """Registering a type rebuilds the cached text."""
+        monkeypatch.setattr(ClientRegistry, "_clients", dict(ClientRegistry._clients))
+        monkeypatch.setattr(ClientRegistry, "_supported_text", None)
+        ClientRegistry.get_supported_types_text()
+        
+        ClientRegistry.register("extra")(type("ExtraClient", (), {}))
+        
+        assert ClientRegistry.get_supported_types_text().endswith(", extra")
+    
     def test_is_supported(self):
         """is_supported() returns True for registered types."""
         assert ClientRegistry.is_supported("deluge") is True
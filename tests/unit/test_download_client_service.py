@@ -0,0 +1,189 @@
+"""Unit tests for DownloadClientService."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from transferarr.clients.config import ClientConfig
+from transferarr.clients.deluge import DelugeClient
+from transferarr.services.transfer_connection import TransferConnection
+from transferarr.web.services import ConfigSaveError, ConflictError, ValidationError
+from transferarr.web.services.download_client_service import DownloadClientService
+
+
+class _StubClient:
+    """Download client stand-in tracking its connections like the real base class."""
+
+    API_FIELDS = ("name", "type", "host", "port", "username", "delete_cross_seeds")
+
+    def __init__(self, name):
+        self.name = name
+        self.type = "deluge"
+        self.host = "localhost"
+        self.port = 58846
+        self.username = None
+        self.password = "secret"
+        self.delete_cross_seeds = True
+        self.connections = []
+
+    def add_connection(self, connection):
+        self.connections.append(connection)
+
+    def remove_connection(self, connection):
+        self.connections.remove(connection)
+
+
+def _make_service(connections):
+    """Build a service over stub clients a, b, c and the given (name, from, to) connections."""
+    clients = {name: _StubClient(name) for name in ("a", "b", "c")}
+    manager = Mock()
+    manager.config = {
+        "download_clients": {name: {"type": "deluge", "password": "secret"} for name in clients},
+        "connections": {},
+    }
+    manager.download_clients = clients
+    manager.connections = {}
+    manager.save_config.return_value = True
+    for name, from_name, to_name in connections:
+        conn_config = {"from": from_name, "to": to_name, "transfer_config": {"type": "torrent"}}
+        manager.config["connections"][name] = conn_config
+        connection = TransferConnection(name, conn_config, clients[from_name], clients[to_name])
+        clients[from_name].add_connection(connection)
+        clients[to_name].add_connection(connection)
+        manager.connections[name] = connection
+
+    service = DownloadClientService(manager)
+    service._create_client_instance = lambda name, data: _StubClient(name)
+    return service, manager
+
+
+class TestUpdateClient:
+    def test_rebuilds_only_connections_using_client(self):
+        service, manager = _make_service([("a-b", "a", "b"), ("b-c", "b", "c"), ("a-c", "a", "c")])
+        untouched = manager.connections["a-c"]
+        old_b = manager.download_clients["b"]
+
+        service.update_client("b", {"type": "deluge", "host": "new-host"})
+
+        new_b = manager.download_clients["b"]
+        assert new_b is not old_b
+        assert manager.connections["a-c"] is untouched
+        assert {conn.name for conn in new_b.connections} == {"a-b", "b-c"}
+        assert manager.connections["a-b"].to_client is new_b
+        assert manager.connections["b-c"].from_client is new_b
+        assert [conn.name for conn in manager.download_clients["a"].connections] == ["a-c", "a-b"]
+
+    def test_self_connection_rebuilt_once(self):
+        service, manager = _make_service([("a-a", "a", "a")])
+
+        service.update_client("a", {"type": "deluge", "host": "new-host"})
+
+        new_a = manager.download_clients["a"]
+        assert list(manager.connections) == ["a-a"]
+        assert new_a.connections == [manager.connections["a-a"]] * 2
+
+    def test_unchanged_settings_skip_save_and_rebuild(self):
+        service, manager = _make_service([("a-b", "a", "b")])
+        old_a = manager.download_clients["a"]
+        connection = manager.connections["a-b"]
+
+        result = service.update_client("a", {"type": "deluge", "password": ""})
+
+        assert result == {"name": "a", "type": "deluge", "password": "***"}
+        manager.save_config.assert_not_called()
+        assert manager.download_clients["a"] is old_a
+        assert manager.connections["a-b"] is connection
+
+    def test_keeps_password_when_omitted(self):
+        service, manager = _make_service([])
+
+        result = service.update_client("a", {"type": "deluge", "host": "new-host"})
+
+        manager.save_config.assert_called_once()
+        assert manager.config["download_clients"]["a"]["password"] == "secret"
+        assert result["password"] == "***"
+
+
+class TestConfigCopies:
+    def test_failed_add_leaves_runtime_config_untouched(self):
+        service, manager = _make_service([])
+        manager.save_config.return_value = False
+
+        with pytest.raises(ConfigSaveError):
+            service.add_client("new", {"type": "deluge"})
+
+        assert "new" not in manager.config["download_clients"]
+
+    def test_failed_update_leaves_runtime_config_untouched(self):
+        service, manager = _make_service([])
+        original = manager.config["download_clients"]["a"]
+        manager.save_config.return_value = False
+
+        with pytest.raises(ConfigSaveError):
+            service.update_client("a", {"type": "deluge", "host": "elsewhere"})
+
+        assert manager.config["download_clients"]["a"] is original
+
+    def test_failed_delete_leaves_runtime_config_untouched(self):
+        service, manager = _make_service([])
+        manager.save_config.return_value = False
+
+        with pytest.raises(ConfigSaveError):
+            service.delete_client("a")
+
+        assert "a" in manager.config["download_clients"]
+        assert "a" in manager.download_clients
+
+    def test_delete_saves_config_without_client(self):
+        service, manager = _make_service([])
+
+        service.delete_client("a")
+
+        saved = manager.save_config.call_args.args[0]
+        assert list(saved["download_clients"]) == ["b", "c"]
+        assert list(manager.config["download_clients"]) == ["b", "c"]
+
+
+class TestDeleteClient:
+    def test_client_used_by_connection_rejected(self):
+        service, _ = _make_service([("a-b", "a", "b")])
+
+        with pytest.raises(ConflictError):
+            service.delete_client("b")
+
+
+class TestSerializeClient:
+    def test_masks_password(self):
+        service, _ = _make_service([])
+
+        assert service.get_client("a") == {
+            "name": "a",
+            "type": "deluge",
+            "host": "localhost",
+            "port": 58846,
+            "username": None,
+            "password": "***",
+            "delete_cross_seeds": True,
+        }
+
+    def test_deluge_includes_connection_type(self):
+        with patch("transferarr.clients.deluge.DelugeRPCClient"):
+            client = DelugeClient(ClientConfig(
+                name="deluge", client_type="deluge", host="localhost", port=58846,
+                password="secret", extra_config={"connection_type": "rpc"},
+            ))
+        service, manager = _make_service([])
+        manager.download_clients["deluge"] = client
+
+        result = service.get_client("deluge")
+
+        assert result["connection_type"] == "rpc"
+        assert result["password"] == "***"
+
+
+class TestSupportedTypes:
+    def test_unsupported_type_lists_supported(self):
+        service, _ = _make_service([])
+
+        with pytest.raises(ValidationError, match="Supported: .*deluge"):
+            service.add_client("new", {"type": "nonexistent"})
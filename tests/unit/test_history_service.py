@@ -6,8 +6,8 @@ import tempfile
 import threading
 import time
 import uuid
-from datetime import datetime, timedelta, timezone
-from unittest.mock import MagicMock
+from datetime import date, datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -114,6 +114,35 @@ class TestDatabaseInitialization:
         }
         assert expected_indexes.issubset(indexes)
     
+    def test_creates_sort_indexes(self, history_service, db_path):
+        """Indexes should back the status filter + default sort and alternate sort columns."""
+        conn = sqlite3.connect(db_path)
+        cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        indexes = {row[0] for row in cursor.fetchall()}
+        conn.close()
+        
+        expected_indexes = {
+            'idx_transfers_status_created_at',
+            'idx_transfers_completed_at',
+            'idx_transfers_size_bytes',
+            'idx_transfers_torrent_name',
+        }
+        assert expected_indexes.issubset(indexes)
+    
+    def test_status_filter_uses_composite_index(self, history_service, db_path):
+        """Filtering by status and sorting by created_at should not need a temp sort."""
+        conn = sqlite3.connect(db_path)
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM transfers WHERE status = ? "
+            "ORDER BY created_at DESC LIMIT 25",
+            ("completed",)
+        ).fetchall()
+        conn.close()
+        
+        details = " ".join(row[-1] for row in plan)
+        assert "idx_transfers_status_created_at" in details
+        assert "TEMP B-TREE" not in details
+    
     def test_schema_includes_transfer_method_column(self, history_service, db_path):
         """transfers table should include transfer_method column."""
         conn = sqlite3.connect(db_path)
@@ -867,6 +896,27 @@ class TestListTransfers:
         assert total == 1
         assert transfers[0]['status'] == 'completed'
     
+    def test_list_transfers_filter_by_date_objects(self, history_service):
+        """Date bounds include the whole end day."""
+        created = {
+            'Before': '2025-01-31T23:59:59.999999+00:00',
+            'First': '2025-02-01T00:00:00+00:00',
+            'Last': '2025-02-28T23:59:59.500000+00:00',
+            'After': '2025-03-01T00:00:00+00:00',
+        }
+        conn = history_service._get_connection()
+        for name, created_at in created.items():
+            tid = history_service.create_transfer(MockTorrent(name=name), 'src', 'tgt', 'test')
+            conn.execute("UPDATE transfers SET created_at = ? WHERE id = ?", (created_at, tid))
+        conn.commit()
+
+        transfers, total = history_service.list_transfers(
+            start_date=date(2025, 2, 1), end_date=date(2025, 2, 28)
+        )
+
+        assert total == 2
+        assert {t['torrent_name'] for t in transfers} == {'First', 'Last'}
+    
     def test_list_transfers_filter_by_source(self, history_service):
         """list_transfers should filter by source client."""
         for source in ['source-a', 'source-a', 'source-b']:
@@ -999,6 +1049,29 @@ class TestListTransfers:
         assert all(t['trigger'] == 'manual' for t in transfers)
 
 
+class TestListTransfersProbe:
+    """Tests for list_transfers_probe (no COUNT query)."""
+
+    def test_has_more_until_last_page(self, history_service):
+        for i in range(5):
+            history_service.create_transfer(MockTorrent(name=f"T{i}"), 'src', 'tgt', 'test')
+
+        first, first_more = history_service.list_transfers_probe(page=1, per_page=2)
+        last, last_more = history_service.list_transfers_probe(page=3, per_page=2)
+
+        assert len(first) == 2 and first_more is True
+        assert len(last) == 1 and last_more is False
+
+    def test_matches_counted_listing(self, history_service):
+        for i in range(4):
+            history_service.create_transfer(MockTorrent(name=f"T{i}"), 'src', 'tgt', 'test')
+
+        probed, _ = history_service.list_transfers_probe(page=2, per_page=2, sort='torrent_name', order='asc')
+        counted, _ = history_service.list_transfers(page=2, per_page=2, sort='torrent_name', order='asc')
+
+        assert probed == counted
+
+
 class TestGetActiveTransfers:
     """Tests for get_active_transfers method."""
     
@@ -1022,6 +1095,39 @@ class TestGetActiveTransfers:
         names = {t['torrent_name'] for t in active}
         assert names == {'Pending', 'Transferring'}
 
+    def test_cached_between_status_changes(self, history_service):
+        """Repeated calls within the TTL don't hit the database."""
+        history_service.create_transfer(MockTorrent(name="Pending"), 'src', 'tgt', 'test')
+        history_service.get_active_transfers()
+
+        with patch.object(history_service, '_get_connection') as get_conn:
+            active = history_service.get_active_transfers()
+
+        get_conn.assert_not_called()
+        assert [t['torrent_name'] for t in active] == ['Pending']
+
+    def test_status_change_invalidates_cache(self, history_service):
+        """Completing, failing and deleting transfers are visible immediately."""
+        tid1 = history_service.create_transfer(MockTorrent(name="A"), 'src', 'tgt', 'test')
+        tid2 = history_service.create_transfer(MockTorrent(name="B"), 'src', 'tgt', 'test')
+        assert len(history_service.get_active_transfers()) == 2
+
+        history_service.complete_transfer(tid1)
+        assert [t['id'] for t in history_service.get_active_transfers()] == [tid2]
+
+        history_service.delete_transfer_conditional(tid2, force=True)
+        assert history_service.get_active_transfers() == []
+
+        tid3 = history_service.create_transfer(MockTorrent(name="C"), 'src', 'tgt', 'test')
+        assert [t['id'] for t in history_service.get_active_transfers()] == [tid3]
+
+    def test_returned_rows_are_copies(self, history_service):
+        """Mutating a result doesn't leak into later cached results."""
+        history_service.create_transfer(MockTorrent(name="A"), 'src', 'tgt', 'test')
+        history_service.get_active_transfers()[0]['torrent_name'] = 'changed'
+
+        assert history_service.get_active_transfers()[0]['torrent_name'] == 'A'
+
 
 class TestGetStats:
     """Tests for get_stats method."""
@@ -1072,6 +1178,52 @@ class TestGetStats:
         assert stats['failed'] == 0
         assert stats['success_rate'] == 0
         assert stats['total_bytes_transferred'] == 0
+    
+    def test_get_stats_reflects_deletes(self, history_service):
+        """Counters should drop when records are deleted or cleared."""
+        ids = []
+        for size in [100, 200, 300]:
+            tid = history_service.create_transfer(MockTorrent(size=size), 'src', 'tgt', 'test')
+            history_service.complete_transfer(tid)
+            ids.append(tid)
+        pending_id = history_service.create_transfer(MockTorrent(size=50), 'src', 'tgt', 'test')
+        
+        history_service.delete_transfer(ids[0])
+        stats = history_service.get_stats()
+        assert stats['completed'] == 2
+        assert stats['total_bytes_transferred'] == 500
+        
+        history_service.clear_history()
+        stats = history_service.get_stats()
+        assert stats['total'] == 1
+        assert stats['pending'] == 1
+        assert stats['total_bytes_transferred'] == 0
+        assert history_service.get_transfer(pending_id) is not None
+    
+    def test_get_stats_matches_aggregate_after_restart(self, db_path):
+        """Counters are rebuilt from the transfers table on startup."""
+        service = HistoryService(db_path)
+        for size in [100, 200]:
+            tid = service.create_transfer(MockTorrent(size=size), 'src', 'tgt', 'test')
+            service.complete_transfer(tid)
+        service.create_transfer(MockTorrent(size=70), 'src', 'tgt', 'test')
+        service.close()
+        
+        # Simulate a database from before the counters existed
+        conn = sqlite3.connect(db_path)
+        conn.execute("DROP TABLE transfer_stats")
+        conn.commit()
+        conn.close()
+        
+        restarted = HistoryService(db_path)
+        stats = restarted.get_stats()
+        restarted.close()
+        
+        # The pending record was marked failed by the restart
+        assert stats['total'] == 3
+        assert stats['completed'] == 2
+        assert stats['failed'] == 1
+        assert stats['total_bytes_transferred'] == 300
 
 
 class TestPruneOldEntries:
@@ -1174,6 +1326,37 @@ class TestDeleteTransfer:
         assert history_service.get_transfer(tid2) is not None
 
 
+class TestDeleteTransferConditional:
+    """Tests for delete_transfer_conditional method."""
+    
+    def test_deletes_finished_transfer(self, history_service, torrent):
+        """Finished transfers should be deleted in one call."""
+        transfer_id = history_service.create_transfer(torrent, 'source', 'target', 'test')
+        history_service.complete_transfer(transfer_id)
+        
+        assert history_service.delete_transfer_conditional(transfer_id) == 'deleted'
+        assert history_service.get_transfer(transfer_id) is None
+    
+    def test_not_found(self, history_service):
+        """Unknown IDs should report not_found."""
+        assert history_service.delete_transfer_conditional('non-existent-id') == 'not_found'
+    
+    def test_active_transfer_is_kept(self, history_service, torrent):
+        """Pending/transferring records should not be deleted without force."""
+        transfer_id = history_service.create_transfer(torrent, 'source', 'target', 'test')
+        history_service.start_transfer(transfer_id)
+        
+        assert history_service.delete_transfer_conditional(transfer_id) == 'active'
+        assert history_service.get_transfer(transfer_id) is not None
+    
+    def test_force_deletes_active_transfer(self, history_service, torrent):
+        """force=True should delete active records."""
+        transfer_id = history_service.create_transfer(torrent, 'source', 'target', 'test')
+        
+        assert history_service.delete_transfer_conditional(transfer_id, force=True) == 'deleted'
+        assert history_service.get_transfer(transfer_id) is None
+
+
 class TestClearHistory:
     """Tests for clear_history method."""
     
@@ -1268,3 +1451,77 @@ class TestClearHistory:
         """clear_history on empty database should return 0."""
         count = history_service.clear_history()
         assert count == 0
+
+
+class TestListTransfersKeyset:
+    """Tests for list_transfers_keyset seek pagination."""
+    
+    def _create(self, history_service, count):
+        ids = []
+        for i in range(count):
+            ids.append(history_service.create_transfer(
+                torrent=MockTorrent(name=f"Test.Torrent.{i}"),
+                source_client='source',
+                target_client='target',
+                connection_name='test'
+            ))
+        return ids
+    
+    def test_total_skipped_when_not_requested(self, history_service):
+        """include_total=False skips the count but still reports the next key."""
+        self._create(history_service, 3)
+        
+        transfers, total, after = history_service.list_transfers_keyset(per_page=2, include_total=False)
+        
+        assert total is None
+        assert len(transfers) == 2
+        assert after is not None
+    
+    def test_pages_cover_all_rows_once(self, history_service):
+        """Walking next keys should visit every row exactly once, newest first."""
+        self._create(history_service, 7)
+        
+        seen = []
+        after = None
+        while True:
+            transfers, total, after = history_service.list_transfers_keyset(after=after, per_page=3)
+            seen.extend(transfers)
+            if after is None:
+                break
+        
+        assert total == 7
+        assert len({t['id'] for t in seen}) == 7
+        keys = [(t['created_at'], t['id']) for t in seen]
+        assert keys == sorted(keys, reverse=True)
+    
+    def test_last_page_has_no_next_key(self, history_service):
+        """A page that reaches the end should not return a next key."""
+        self._create(history_service, 3)
+        
+        transfers, total, next_key = history_service.list_transfers_keyset(per_page=3)
+        
+        assert len(transfers) == 3
+        assert next_key is None
+    
+    def test_filters_apply_to_seek_query(self, history_service):
+        """Filters should restrict both the page and the total."""
+        ids = self._create(history_service, 4)
+        history_service.complete_transfer(ids[0])
+        history_service.complete_transfer(ids[1])
+        
+        transfers, total, next_key = history_service.list_transfers_keyset(status='completed', per_page=1)
+        more, _, last_key = history_service.list_transfers_keyset(status='completed', after=next_key, per_page=1)
+        
+        assert total == 2
+        assert {transfers[0]['id'], more[0]['id']} == {ids[0], ids[1]}
+        assert last_key is None
+    
+    def test_ascending_order(self, history_service):
+        """order='asc' should seek forward from the cursor."""
+        self._create(history_service, 4)
+        
+        first, _, after = history_service.list_transfers_keyset(per_page=2, order='asc')
+        second, _, _ = history_service.list_transfers_keyset(after=after, per_page=2, order='asc')
+        
+        keys = [(t['created_at'], t['id']) for t in first + second]
+        assert keys == sorted(keys)
@@ -17,6 +17,7 @@ Tests cover:
 
 import base64
 import os
+import stat
 from io import BytesIO
 from unittest.mock import Mock, MagicMock, patch, ANY
 
@@ -162,6 +163,245 @@ class TestSFTPClientReadFile:
             client.read_file("/nonexistent")
 
 
+class TestSFTPClientWriteFile:
+    """Tests for SFTPClient.write_file()."""
+
+    @patch("transferarr.clients.ftp.pysftp")
+    def test_writes_bytes_with_putfo(self, mock_pysftp):
+        from transferarr.clients.ftp import SFTPClient
+
+        mock_conn = MagicMock()
+        mock_pysftp.Connection.return_value = mock_conn
+        written = {}
+        mock_conn.putfo.side_effect = lambda flo, path: written.update({path: flo.read()})
+
+        client = SFTPClient(host="test", username="u", password="p")
+        client.write_file(b"data", "/remote/file.torrent")
+
+        assert written == {"/remote/file.torrent": b"data"}
+
+
+class TestLocalStorageClientFiles:
+    """Tests for LocalStorageClient in-memory file reads and writes."""
+
+    def test_round_trip_creates_target_dir(self, tmp_path):
+        from transferarr.clients.transfer_client import LocalStorageClient
+
+        source = tmp_path / "abc.torrent"
+        source.write_bytes(b"torrent-bytes")
+        target = tmp_path / "new-dir" / "abc.torrent"
+        client = LocalStorageClient()
+
+        assert client.write_target_file(client.read_source_file(str(source)), str(target)) is True
+        assert target.read_bytes() == b"torrent-bytes"
+
+    def test_upload_copies_tree_and_counts_files(self, tmp_path):
+        from transferarr.clients.transfer_client import LocalStorageClient
+
+        source = tmp_path / "src" / "Movie"
+        (source / "Subs").mkdir(parents=True)
+        (source / "a.mkv").write_bytes(b"video")
+        (source / "Subs" / "en.srt").write_bytes(b"subs")
+        torrent = Torrent(name="Movie", id="abc123")
+
+        assert LocalStorageClient().upload(str(source), str(tmp_path / "dst"), torrent) is True
+
+        assert torrent.total_files == 2
+        assert torrent.current_file_count == 2
+        assert (tmp_path / "dst" / "Movie" / "a.mkv").read_bytes() == b"video"
+        assert (tmp_path / "dst" / "Movie" / "Subs" / "en.srt").read_bytes() == b"subs"
+
+
+class TestSFTPClientSession:
+    """Tests for SFTPClient.session() connection reuse."""
+
+    @patch("transferarr.clients.ftp.pysftp")
+    def test_calls_inside_session_share_one_connection(self, mock_pysftp):
+        """Operations inside a session reuse its connection and close it once at the end."""
+        from transferarr.clients.ftp import SFTPClient
+
+        client = SFTPClient(host="test", username="u", password="p")
+        mock_pysftp.Connection.reset_mock()
+        conn = mock_pysftp.Connection.return_value
+        conn.reset_mock()
+
+        with client.session():
+            client.read_file("/a")
+            client.list_dir("/b")
+            client.normalize("/c")
+            assert conn.close.call_count == 0
+
+        assert mock_pysftp.Connection.call_count == 1
+        assert conn.close.call_count == 1
+
+    @patch("transferarr.clients.ftp.pysftp")
+    def test_nested_sessions_close_on_outermost_exit(self, mock_pysftp):
+        from transferarr.clients.ftp import SFTPClient
+
+        client = SFTPClient(host="test", username="u", password="p")
+        conn = mock_pysftp.Connection.return_value
+        conn.reset_mock()
+
+        with client.session():
+            with client.session():
+                pass
+            assert conn.close.call_count == 0
+
+        assert conn.close.call_count == 1
+
+    @patch("transferarr.clients.ftp.pysftp")
+    def test_connection_transport_tuned(self, mock_pysftp):
+        """Each new connection widens the SSH window and enables keepalives."""
+        from transferarr.clients.ftp import SFTP_KEEPALIVE_SECONDS, SFTP_WINDOW_SIZE, SFTPClient
+
+        SFTPClient(host="test", username="u", password="p")
+
+        transport = mock_pysftp.Connection.return_value._transport
+        assert transport.default_window_size == SFTP_WINDOW_SIZE
+        transport.set_keepalive.assert_called_with(SFTP_KEEPALIVE_SECONDS)
+
+    @patch("transferarr.clients.ftp.pysftp")
+    def test_calls_outside_session_reconnect(self, mock_pysftp):
+        from transferarr.clients.ftp import SFTPClient
+
+        client = SFTPClient(host="test", username="u", password="p")
+        mock_pysftp.Connection.reset_mock()
+
+        client.read_file("/a")
+        client.read_file("/b")
+
+        assert mock_pysftp.Connection.call_count == 2
+
+
+class TestSftpCountFiles:
+    """Tests for sftp_count_files listing each directory once."""
+
+    def _attr(self, name, mode):
+        attr = Mock()
+        attr.filename = name
+        attr.st_mode = mode
+        return attr
+
+    def test_counts_tree_with_one_listing_per_directory(self):
+        from transferarr.clients.transfer_client import sftp_count_files
+
+        connection = Mock()
+        connection.stat.return_value = Mock(st_mode=stat.S_IFDIR | 0o755)
+        listings = {
+            "/src/Movie": [
+                self._attr("a.mkv", stat.S_IFREG | 0o644),
+                self._attr("Subs", stat.S_IFDIR | 0o755),
+            ],
+            "/src/Movie/Subs": [
+                self._attr("en.srt", stat.S_IFREG | 0o644),
+                self._attr("fr.srt", stat.S_IFREG | 0o644),
+            ],
+        }
+        connection.listdir_attr.side_effect = listings.__getitem__
+        sftp_client = Mock(connection=connection)
+
+        assert sftp_count_files(sftp_client, "/src/Movie") == 3
+        assert connection.listdir_attr.call_count == 2
+        connection.stat.assert_called_once_with("/src/Movie")
+
+    def test_broken_symlink_skipped(self):
+        from transferarr.clients.transfer_client import sftp_count_files
+
+        connection = Mock()
+        connection.stat.side_effect = [
+            Mock(st_mode=stat.S_IFDIR | 0o755),  # /src/Movie
+            IOError("No such file"),  # dangling.lnk target
+            Mock(st_mode=stat.S_IFREG | 0o644),  # good.lnk target
+        ]
+        connection.listdir_attr.return_value = [
+            self._attr("a.mkv", stat.S_IFREG | 0o644),
+            self._attr("dangling.lnk", stat.S_IFLNK | 0o777),
+            self._attr("good.lnk", stat.S_IFLNK | 0o777),
+        ]
+
+        assert sftp_count_files(Mock(connection=connection), "/src/Movie") == 2
+
+    def test_single_file_and_missing_path(self):
+        from transferarr.clients.transfer_client import sftp_count_files
+
+        connection = Mock()
+        connection.stat.return_value = Mock(st_mode=stat.S_IFREG | 0o644)
+        assert sftp_count_files(Mock(connection=connection), "/src/a.mkv") == 1
+
+        connection.stat.side_effect = IOError("No such file")
+        assert sftp_count_files(Mock(connection=connection), "/src/missing") == 0
+
+
+class TestCopyTorrentSession:
+    """Tests for the single transfer session used by _do_copy_torrent."""
+
+    def _make_file_connection(self, history_service):
+        config = {
+            "transfer_config": {"from": {"type": "local"}, "to": {"type": "local"}},
+            "source_dot_torrent_path": "/state",
+            "source_torrent_download_path": "/src",
+            "destination_dot_torrent_tmp_dir": "/tmp-torrents",
+            "destination_torrent_download_path": "/dst",
+        }
+        return TransferConnection("conn", config, Mock(), Mock(), history_service=history_service)
+
+    def _make_torrent(self):
+        torrent = Torrent(name="Test.Movie.2024", id="abc123")
+        torrent.home_client_info = {"files": [{"path": "Movie/a.mkv"}, {"path": "extra.nfo"}]}
+        torrent._transfer_id = "tid"
+        return torrent
+
+    def test_all_copies_share_one_session(self):
+        connection = self._make_file_connection(Mock())
+        transfer_client = MagicMock()
+        transfer_client.upload.return_value = True
+        transfer_client.get_file_size.return_value = 10
+        transfer_client.read_source_file.return_value = b"d4:infod4:name1:xee"
+        connection.get_transfer_client = Mock(return_value=transfer_client)
+
+        connection._do_copy_torrent(self._make_torrent())
+
+        transfer_client.session.assert_called_once_with()
+        transfer_client.session.return_value.__enter__.assert_called_once()
+        assert transfer_client.upload.call_count == 2  # data paths
+        connection.to_client.add_torrent_file.assert_called_once()
+        connection.shutdown()
+
+    def test_dot_torrent_read_once_and_reused(self):
+        connection = self._make_file_connection(Mock())
+        transfer_client = MagicMock()
+        transfer_client.upload.return_value = True
+        transfer_client.get_file_size.return_value = 10
+        transfer_client.read_source_file.return_value = b"d4:infod4:name1:xee"
+        connection.get_transfer_client = Mock(return_value=transfer_client)
+
+        connection._do_copy_torrent(self._make_torrent())
+
+        transfer_client.read_source_file.assert_called_once_with("/state/abc123.torrent")
+        transfer_client.write_target_file.assert_called_once_with(
+            b"d4:infod4:name1:xee", "/tmp-torrents/abc123.torrent"
+        )
+        connection.to_client.add_torrent_file.assert_called_once_with(
+            "/tmp-torrents/abc123.torrent", base64.b64encode(b"d4:infod4:name1:xee"), {}
+        )
+        connection.shutdown()
+
+    def test_session_failure_fails_transfer(self):
+        history_service = Mock()
+        connection = self._make_file_connection(history_service)
+        transfer_client = MagicMock()
+        transfer_client.session.return_value.__enter__.side_effect = OSError("refused")
+        connection.get_transfer_client = Mock(return_value=transfer_client)
+        torrent = self._make_torrent()
+
+        connection._do_copy_torrent(torrent)
+
+        assert torrent.state == TorrentState.ERROR
+        history_service.fail_transfer.assert_called_once_with("tid", "Transfer connection failed: refused")
+        transfer_client.upload.assert_not_called()
+        connection.shutdown()
+
+
 # ══════════════════════════════════════════════════════════════════════
 # _sftp_client_params() helper
 # ══════════════════════════════════════════════════════════════════════
@@ -743,6 +983,20 @@ class TestPasswordMaskingSource:
         assert result["from"]["sftp"]["password"] == "***"
         assert result["to"]["sftp"]["password"] == "***"
 
+    def test_only_masked_path_is_copied(self):
+        """Sections without passwords are shared; masked ones are fresh copies."""
+        from transferarr.web.services.connection_service import _mask_sftp_passwords
+
+        config = {
+            "from": {"type": "sftp", "sftp": {"host": "h", "password": "s1"}},
+            "to": {"type": "local"},
+        }
+        result = _mask_sftp_passwords(config)
+
+        assert result["to"] is config["to"]
+        assert result["from"] is not config["from"]
+        assert config["from"]["sftp"]["password"] == "s1"
+
 
 class TestPasswordPreservationSource:
     """Tests for _preserve_sftp_passwords with source.sftp."""
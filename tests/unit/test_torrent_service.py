@@ -5,6 +5,7 @@ import threading
 import time
 from unittest.mock import Mock, mock_open, patch
 
+from transferarr.clients.download_client import DownloadClientBase
 from transferarr.models import TorrentList
 from transferarr.models.torrent import Torrent, TorrentState
 from transferarr.services.torrent_service import TorrentManager
@@ -394,6 +395,80 @@ class TestUpdateTorrentsTransferFailed:
         mock_client.get_torrent_state.assert_not_called()
 
 
+class TestUpdateTorrentsTransferTorrents:
+    """Tests for dropping transfer torrents picked up by a media manager."""
+
+    def _make_manager(self, torrents, download_clients=None):
+        manager = Mock(spec=TorrentManager)
+        manager.torrents = TorrentList(torrents)
+        manager.download_clients = download_clients or {}
+        manager.connections = {}
+        manager.torrent_transfer_handler = None
+        manager.update_torrents = TorrentManager.update_torrents.__get__(manager)
+        return manager
+
+    def test_transfer_torrent_removed_without_client_lookup(self):
+        original = _make_torrent(state=TorrentState.TRANSFER_FAILED, transfer_hash="ab" * 20)
+        picked_up = Torrent(name="Transfer.Copy", id=("AB" * 20))
+        picked_up.state = TorrentState.MANAGER_QUEUED
+        client = Mock()
+        manager = self._make_manager([original, picked_up], download_clients={"c": client})
+
+        manager.update_torrents()
+
+        assert list(manager.torrents) == [original]
+        client.has_torrent.assert_not_called()
+
+    def test_other_owner_found_when_first_owner_is_self(self):
+        picked_up = Torrent(name="Transfer.Copy", id="ab" * 20)
+        picked_up.state = TorrentState.MANAGER_QUEUED
+        picked_up.transfer = {"hash": "ab" * 20}
+        original = _make_torrent(state=TorrentState.TRANSFER_FAILED, transfer_hash="ab" * 20)
+        manager = self._make_manager([picked_up, original])
+
+        manager.update_torrents()
+
+        assert list(manager.torrents) == [original]
+
+    def test_hash_assigned_earlier_in_pass_detected(self):
+        unrelated = Torrent(name="Other", id="cd" * 20)
+        unrelated.state = TorrentState.MANAGER_QUEUED
+        creating = _make_torrent(state=TorrentState.TORRENT_CREATING, transfer_hash=None)
+        creating.home_client = Mock()
+        creating.home_client.name = "source"
+        creating.target_client = Mock()
+        creating.target_client.name = "target"
+        picked_up = Torrent(name="Transfer.Copy", id="ef" * 20)
+        picked_up.state = TorrentState.MANAGER_QUEUED
+        manager = self._make_manager([unrelated, creating, picked_up])
+        connection = Mock()
+        connection.from_client = creating.home_client
+        connection.to_client = creating.target_client
+        manager.connections = {"conn": connection}
+        manager.torrent_transfer_handler = Mock()
+        manager.torrent_transfer_handler.handle_creating.side_effect = (
+            lambda torrent, conn: torrent.transfer.update(hash="EF" * 20)
+        )
+
+        manager.update_torrents()
+
+        assert picked_up not in list(manager.torrents)
+        assert creating in list(manager.torrents)
+
+    def test_unrelated_torrent_still_looked_up(self):
+        original = _make_torrent(state=TorrentState.TRANSFER_FAILED, transfer_hash="ab" * 20)
+        other = Torrent(name="Other", id="cd" * 20)
+        other.state = TorrentState.MANAGER_QUEUED
+        client = Mock()
+        client.has_torrent.return_value = False
+        manager = self._make_manager([original, other], download_clients={"c": client})
+
+        manager.update_torrents()
+
+        client.has_torrent.assert_called_once_with(other)
+        assert other.not_found_attempts == 1
+
+
 # ──────────────────────────────────────────────────
 # Test _should_delete_cross_seeds
 # ──────────────────────────────────────────────────
@@ -514,6 +589,10 @@ class TestSourceCrossSeedRemoval:
         client.name = "source-deluge"
         client.get_all_torrents_status.return_value = all_data
         client.delete_cross_seeds = True
+        # Default batch removal: one remove_torrent call per hash
+        client.remove_torrents.side_effect = (
+            lambda ids, remove_data=True: DownloadClientBase.remove_torrents(client, ids, remove_data)
+        )
         torrent.set_home_client(client)
         return torrent, client, all_data
 
@@ -644,6 +723,20 @@ class TestSourceCrossSeedRemoval:
         # Both removal attempts were made
         assert client.remove_torrent.call_count == 2
 
+    def test_batch_removal_error_logged_as_removal_failure(self, caplog):
+        """An error raised by remove_torrents is not reported as a query failure."""
+        torrent, client, _ = self._make_torrent_with_siblings(
+            sibling_hashes=["hash_sib1"],
+        )
+        client.remove_torrents.side_effect = ConnectionError("Not connected")
+
+        manager = self._make_manager()
+        with caplog.at_level("WARNING", logger="transferarr"):
+            manager._remove_source_cross_seeds(torrent)
+
+        assert "Failed to remove 1 cross-seed sibling(s)" in caplog.text
+        assert "Failed to query" not in caplog.text
+
     def test_none_all_torrents_does_not_crash(self):
         """get_all_torrents_status returning None doesn't crash."""
         torrent = Torrent(name="Test", id="hash1", delete_source_cross_seeds=True)
@@ -1221,4 +1314,37 @@ class TestTrackedTorrentMutationHelpers:
         assert result == "ok"
         assert state_name is None
         assert len(manager.torrents) == 0
-        manager.request_save.assert_called_once()
\ No newline at end of file
+        manager.request_save.assert_called_once()
+
+class TestSaveConfig:
+    """Tests for TorrentManager.save_config."""
+
+    def _make_manager(self, config_file):
+        manager = Mock(spec=TorrentManager)
+        manager.config_file = str(config_file)
+        manager.save_config = TorrentManager.save_config.__get__(manager)
+        return manager
+
+    def test_replaces_file_and_keeps_mode(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"old": true}')
+        config_file.chmod(0o640)
+        manager = self._make_manager(config_file)
+
+        assert manager.save_config({"new": True}) is True
+
+        assert json.loads(config_file.read_text()) == {"new": True}
+        assert config_file.stat().st_mode & 0o777 == 0o640
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+        manager.bump_config_version.assert_called_once()
+
+    def test_failed_write_keeps_previous_file(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"old": true}')
+        manager = self._make_manager(config_file)
+
+        assert manager.save_config({"bad": object()}) is False
+
+        assert json.loads(config_file.read_text()) == {"old": True}
+        assert [p.name for p in tmp_path.iterdir()] == ["config.json"]
+        manager.bump_config_version.assert_not_called()
@@ -15,7 +15,9 @@ from transferarr.services.transfer_connection import (
     DEFAULT_TRANSFER_TYPE,
 )
 from transferarr.utils import (
+    decode_bytes,
     generate_transfer_id,
+    get_paths_to_copy,
     build_transfer_torrent_name,
     parse_magnet_uri,
     build_magnet_uri,
@@ -52,6 +54,13 @@ class TestTorrentStateEnum:
         torrent = Torrent(name="Test", id="abc", state=TorrentState.TORRENT_CREATE_QUEUE)
         assert torrent._is_torrent_transfer_state is True
 
+    def test_only_torrent_states_are_torrent_transfer_states(self):
+        """Exactly the TORRENT_* states (and not None) count as torrent transfer states."""
+        for state in list(TorrentState) + [None]:
+            torrent = Torrent(name="Test", id="abc", state=state)
+            expected = state is not None and state.name.startswith("TORRENT_")
+            assert torrent._is_torrent_transfer_state is expected
+
 
 # --- Test Torrent model transfer serialization ---
 
@@ -435,6 +444,54 @@ class TestBuildMagnetUri:
         assert "abc123def456abc123def456abc123def4567890ab" in magnet
 
 
+class TestDecodeBytes:
+    """Tests for decode_bytes function."""
+
+    def test_nested_structure(self):
+        raw = {
+            b"abc": {b"name": b"Movie", b"progress": 50.5, b"files": [{b"path": b"a.mkv", b"size": 1}]},
+            b"def": {b"state": b"Seeding", b"paused": False, b"label": None, b"peers": (b"1.2.3.4", 6881)},
+        }
+
+        assert decode_bytes(raw) == {
+            "abc": {"name": "Movie", "progress": 50.5, "files": [{"path": "a.mkv", "size": 1}]},
+            "def": {"state": "Seeding", "paused": False, "label": None, "peers": ("1.2.3.4", 6881)},
+        }
+
+    def test_scalars_unchanged(self):
+        for value in ("text", 1, 1.5, True, None):
+            assert decode_bytes(value) is value
+
+    def test_tuple_keys_decoded(self):
+        assert decode_bytes({(b"a", 1): b"x"}) == {("a", 1): "x"}
+
+    def test_subclasses_decoded(self):
+        from collections import OrderedDict, namedtuple
+
+        Pair = namedtuple("Pair", "first second")
+
+        assert decode_bytes(OrderedDict([(b"k", b"v")])) == {"k": "v"}
+        assert decode_bytes(Pair(b"a", b"b")) == ("a", "b")
+
+    def test_unknown_objects_unchanged(self):
+        marker = object()
+        assert decode_bytes([marker]) == [marker]
+
+
+class TestGetPathsToCopy:
+    """Tests for get_paths_to_copy function."""
+
+    def test_returns_distinct_top_level_paths(self):
+        torrent = Mock()
+        torrent.home_client_info = {"files": [
+            {"path": "Movie/movie.mkv"},
+            {"path": "Movie/Subs/en.srt"},
+            {"path": "extra.nfo"},
+        ]}
+
+        assert get_paths_to_copy(torrent) == {"Movie", "extra.nfo"}
+
+
 class TestGenerateTransferId:
     """Tests for generate_transfer_id function."""
     
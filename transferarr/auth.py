@@ -3,6 +3,8 @@ import json
 import os
 import secrets
 import string
+import threading
+import time
 
 import bcrypt
 from flask_login import UserMixin
@@ -11,6 +13,28 @@ from flask_login import UserMixin
 API_KEY_PREFIX = "tr_"
 API_KEY_LENGTH = 32  # Length of random part (not including prefix)
 
+# bcrypt cost factor bounds. Each extra round doubles hashing time; the
+# floor keeps hashes at or above OWASP's minimum work factor of 10.
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 12
+# Range of costs bcrypt itself accepts, allowed for auth.bcrypt_rounds
+BCRYPT_CONFIG_ROUNDS_RANGE = (4, 31)
+# Target time for one hash/verify, keeping interactive logins responsive
+BCRYPT_TARGET_SECONDS = 0.4
+
+# Cost factor used for new hashes (see configure_password_hashing)
+_bcrypt_rounds = BCRYPT_MAX_ROUNDS
+# Calibration result, measured once per process
+_calibrated_rounds = None
+
+# Login attempts allowed per client before throttling, refilled over the window
+LOGIN_ATTEMPTS_BURST = 5
+LOGIN_ATTEMPTS_WINDOW_SECONDS = 60.0
+
+# Bumped whenever save_auth_config changes auth settings, so callers that
+# cache derived auth state know to recompute it
+_auth_config_version = 0
+
 
 class User(UserMixin):
     """Simple user model for single-user authentication."""
@@ -20,9 +44,15 @@ class User(UserMixin):
         self.username = username
 
 
-def hash_password(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+def hash_password(password: str, rounds: int = None) -> str:
+    """Hash a password using bcrypt.
+
+    Args:
+        password: Plain text password
+        rounds: bcrypt cost factor (defaults to the configured cost)
+    """
+    salt = bcrypt.gensalt(rounds or _bcrypt_rounds)
+    return bcrypt.hashpw(password.encode("utf-8"), salt).decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
@@ -32,6 +62,134 @@ def verify_password(password: str, password_hash: str) -> bool:
     return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
 
 
+def verify_credentials(config: dict, username: str, password: str) -> bool:
+    """Check a login attempt against the configured username and password.
+
+    The username is compared in constant time and the password hash is
+    always checked, so response timing reveals neither which part was
+    wrong nor how much of the username matched.
+    """
+    auth = get_auth_config(config)
+    stored_username = auth["username"] or ""
+    username_ok = secrets.compare_digest(
+        (username or "").encode("utf-8"), stored_username.encode("utf-8")
+    )
+    password_ok = verify_password(password, auth["password_hash"])
+    return username_ok and password_ok
+
+
+def calibrate_bcrypt_rounds(target_seconds: float = BCRYPT_TARGET_SECONDS) -> int:
+    """Pick the highest bcrypt cost whose hash time stays within target_seconds.
+
+    Times a single hash at BCRYPT_MIN_ROUNDS and extrapolates upwards, since
+    each extra round doubles the work. Never returns less than the minimum
+    or more than BCRYPT_MAX_ROUNDS.
+    """
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(BCRYPT_MIN_ROUNDS))
+    elapsed = time.perf_counter() - start
+
+    rounds = BCRYPT_MIN_ROUNDS
+    while rounds < BCRYPT_MAX_ROUNDS and elapsed * 2 <= target_seconds:
+        rounds += 1
+        elapsed *= 2
+    return rounds
+
+
+def configure_password_hashing(config: dict) -> int:
+    """Set the bcrypt cost used for new password hashes.
+
+    Uses auth.bcrypt_rounds from the config when set, otherwise calibrates
+    against this machine once per process so hashing and logging in stay
+    around BCRYPT_TARGET_SECONDS.
+
+    Returns:
+        The cost factor in effect
+
+    Raises:
+        ValueError: auth.bcrypt_rounds is not an integer bcrypt accepts
+    """
+    global _bcrypt_rounds, _calibrated_rounds
+
+    rounds = config.get("auth", {}).get("bcrypt_rounds")
+    if rounds is None:
+        if _calibrated_rounds is None:
+            _calibrated_rounds = calibrate_bcrypt_rounds()
+        rounds = _calibrated_rounds
+    else:
+        low, high = BCRYPT_CONFIG_ROUNDS_RANGE
+        if isinstance(rounds, bool) or not isinstance(rounds, int) or not low <= rounds <= high:
+            raise ValueError(
+                f"auth.bcrypt_rounds must be an integer between {low} and {high}, got {rounds!r}"
+            )
+    _bcrypt_rounds = rounds
+    return _bcrypt_rounds
+
+
+def get_hash_rounds(password_hash: str):
+    """Get the cost factor stored in a bcrypt hash ("$2b$<rounds>$..."), or None."""
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """Check if a hash is weaker than the configured cost.
+
+    Such hashes are upgraded after the next successful login. Costlier
+    hashes are left alone so stored credentials are never weakened.
+    """
+    rounds = get_hash_rounds(password_hash)
+    return rounds is not None and rounds < _bcrypt_rounds
+
+
+class LoginRateLimiter:
+    """Per-client token bucket guarding password verification.
+
+    Each client starts with ``burst`` attempts, refilled at ``burst`` per
+    ``window_seconds``, so no single address can drive bcrypt work faster
+    than that rate. Thread-safe; full buckets are dropped to bound memory.
+    """
+
+    # Prune idle (full) buckets once this many clients are tracked
+    PRUNE_THRESHOLD = 1024
+
+    def __init__(self, burst: int = LOGIN_ATTEMPTS_BURST,
+                 window_seconds: float = LOGIN_ATTEMPTS_WINDOW_SECONDS,
+                 clock=time.monotonic):
+        self.burst = burst
+        self.rate = burst / window_seconds
+        self._clock = clock
+        self._buckets = {}  # key -> (tokens, last refill time)
+        self._lock = threading.Lock()
+
+    def _tokens(self, key, now: float) -> float:
+        tokens, last = self._buckets.get(key, (self.burst, now))
+        return min(self.burst, tokens + (now - last) * self.rate)
+
+    def allow(self, key) -> bool:
+        """Consume one attempt for ``key``; False if none are left."""
+        with self._lock:
+            now = self._clock()
+            if len(self._buckets) >= self.PRUNE_THRESHOLD:
+                self._buckets = {
+                    k: v for k, v in self._buckets.items()
+                    if self._tokens(k, now) < self.burst
+                }
+            tokens = self._tokens(key, now)
+            if tokens < 1:
+                self._buckets[key] = (tokens, now)
+                return False
+            self._buckets[key] = (tokens - 1, now)
+            return True
+
+    def reset(self, key) -> None:
+        """Give ``key`` its full allowance back (e.g. after a successful login)."""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+
 def get_auth_config(config: dict) -> dict:
     """Get auth configuration with defaults."""
     auth = config.get("auth", {})
@@ -66,6 +224,26 @@ def is_auth_configured(config: dict) -> bool:
     return auth.get("password_hash") is not None
 
 
+def get_auth_state(config: dict) -> tuple:
+    """Get (configured, enabled) from a single read of the auth section.
+
+    Equivalent to (is_auth_configured(config), is_auth_enabled(config)).
+    """
+    auth = config.get("auth", {})
+    has_hash = auth.get("password_hash") is not None
+    enabled = auth.get("enabled", False)
+    if "enabled" not in auth:
+        configured = False  # Never configured
+    else:
+        configured = enabled is False or has_hash
+    return configured, enabled and has_hash
+
+
+def get_auth_config_version() -> int:
+    """Get the auth settings version (changes on every save_auth_config)."""
+    return _auth_config_version
+
+
 def save_auth_config(config: dict, auth_settings: dict) -> None:
     """Save auth configuration to config.json.
 
@@ -73,10 +251,13 @@ def save_auth_config(config: dict, auth_settings: dict) -> None:
         config: The current config dict (will be updated in-place)
         auth_settings: Dict with auth settings to save
     """
+    global _auth_config_version
+
     # Update config in memory
     if "auth" not in config:
         config["auth"] = {}
     config["auth"].update(auth_settings)
+    _auth_config_version += 1
 
     # Save to file
     config_path = config.get("_config_path")  # Set by load_config()
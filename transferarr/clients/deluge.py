@@ -13,6 +13,11 @@ from transferarr.clients.registry import register_client
 logger = logging.getLogger(__name__)
 
 
+def _is_missing_torrent_error(error) -> bool:
+    """Whether a deluge removal error means the torrent is already gone."""
+    return type(error).__name__ == "InvalidTorrentError" or "not in session" in str(error)
+
+
 @register_client("deluge")
 class DelugeClient(DownloadClientBase):
     """Deluge download client implementation.
@@ -27,6 +32,8 @@ class DelugeClient(DownloadClientBase):
         session: requests.Session for web API calls (Web mode only)
     """
     
+    API_FIELDS = DownloadClientBase.API_FIELDS + ("connection_type",)
+    
     def __init__(self, config: ClientConfig):
         """Initialize Deluge client.
         
@@ -91,6 +98,18 @@ class DelugeClient(DownloadClientBase):
             if not handle_exception:
                 raise ValueError(f"Unsupported connection type: {self.connection_type}")
 
+    def _decode_rpc(self, result):
+        """Return an RPC result with bytes decoded to str.
+        
+        The RPC client is created with decode_utf8=True, so rencode already
+        decodes every string while parsing the reply and walking the result
+        again would only copy it. decode_bytes is kept for clients that
+        return raw bytes.
+        """
+        if getattr(self.rpc_client, "decode_utf8", False) is True:
+            return result
+        return decode_bytes(result)
+
     def ensure_connected(self):
         """Ensure rpc_client is connected, reconnect if needed"""
         with self._lock:
@@ -138,7 +157,7 @@ class DelugeClient(DownloadClientBase):
                 plugins = result.get("result", [])
             else:
                 plugins = self.rpc_client.core.get_enabled_plugins()
-                plugins = decode_bytes(plugins) if plugins else []
+                plugins = self._decode_rpc(plugins) if plugins else []
             
             if "Label" not in plugins:
                 logger.debug(f"Label plugin not enabled on {self.name}, skipping label")
@@ -150,7 +169,7 @@ class DelugeClient(DownloadClientBase):
                 labels = result.get("result", [])
             else:
                 labels = self.rpc_client.call("label.get_labels")
-                labels = decode_bytes(labels) if labels else []
+                labels = self._decode_rpc(labels) if labels else []
             
             if label not in labels:
                 logger.debug(f"Creating label '{label}' on {self.name}")
@@ -237,7 +256,7 @@ class DelugeClient(DownloadClientBase):
                         return False
                     current_torrents = result['result']['torrents']
                 else:
-                    current_torrents = decode_bytes(self.rpc_client.core.get_torrents_status({}, ['name']))
+                    current_torrents = self._decode_rpc(self.rpc_client.core.get_torrents_status({}, ['name']))
                     if current_torrents is None:
                         return False
                 for key in current_torrents:
@@ -272,7 +291,7 @@ class DelugeClient(DownloadClientBase):
                         return old_info
                     current_torrents = result['result']['torrents']
                 else:
-                    current_torrents = decode_bytes(
+                    current_torrents = self._decode_rpc(
                         self.rpc_client.core.get_torrents_status({}, [
                             'name', 'state', 'files', 'progress', 'total_size', 'save_path'
                             ]))
@@ -342,6 +361,60 @@ class DelugeClient(DownloadClientBase):
                 logger.error(f"Error removing torrent {torrent_id} from {self.name}: {e}")
                 raise
 
+    def remove_torrents(self, torrent_ids, remove_data=True):
+        """Remove several torrents with a single core.remove_torrents call.
+        
+        Falls back to one remove_torrent call per torrent if the batch
+        call fails (e.g. on daemons without it).
+        
+        Returns:
+            Dict mapping each torrent_id that could not be removed to an error message
+        """
+        torrent_ids = list(torrent_ids)
+        if not torrent_ids:
+            return {}
+        try:
+            with self._lock:
+                if not self.ensure_connected():
+                    raise ConnectionError(f"Not connected to {self.name} deluge")
+                logger.debug(f"Removing {len(torrent_ids)} torrents from {self.name}")
+                if self.connection_type == "web":
+                    response = self._send_web_request(
+                        "core.remove_torrents",
+                        [torrent_ids, remove_data],
+                        id=3
+                    )
+                    if response.get("error"):
+                        raise Exception(response["error"])
+                    failures = response.get("result") or []
+                else:
+                    failures = self._decode_rpc(
+                        self.rpc_client.core.remove_torrents(torrent_ids, remove_data)
+                    ) or []
+        except ConnectionError:
+            raise
+        except Exception as e:
+            logger.debug(f"Batch removal failed on {self.name}, removing one at a time: {e}")
+            return self._remove_torrents_one_by_one(torrent_ids, remove_data)
+        return {torrent_id: str(error) for torrent_id, error in failures}
+
+    def _remove_torrents_one_by_one(self, torrent_ids, remove_data):
+        """Remove torrents individually after a failed batch call.
+        
+        The batch call may have removed some torrents before failing, so
+        torrents deluge no longer knows about count as removed.
+        """
+        errors = {}
+        for torrent_id in torrent_ids:
+            try:
+                self.remove_torrent(torrent_id, remove_data=remove_data)
+            except Exception as e:
+                if _is_missing_torrent_error(e):
+                    logger.debug(f"Torrent {torrent_id} already removed from {self.name}")
+                    continue
+                errors[torrent_id] = str(e)
+        return errors
+
     def get_all_torrents_status(self):
         """
         Safely get and decode status of all torrents.
@@ -381,7 +454,7 @@ class DelugeClient(DownloadClientBase):
                             return result['result']
                         else:
                             result = self.rpc_client.core.get_torrents_status({}, fields)
-                            return decode_bytes(result) or {}
+                            return self._decode_rpc(result) or {}
                     except Exception as e:
                         retry_count += 1
                         if retry_count >= max_retries:
@@ -418,7 +491,7 @@ class DelugeClient(DownloadClientBase):
                     return result.get("result", "")
                 else:
                     result = self.rpc_client.core.get_config_value("download_location")
-                    return decode_bytes(result) if result else ""
+                    return self._decode_rpc(result) if result else ""
             except Exception as e:
                 logger.error(f"Error getting default download path from {self.name}: {e}")
                 raise
@@ -457,7 +530,7 @@ class DelugeClient(DownloadClientBase):
                     }
                 else:
                     status = self.rpc_client.core.get_torrent_status(torrent_hash, fields)
-                    status = decode_bytes(status)
+                    status = self._decode_rpc(status)
                     if not status:
                         raise Exception(f"Torrent {torrent_hash} not found")
                     return {
@@ -542,7 +615,7 @@ class DelugeClient(DownloadClientBase):
                         return False
                     current_torrents = result['result']['torrents']
                 else:
-                    current_torrents = decode_bytes(
+                    current_torrents = self._decode_rpc(
                         self.rpc_client.core.get_torrents_status({}, fields)
                     )
                     if current_torrents is None:
@@ -785,7 +858,7 @@ class DelugeClient(DownloadClientBase):
                 )
                 torrents = result.get('result', {}).get('torrents', {})
             else:
-                torrents = decode_bytes(
+                torrents = self._decode_rpc(
                     self.rpc_client.core.get_torrents_status({}, ['name', 'trackers'])
                 )
         
@@ -841,7 +914,7 @@ class DelugeClient(DownloadClientBase):
                     )
                     status = result.get('result', {})
                 else:
-                    status = decode_bytes(
+                    status = self._decode_rpc(
                         self.rpc_client.core.get_torrent_status(torrent_hash, fields)
                     )
                 
@@ -32,6 +32,10 @@ class DownloadClientBase(ABC):
         _lock: Thread lock for connection safety
     """
     
+    # Attributes returned by the client API (alongside a masked password);
+    # subclasses extend this with their own settings
+    API_FIELDS = ("name", "type", "host", "port", "username", "delete_cross_seeds")
+    
     def __init__(self, config: ClientConfig):
         """Initialize the base download client.
         
@@ -136,6 +140,27 @@ class DownloadClientBase(ABC):
         """
         pass
     
+    def remove_torrents(self, torrent_ids: list, remove_data: bool = True) -> dict:
+        """Remove several torrents from the client.
+        
+        Removes them one at a time; clients with a batch removal call
+        should override this.
+        
+        Args:
+            torrent_ids: Torrent identifiers (usually info hashes)
+            remove_data: Whether to also delete downloaded data
+            
+        Returns:
+            Dict mapping each torrent_id that could not be removed to an error message
+        """
+        errors = {}
+        for torrent_id in torrent_ids:
+            try:
+                self.remove_torrent(torrent_id, remove_data=remove_data)
+            except Exception as e:
+                errors[torrent_id] = str(e)
+        return errors
+    
     @abstractmethod
     def get_all_torrents_status(self) -> dict:
         """Get status of all torrents on this client.
@@ -2,12 +2,19 @@ import os
 import logging
 import traceback
 import stat
+from contextlib import contextmanager
 from tqdm import tqdm
 from paramiko import SSHConfig
 import pysftp
 
 logger = logging.getLogger(__name__)
 
+# SSH channel window for SFTP sessions (paramiko defaults to 2 MiB); a larger
+# window keeps more pipelined data in flight on high-latency links
+SFTP_WINDOW_SIZE = 4 * 1024 * 1024
+# Keep long-lived sessions from being dropped by idle NAT/firewall timeouts
+SFTP_KEEPALIVE_SECONDS = 30
+
 class SFTPClient():
     def __init__(self, host=None, port=22, username=None, password=None, private_key=None, ssh_config_host=None, ssh_config_file='~/.ssh/config'):
         """
@@ -18,6 +25,8 @@ class SFTPClient():
         cnopts = pysftp.CnOpts()
         cnopts.hostkeys = None
 
+        # Nesting depth of session() blocks; while > 0 the open connection is reused
+        self._session_depth = 0
         self.host = host
         self.port = port
         
@@ -54,7 +63,34 @@ class SFTPClient():
         self.close()
 
     def open_connection(self):
+        if self._session_depth:
+            return  # Reuse the session's connection
         self.connection = pysftp.Connection(**self.connection_args)
+        self._tune_transport()
+
+    def _tune_transport(self):
+        """Widen the SSH window before pysftp lazily opens the SFTP channel."""
+        transport = getattr(self.connection, '_transport', None)
+        if transport is None:
+            return
+        transport.default_window_size = SFTP_WINDOW_SIZE
+        transport.set_keepalive(SFTP_KEEPALIVE_SECONDS)
+
+    @contextmanager
+    def session(self):
+        """Keep a single connection open for every call made inside the block.
+
+        open_connection() and close() become no-ops until the outermost
+        session exits, so a batch of operations pays for one SSH handshake.
+        """
+        self.open_connection()
+        self._session_depth += 1
+        try:
+            yield self
+        finally:
+            self._session_depth -= 1
+            if not self._session_depth:
+                self.close()
     
     def upload_file(self, local_path, remote_path):
         """Upload single file with progress bar"""
@@ -99,9 +135,11 @@ class SFTPClient():
             traceback.print_exc()
             return False
         finally:
-            self.connection.close()
+            self.close()
 
     def close(self):
+        if self._session_depth:
+            return  # Closed when the session ends
         try:
             self.connection.close()
         except Exception as e:
@@ -136,6 +174,20 @@ class SFTPClient():
         finally:
             self.close()
 
+    def write_file(self, data: bytes, remote_path: str) -> None:
+        """Write bytes to a remote file, replacing it if it exists.
+        
+        Args:
+            data: File contents
+            remote_path: Absolute path of the file on the remote server
+        """
+        from io import BytesIO
+        try:
+            self.open_connection()
+            self.connection.putfo(BytesIO(data), remote_path)
+        finally:
+            self.close()
+
     def list_dir(self, path):
         """List directory contents"""
         try:
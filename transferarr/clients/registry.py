@@ -4,7 +4,7 @@ Client registry for download client instantiation.
 Provides a registry pattern for registering and creating download client
 instances by type string.
 """
-from typing import Callable, Dict, List, Type, Union
+from typing import Callable, Dict, List, Optional, Type, Union
 
 from transferarr.clients.download_client import DownloadClientBase
 from transferarr.clients.config import ClientConfig
@@ -26,6 +26,8 @@ class ClientRegistry:
     """
     
     _clients: Dict[str, Type[DownloadClientBase]] = {}
+    # Comma-separated type list for error messages; reset on registration
+    _supported_text: Optional[str] = None
     
     @classmethod
     def register(cls, client_type: str) -> Callable[[Type[DownloadClientBase]], Type[DownloadClientBase]]:
@@ -44,6 +46,7 @@ class ClientRegistry:
         """
         def decorator(client_class: Type[DownloadClientBase]) -> Type[DownloadClientBase]:
             cls._clients[client_type] = client_class
+            cls._supported_text = None
             return client_class
         return decorator
     
@@ -62,7 +65,7 @@ class ClientRegistry:
         """
         client_type = config.client_type
         if client_type not in cls._clients:
-            supported = ", ".join(cls._clients.keys()) or "none"
+            supported = cls.get_supported_types_text() or "none"
             raise ValueError(
                 f"Unknown client type: '{client_type}'. "
                 f"Supported types: {supported}"
@@ -96,6 +99,16 @@ class ClientRegistry:
         """
         return list(cls._clients.keys())
     
+    @classmethod
+    def get_supported_types_text(cls) -> str:
+        """Get the supported client types as a comma-separated string.
+        
+        Built once and reused until another type is registered.
+        """
+        if cls._supported_text is None:
+            cls._supported_text = ", ".join(cls._clients)
+        return cls._supported_text
+    
     @classmethod
     def is_supported(cls, client_type: str) -> bool:
         """Check if a client type is supported.
@@ -1,11 +1,12 @@
 import logging
 import os
 import shutil
+import stat
 import traceback
 import time
 import uuid
-from base64 import b64encode
 from abc import ABC
+from contextlib import ExitStack, nullcontext
 from pathlib import Path
 from transferarr.clients.ftp import SFTPClient
 from transferarr.exceptions import TrasnferClientException
@@ -16,6 +17,13 @@ class TransferClient(ABC):
     def __init__(self):
         pass
 
+    def session(self):
+        """Context manager keeping remote connections open across calls.
+
+        Local clients have nothing to keep open.
+        """
+        return nullcontext(self)
+
 class LocalStorageClient(TransferClient):
     """Transfer client for local-to-local file copying."""
     
@@ -30,12 +38,22 @@ class LocalStorageClient(TransferClient):
         """Check if a file exists locally."""
         return os.path.exists(path)
     
-    def get_dot_torrent_file_dump(self, dot_torrent_file_path):
-        """Read a .torrent file and return base64 encoded contents."""
-        logger.debug(f"Getting .torrent file dump from {dot_torrent_file_path}")
-        with open(str(dot_torrent_file_path), 'rb') as f:
-            data = f.read()
-            return b64encode(data)
+    def read_source_file(self, path):
+        """Read a (small) source file, such as a .torrent, into memory."""
+        logger.debug(f"Reading {path}")
+        with open(str(path), 'rb') as f:
+            return f.read()
+    
+    def write_target_file(self, data, target_path):
+        """Write in-memory file contents to the target. Returns True on success."""
+        try:
+            os.makedirs(os.path.dirname(target_path), exist_ok=True)
+            with open(target_path, 'wb') as f:
+                f.write(data)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write {target_path}: {e}")
+            return False
     
     def count_files(self, source_path):
         """Count the total number of files that need to be copied."""
@@ -72,17 +90,18 @@ class LocalStorageClient(TransferClient):
         """Recursively copy a directory."""
         os.makedirs(target_path, exist_ok=True)
         
-        for item in os.listdir(source_path):
-            source_item = os.path.join(source_path, item)
-            target_item = os.path.join(target_path, item)
-            
-            if os.path.isfile(source_item):
-                shutil.copy2(source_item, target_item)
-                torrent.current_file_count += 1
-                torrent.current_file = item
-                logger.debug(f"Copied ({torrent.current_file_count}/{torrent.total_files}): {item}")
-            else:
-                self._copy_directory(source_item, target_item, torrent)
+        # scandir entries carry their file type, saving a stat per entry
+        with os.scandir(source_path) as entries:
+            for entry in entries:
+                target_item = os.path.join(target_path, entry.name)
+                
+                if entry.is_file():
+                    shutil.copy2(entry.path, target_item)
+                    torrent.current_file_count += 1
+                    torrent.current_file = entry.name
+                    logger.debug(f"Copied ({torrent.current_file_count}/{torrent.total_files}): {entry.name}")
+                else:
+                    self._copy_directory(entry.path, target_item, torrent)
     
     def upload_directory(self, source_dir, destination_dir, torrent):
         """Upload a directory (same as upload for local storage)."""
@@ -101,6 +120,10 @@ class LocalAndSFTPClient(TransferClient):
         except Exception as e:
             raise TrasnferClientException(f"Failed to initialize SFTP client: {e}") from e
 
+    def session(self):
+        """Reuse one SFTP connection for every call inside the block."""
+        return self.sftp_client.session()
+
     def test_connection(self):
         """Test the connection to the SFTP server"""
         try:
@@ -112,20 +135,30 @@ class LocalAndSFTPClient(TransferClient):
         finally:
             self.sftp_client.close()
 
-    def get_dot_torrent_file_dump(self, dot_torrent_file_path):
+    def read_source_file(self, path):
+        """Read a (small) source file, such as a .torrent, into memory."""
         if self.source_type == "local":
-            logger.debug(f"Getting .torrent file dump from {dot_torrent_file_path}")
-
-            with open(str(dot_torrent_file_path), 'rb') as f:
-                data = f.read()
-                return b64encode(data)
-        else:
-            self.sftp_client.open_connection()
-            logger.debug(f"Getting .torrent file dump from {self.sftp_client.host}:{dot_torrent_file_path}")
-            with self.sftp_client.connection.open(str(dot_torrent_file_path), 'rb') as f:
-                data = f.read()
-                self.sftp_client.close()
-                return b64encode(data)
+            logger.debug(f"Reading {path}")
+            with open(str(path), 'rb') as f:
+                return f.read()
+        logger.debug(f"Reading {self.sftp_client.host}:{path}")
+        return self.sftp_client.read_file(str(path))
+    
+    def write_target_file(self, data, target_path):
+        """Write in-memory file contents to the target. Returns True on success."""
+        try:
+            if self.source_type == "local":
+                logger.debug(f"Writing {self.sftp_client.host}:{target_path}")
+                self.sftp_client.write_file(data, target_path)
+            else:
+                logger.debug(f"Writing {target_path}")
+                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                with open(target_path, 'wb') as f:
+                    f.write(data)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write {target_path}: {e}")
+            return False
             
     def count_files(self, source_path):
         """Count the total number of files that need to be copied"""
@@ -176,13 +209,18 @@ class LocalAndSFTPClient(TransferClient):
         except OSError:
             pass  # Directory exists
 
-        dirs = os.listdir(source_path) if self.source_type == "local" else self.sftp_client.connection.listdir(source_path)
+        if self.source_type == "local":
+            with os.scandir(source_path) as entries:
+                items = [(entry.name, entry.is_file()) for entry in entries]
+        else:
+            items = [
+                (item, self.sftp_client.connection.isfile(os.path.join(source_path, item)))
+                for item in self.sftp_client.connection.listdir(source_path)
+            ]
 
-        for item in dirs:
+        for item, is_file in items:
             source_path_tmp = os.path.join(source_path, item)
             target_path_tmp = os.path.join(target_path, item)
-
-            is_file = os.path.isfile(source_path_tmp) if self.source_type == "local" else self.sftp_client.connection.isfile(source_path_tmp)
             
             if is_file:
                 self.upload_file(source_path_tmp, target_path_tmp, torrent)
@@ -277,13 +315,31 @@ class SFTPAndSFTPClient(TransferClient):
         except Exception as e:
             raise TrasnferClientException(f"Failed to initialize target SFTP client: {e}") from e
 
-    def get_dot_torrent_file_dump(self, dot_torrent_file_path):
-        self.source_sftp_client.open_connection()
-        logger.debug(f"Getting .torrent file dump from {self.source_sftp_client.host}:{dot_torrent_file_path}")
-        with self.source_sftp_client.connection.open(str(dot_torrent_file_path), 'rb') as f:
-            data = f.read()
-            self.source_sftp_client.close()
-            return b64encode(data)
+    def session(self):
+        """Reuse one source and one target connection for every call inside the block."""
+        stack = ExitStack()
+        try:
+            stack.enter_context(self.source_sftp_client.session())
+            stack.enter_context(self.target_sftp_client.session())
+        except BaseException:
+            stack.close()
+            raise
+        return stack
+
+    def read_source_file(self, path):
+        """Read a (small) source file, such as a .torrent, into memory."""
+        logger.debug(f"Reading {self.source_sftp_client.host}:{path}")
+        return self.source_sftp_client.read_file(str(path))
+    
+    def write_target_file(self, data, target_path):
+        """Write in-memory file contents to the target. Returns True on success."""
+        try:
+            logger.debug(f"Writing {self.target_sftp_client.host}:{target_path}")
+            self.target_sftp_client.write_file(data, target_path)
+            return True
+        except Exception as e:
+            logger.error(f"Failed to write {target_path}: {e}")
+            return False
 
     def test_connection(self):
         """Test the connection to the source and target SFTP servers"""
@@ -428,19 +484,38 @@ class SFTPAndSFTPClient(TransferClient):
             self.source_sftp_client.close()
 
 def sftp_count_files(sftp_client, original_path):
-    """Count the total number of files that need to be copied"""
+    """Count the total number of files that need to be copied.
+    
+    Each directory is listed once with its attributes, so counting costs one
+    round trip per directory rather than two stat calls per entry.
+    """
     try:
-        file_count = 0
-        
-        def count_recursively(path):
-            nonlocal file_count
-            if sftp_client.connection.isfile(path):
-                file_count += 1
-            elif sftp_client.connection.isdir(path):
-                for item in sftp_client.connection.listdir(path):
-                    count_recursively(os.path.join(path, item))
+        connection = sftp_client.connection
+        try:
+            mode = connection.stat(original_path).st_mode
+        except IOError:
+            return 0
+        if stat.S_ISREG(mode):
+            return 1
+        if not stat.S_ISDIR(mode):
+            return 0
         
-        count_recursively(original_path)
+        file_count = 0
+        pending_dirs = [original_path]
+        while pending_dirs:
+            path = pending_dirs.pop()
+            for attr in connection.listdir_attr(path):
+                mode = attr.st_mode
+                if stat.S_ISLNK(mode):
+                    # listdir_attr doesn't follow links; stat the target
+                    try:
+                        mode = connection.stat(os.path.join(path, attr.filename)).st_mode
+                    except (IOError, OSError):
+                        continue  # Broken link: neither a file nor a directory
+                if stat.S_ISREG(mode):
+                    file_count += 1
+                elif stat.S_ISDIR(mode):
+                    pending_dirs.append(os.path.join(path, attr.filename))
         return file_count
     except Exception as e:
         logger.error(f"Error counting files: {e}")
@@ -448,17 +523,21 @@ def sftp_count_files(sftp_client, original_path):
     
 def local_count_files(original_path):
     try:
-        file_count = 0
+        if os.path.isfile(original_path):
+            return 1
+        if not os.path.isdir(original_path):
+            return 0
         
-        def count_recursively(path):
-            nonlocal file_count
-            if os.path.isfile(path):
-                file_count += 1
-            elif os.path.isdir(path):
-                for item in os.listdir(path):
-                    count_recursively(os.path.join(path, item))
-        
-        count_recursively(original_path)
+        # scandir entries carry their file type, saving a stat per entry
+        file_count = 0
+        pending_dirs = [original_path]
+        while pending_dirs:
+            with os.scandir(pending_dirs.pop()) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        file_count += 1
+                    elif entry.is_dir():
+                        pending_dirs.append(entry.path)
         return file_count
     except Exception as e:
         logger.error(f"Error counting files: {e}")
@@ -31,6 +31,11 @@ class TorrentState(Enum):
     TORRENT_SEEDING = 33
     TRANSFER_FAILED = 34  # Failed after max retries, requires user action
 
+# States in which progress, size and speed come from the torrent-based transfer
+TORRENT_TRANSFER_STATES = frozenset(
+    state for state in TorrentState if state.name.startswith("TORRENT_")
+)
+
 class Torrent:
     _state = None
     save_callback = None
@@ -89,7 +94,7 @@ class Torrent:
     @property
     def _is_torrent_transfer_state(self) -> bool:
         """Whether the torrent is currently in a torrent-based transfer state."""
-        return self.state is not None and self.state.name.startswith("TORRENT_")
+        return self._state in TORRENT_TRANSFER_STATES
 
     @property
     def media_manager_type(self):
@@ -5,9 +5,9 @@ import sqlite3
 import threading
 import time
 import uuid
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 logger = logging.getLogger("transferarr")
 
@@ -28,6 +28,7 @@ class HistoryService:
     PROGRESS_UPDATE_INTERVAL = 5  # seconds between progress updates
     THROTTLE_CLEANUP_INTERVAL = 300  # 5 minutes between cleanup of stale throttle entries
     THROTTLE_ENTRY_TTL = 3600  # 1 hour TTL for throttle entries (stale if no updates)
+    ACTIVE_CACHE_TTL = 2  # seconds get_active_transfers() results are reused
     
     def __init__(self, db_path: str):
         """Initialize the history service.
@@ -40,6 +41,11 @@ class HistoryService:
         self._lock = threading.Lock()
         self._last_progress_update: dict[str, float] = {}  # transfer_id -> timestamp
         self._last_throttle_cleanup: float = 0
+        # Cached get_active_transfers() rows as (expires_at, rows). Status
+        # changes bump the generation so in-flight reads can't repopulate
+        # the cache with rows that predate the change.
+        self._active_cache: Optional[tuple[float, list[dict]]] = None
+        self._active_generation = 0
         
         # Ensure directory exists
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
@@ -57,6 +63,12 @@ class HistoryService:
             self._local.connection.row_factory = sqlite3.Row
         return self._local.connection
     
+    def _invalidate_active_cache(self):
+        """Drop cached active transfers after a status change."""
+        with self._lock:
+            self._active_cache = None
+            self._active_generation += 1
+    
     def _init_db(self):
         """Initialize database schema."""
         conn = self._get_connection()
@@ -86,11 +98,20 @@ class HistoryService:
             CREATE INDEX IF NOT EXISTS idx_transfers_source ON transfers(source_client);
             CREATE INDEX IF NOT EXISTS idx_transfers_target ON transfers(target_client);
             CREATE INDEX IF NOT EXISTS idx_transfers_hash ON transfers(torrent_hash);
+            
+            -- Cover the /transfers sort whitelist so ORDER BY ... LIMIT walks
+            -- an index instead of sorting the whole filtered set
+            CREATE INDEX IF NOT EXISTS idx_transfers_status_created_at ON transfers(status, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_transfers_completed_at ON transfers(completed_at);
+            CREATE INDEX IF NOT EXISTS idx_transfers_size_bytes ON transfers(size_bytes);
+            CREATE INDEX IF NOT EXISTS idx_transfers_torrent_name ON transfers(torrent_name);
         """)
         conn.commit()
         
         # Run migrations for existing databases
         self._migrate_db(conn)
+        
+        self._init_stats(conn)
     
     def _migrate_db(self, conn):
         """Run database migrations for schema changes.
@@ -112,6 +133,63 @@ class HistoryService:
             conn.commit()
             logger.info("Migration: added trigger column to transfers table")
     
+    def _init_stats(self, conn):
+        """Create the per-status counters table and the triggers that maintain it.
+        
+        transfer_stats holds one row per status with the record count and
+        summed size_bytes, kept current by triggers on every insert, delete
+        and status/size change, so get_stats() reads a handful of rows
+        instead of aggregating the whole history. The counters are rebuilt
+        from transfers on startup so databases created before the table
+        existed (or edited externally) start out consistent.
+        """
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS transfer_stats (
+                status TEXT PRIMARY KEY,
+                count INTEGER NOT NULL DEFAULT 0,
+                bytes_sum INTEGER NOT NULL DEFAULT 0
+            );
+            
+            CREATE TRIGGER IF NOT EXISTS trg_transfer_stats_insert
+            AFTER INSERT ON transfers
+            BEGIN
+                INSERT INTO transfer_stats (status, count, bytes_sum)
+                VALUES (NEW.status, 1, COALESCE(NEW.size_bytes, 0))
+                ON CONFLICT(status) DO UPDATE SET
+                    count = count + 1,
+                    bytes_sum = bytes_sum + excluded.bytes_sum;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS trg_transfer_stats_update
+            AFTER UPDATE OF status, size_bytes ON transfers
+            BEGIN
+                UPDATE transfer_stats SET
+                    count = count - 1,
+                    bytes_sum = bytes_sum - COALESCE(OLD.size_bytes, 0)
+                WHERE status = OLD.status;
+                INSERT INTO transfer_stats (status, count, bytes_sum)
+                VALUES (NEW.status, 1, COALESCE(NEW.size_bytes, 0))
+                ON CONFLICT(status) DO UPDATE SET
+                    count = count + 1,
+                    bytes_sum = bytes_sum + excluded.bytes_sum;
+            END;
+            
+            CREATE TRIGGER IF NOT EXISTS trg_transfer_stats_delete
+            AFTER DELETE ON transfers
+            BEGIN
+                UPDATE transfer_stats SET
+                    count = count - 1,
+                    bytes_sum = bytes_sum - COALESCE(OLD.size_bytes, 0)
+                WHERE status = OLD.status;
+            END;
+            
+            DELETE FROM transfer_stats;
+            INSERT INTO transfer_stats (status, count, bytes_sum)
+                SELECT status, COUNT(*), COALESCE(SUM(size_bytes), 0)
+                FROM transfers GROUP BY status;
+        """)
+        conn.commit()
+    
     def _mark_interrupted_transfers(self):
         """Mark any pending/transferring records as failed on startup."""
         conn = self._get_connection()
@@ -184,6 +262,7 @@ class HistoryService:
             )
         )
         conn.commit()
+        self._invalidate_active_cache()
         
         return transfer_id
     
@@ -203,6 +282,7 @@ class HistoryService:
             (_utc_now().isoformat(), transfer_id)
         )
         conn.commit()
+        self._invalidate_active_cache()
     
     def update_progress(self, transfer_id: str, bytes_transferred: int, force: bool = False):
         """Update bytes transferred for a transfer.
@@ -274,6 +354,7 @@ class HistoryService:
                 (_utc_now().isoformat(), transfer_id)
             )
         conn.commit()
+        self._invalidate_active_cache()
         
         # Clean up throttle tracking
         with self._lock:
@@ -296,6 +377,7 @@ class HistoryService:
             (error_message, _utc_now().isoformat(), transfer_id)
         )
         conn.commit()
+        self._invalidate_active_cache()
         
         # Clean up throttle tracking
         with self._lock:
@@ -318,39 +400,21 @@ class HistoryService:
         row = cursor.fetchone()
         return dict(row) if row else None
     
-    def list_transfers(
+    def _build_filters(
         self,
         status: Optional[str] = None,
         source: Optional[str] = None,
         target: Optional[str] = None,
         search: Optional[str] = None,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
         transfer_method: Optional[str] = None,
         trigger: Optional[str] = None,
-        page: int = 1,
-        per_page: int = 25,
-        sort: str = 'created_at',
-        order: str = 'desc'
-    ) -> tuple[list[dict], int]:
-        """List transfers with filtering and pagination.
+    ) -> tuple[list[str], list]:
+        """Build WHERE conditions and params shared by the list queries.
         
-        Args:
-            status: Filter by status
-            source: Filter by source client
-            target: Filter by target client
-            search: Search in torrent name
-            start_date: Filter by created_at >= date (ISO format)
-            end_date: Filter by created_at <= date (ISO format)
-            transfer_method: Filter by transfer method ('sftp', 'local', 'torrent')
-            trigger: Filter by trigger type ('automatic', 'manual')
-            page: Page number (1-indexed)
-            per_page: Items per page
-            sort: Sort field (created_at, completed_at, size_bytes)
-            order: Sort order (asc, desc)
-            
         Returns:
-            Tuple of (list of transfer dicts, total count)
+            Tuple of (list of SQL conditions, list of params)
         """
         conditions = []
         params = []
@@ -380,26 +444,67 @@ class HistoryService:
             params.append(trigger)
         
         if start_date:
+            if isinstance(start_date, date):
+                start_date = start_date.isoformat()
             conditions.append("created_at >= ?")
             params.append(start_date)
         
         if end_date:
-            # Append time to include full day (dates come as YYYY-MM-DD)
-            if len(end_date) == 10:  # YYYY-MM-DD format
-                end_date = f"{end_date}T23:59:59.999999Z"
-            conditions.append("created_at <= ?")
-            params.append(end_date)
+            if isinstance(end_date, date) and not isinstance(end_date, datetime):
+                # Whole-day bound: everything before the start of the next day
+                conditions.append("created_at < ?")
+                params.append((end_date + timedelta(days=1)).isoformat())
+            else:
+                if isinstance(end_date, datetime):
+                    end_date = end_date.isoformat()
+                # Append time to include full day (dates come as YYYY-MM-DD)
+                elif len(end_date) == 10:  # YYYY-MM-DD format
+                    end_date = f"{end_date}T23:59:59.999999Z"
+                conditions.append("created_at <= ?")
+                params.append(end_date)
+        
+        return conditions, params
+    
+    def list_transfers(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        search: Optional[str] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        transfer_method: Optional[str] = None,
+        trigger: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 25,
+        sort: str = 'created_at',
+        order: str = 'desc'
+    ) -> tuple[list[dict], int]:
+        """List transfers with filtering and pagination.
         
+        Args:
+            status: Filter by status
+            source: Filter by source client
+            target: Filter by target client
+            search: Search in torrent name
+            start_date: Filter by created_at >= date (date or ISO string)
+            end_date: Filter by created_at <= date, inclusive of the whole
+                day when given as a date (date or ISO string)
+            transfer_method: Filter by transfer method ('sftp', 'local', 'torrent')
+            trigger: Filter by trigger type ('automatic', 'manual')
+            page: Page number (1-indexed)
+            per_page: Items per page
+            sort: Sort field (created_at, completed_at, size_bytes)
+            order: Sort order (asc, desc)
+            
+        Returns:
+            Tuple of (list of transfer dicts, total count)
+        """
+        conditions, params = self._build_filters(
+            status, source, target, search, start_date, end_date, transfer_method, trigger
+        )
         where_clause = " AND ".join(conditions) if conditions else "1=1"
         
-        # Validate sort field
-        allowed_sorts = {'created_at', 'completed_at', 'size_bytes', 'bytes_transferred', 'torrent_name'}
-        if sort not in allowed_sorts:
-            sort = 'created_at'
-        
-        # Validate order
-        order = 'DESC' if order.lower() == 'desc' else 'ASC'
-        
         conn = self._get_connection()
         
         # Get total count
@@ -409,28 +514,165 @@ class HistoryService:
         )
         total = cursor.fetchone()[0]
         
-        # Get paginated results
-        offset = (page - 1) * per_page
-        cursor = conn.execute(
+        transfers = self._select_page(where_clause, params, sort, order, per_page, (page - 1) * per_page)
+        
+        return transfers, total
+    
+    def list_transfers_probe(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        search: Optional[str] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        transfer_method: Optional[str] = None,
+        trigger: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 25,
+        sort: str = 'created_at',
+        order: str = 'desc'
+    ) -> tuple[list[dict], bool]:
+        """List a page of transfers without counting the filtered set.
+        
+        Fetches one row past the page instead of running COUNT(*), which
+        is enough for next/previous navigation.
+        
+        Args:
+            Same as list_transfers
+            
+        Returns:
+            Tuple of (list of transfer dicts, whether a next page exists)
+        """
+        conditions, params = self._build_filters(
+            status, source, target, search, start_date, end_date, transfer_method, trigger
+        )
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        
+        transfers = self._select_page(where_clause, params, sort, order, per_page + 1, (page - 1) * per_page)
+        
+        has_more = len(transfers) > per_page
+        return transfers[:per_page], has_more
+    
+    def _select_page(
+        self, where_clause: str, params: list, sort: str, order: str, limit: int, offset: int
+    ) -> list[dict]:
+        """Run the page query shared by list_transfers and list_transfers_probe."""
+        # Validate sort field
+        allowed_sorts = {'created_at', 'completed_at', 'size_bytes', 'bytes_transferred', 'torrent_name'}
+        if sort not in allowed_sorts:
+            sort = 'created_at'
+        
+        # Validate order
+        order = 'DESC' if order.lower() == 'desc' else 'ASC'
+        
+        # id breaks ties so pages are stable
+        cursor = self._get_connection().execute(
             f"""
             SELECT * FROM transfers 
             WHERE {where_clause}
-            ORDER BY {sort} {order}
+            ORDER BY {sort} {order}, id {order}
             LIMIT ? OFFSET ?
             """,
-            params + [per_page, offset]
+            params + [limit, offset]
         )
+        return [dict(row) for row in cursor.fetchall()]
+    
+    def list_transfers_keyset(
+        self,
+        status: Optional[str] = None,
+        source: Optional[str] = None,
+        target: Optional[str] = None,
+        search: Optional[str] = None,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        transfer_method: Optional[str] = None,
+        trigger: Optional[str] = None,
+        after: Optional[tuple[str, str]] = None,
+        per_page: int = 25,
+        order: str = 'desc',
+        include_total: bool = True
+    ) -> tuple[list[dict], Optional[int], Optional[tuple[str, str]]]:
+        """List transfers ordered by (created_at, id) using seek pagination.
+        
+        Unlike OFFSET pagination, the cost of a page does not grow with
+        its depth: the (created_at, id) position of the previous page's
+        last row is used as a seek key into the created_at index.
         
+        Args:
+            status, source, target, search, start_date, end_date,
+            transfer_method, trigger: Same filters as list_transfers
+            after: (created_at, id) of the last row already seen, or None
+                for the first page
+            per_page: Items per page
+            order: Sort order (asc, desc)
+            include_total: Count the filtered set; skipped (total is None)
+                when False
+            
+        Returns:
+            Tuple of (list of transfer dicts, total count or None, next seek
+            key or None if this is the last page)
+        """
+        conditions, params = self._build_filters(
+            status, source, target, search, start_date, end_date, transfer_method, trigger
+        )
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        
+        conn = self._get_connection()
+        total = None
+        if include_total:
+            cursor = conn.execute(
+                f"SELECT COUNT(*) FROM transfers WHERE {where_clause}",
+                params
+            )
+            total = cursor.fetchone()[0]
+        
+        order = 'DESC' if order.lower() == 'desc' else 'ASC'
+        page_conditions = list(conditions)
+        page_params = list(params)
+        if after is not None:
+            comparison = '<' if order == 'DESC' else '>'
+            page_conditions.append(f"(created_at, id) {comparison} (?, ?)")
+            page_params.extend(after)
+        page_where = " AND ".join(page_conditions) if page_conditions else "1=1"
+        
+        # Fetch one extra row to learn whether another page exists
+        cursor = conn.execute(
+            f"""
+            SELECT * FROM transfers
+            WHERE {page_where}
+            ORDER BY created_at {order}, id {order}
+            LIMIT ?
+            """,
+            page_params + [per_page + 1]
+        )
         transfers = [dict(row) for row in cursor.fetchall()]
         
-        return transfers, total
+        next_key = None
+        if len(transfers) > per_page:
+            transfers = transfers[:per_page]
+            last = transfers[-1]
+            next_key = (last['created_at'], last['id'])
+        
+        return transfers, total, next_key
     
     def get_active_transfers(self) -> list[dict]:
         """Get all pending and transferring transfers.
         
+        Results are reused for up to ACTIVE_CACHE_TTL seconds; status changes
+        made through this service invalidate them immediately. Progress
+        updates don't, so bytes_transferred may lag by up to the TTL.
+        
         Returns:
             List of active transfer dicts
         """
+        now = time.monotonic()
+        with self._lock:
+            cached = self._active_cache
+            generation = self._active_generation
+        if cached is not None and cached[0] > now:
+            return [dict(transfer) for transfer in cached[1]]
+        
         conn = self._get_connection()
         cursor = conn.execute(
             """
@@ -439,7 +681,12 @@ class HistoryService:
             ORDER BY created_at DESC
             """
         )
-        return [dict(row) for row in cursor.fetchall()]
+        transfers = [dict(row) for row in cursor.fetchall()]
+        
+        with self._lock:
+            if generation == self._active_generation:
+                self._active_cache = (now + self.ACTIVE_CACHE_TTL, transfers)
+        return [dict(transfer) for transfer in transfers]
     
     def get_stats(self) -> dict:
         """Get aggregate statistics.
@@ -449,21 +696,17 @@ class HistoryService:
         """
         conn = self._get_connection()
         
-        cursor = conn.execute("""
-            SELECT 
-                COUNT(*) as total,
-                SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END) as completed,
-                SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END) as pending,
-                SUM(CASE WHEN status = 'transferring' THEN 1 ELSE 0 END) as transferring,
-                SUM(CASE WHEN status = 'completed' THEN size_bytes ELSE 0 END) as total_bytes_transferred
-            FROM transfers
-        """)
-        row = cursor.fetchone()
+        # Read the trigger-maintained per-status counters (see _init_stats)
+        cursor = conn.execute("SELECT status, count, bytes_sum FROM transfer_stats")
+        counts = {}
+        bytes_by_status = {}
+        for row in cursor.fetchall():
+            counts[row['status']] = row['count']
+            bytes_by_status[row['status']] = row['bytes_sum']
         
-        total = row['total'] or 0
-        completed = row['completed'] or 0
-        failed = row['failed'] or 0
+        total = sum(counts.values())
+        completed = counts.get('completed', 0)
+        failed = counts.get('failed', 0)
         
         # Calculate success rate (only count completed + failed, not pending/transferring)
         finished = completed + failed
@@ -473,10 +716,10 @@ class HistoryService:
             'total': total,
             'completed': completed,
             'failed': failed,
-            'pending': row['pending'] or 0,
-            'transferring': row['transferring'] or 0,
+            'pending': counts.get('pending', 0),
+            'transferring': counts.get('transferring', 0),
             'success_rate': round(success_rate, 1),
-            'total_bytes_transferred': row['total_bytes_transferred'] or 0
+            'total_bytes_transferred': bytes_by_status.get('completed', 0)
         }
     
     def prune_old_entries(self, retention_days: int):
@@ -494,7 +737,6 @@ class HistoryService:
             conn.commit()
             return
         
-        from datetime import timedelta
         cutoff = (_utc_now() - timedelta(days=retention_days)).isoformat()
         
         conn = self._get_connection()
@@ -523,7 +765,42 @@ class HistoryService:
             (transfer_id,)
         )
         conn.commit()
-        return cursor.rowcount > 0
+        if cursor.rowcount > 0:
+            self._invalidate_active_cache()
+            return True
+        return False
+    
+    def delete_transfer_conditional(self, transfer_id: str, force: bool = False) -> str:
+        """Delete a transfer record unless it is still active.
+        
+        Runs a single guarded DELETE; the record is only looked up again
+        when nothing was deleted, to tell "not found" from "active".
+        
+        Args:
+            transfer_id: UUID of the transfer to delete
+            force: Delete even if the transfer is pending/transferring
+            
+        Returns:
+            'deleted', 'not_found', or 'active'
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            DELETE FROM transfers
+            WHERE id = ? AND (? OR status NOT IN ('pending', 'transferring'))
+            """,
+            (transfer_id, force)
+        )
+        conn.commit()
+        if cursor.rowcount > 0:
+            self._invalidate_active_cache()
+            return 'deleted'
+        
+        row = conn.execute(
+            "SELECT 1 FROM transfers WHERE id = ?",
+            (transfer_id,)
+        ).fetchone()
+        return 'active' if row else 'not_found'
     
     def clear_history(self, status: Optional[str] = None) -> int:
         """Clear transfer history records.
@@ -549,6 +826,8 @@ class HistoryService:
             )
         
         conn.commit()
+        if status in ('pending', 'transferring') and cursor.rowcount > 0:
+            self._invalidate_active_cache()
         return cursor.rowcount
     
     def close(self):
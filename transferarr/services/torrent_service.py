@@ -3,6 +3,7 @@ import logging
 import radarr
 import json
 import os
+import shutil
 import tempfile
 import threading
 import time
@@ -11,7 +12,7 @@ from typing import Optional
 from transferarr.clients.base import load_download_clients
 from transferarr.services.transfer_connection import TransferConnection
 from transferarr.models import TorrentList
-from transferarr.models.torrent import Torrent, TorrentState
+from transferarr.models.torrent import TORRENT_TRANSFER_STATES, Torrent, TorrentState
 from transferarr.services.media_managers import RadarrManager, SonarrManager
 from transferarr.services.tracker import BitTorrentTracker, create_tracker_from_config
 from transferarr.services.torrent_transfer import TorrentTransferHandler
@@ -19,11 +20,55 @@ from time import sleep
 
 logger = logging.getLogger("transferarr")
 
+# State groups update_torrents() dispatches on for every tracked torrent
+_UNPLACED_STATES = frozenset({TorrentState.MANAGER_QUEUED, TorrentState.UNCLAIMED, TorrentState.ERROR})
+_HOME_STATES = frozenset(state for state in TorrentState if state.name.startswith("HOME"))
+_TARGET_STATES = frozenset(state for state in TorrentState if state.name.startswith("TARGET"))
+
+
+class _TransferOwnerIndex:
+    """Transfer torrent hash -> tracked torrents whose transfer uses it.
+
+    Built once per update pass; refresh() re-indexes a torrent whose
+    transfer hash may have been assigned or changed since.
+    """
+
+    def __init__(self, torrents):
+        self._owners = {}  # lowercased hash -> [torrent, ...]
+        self._indexed = {}  # id(torrent) -> hash it is indexed under
+        for torrent in torrents:
+            self.refresh(torrent)
+
+    def refresh(self, torrent):
+        transfer_hash = torrent.transfer.get("hash") if torrent.transfer else None
+        transfer_hash = transfer_hash.lower() if transfer_hash else None
+        old_hash = self._indexed.get(id(torrent))
+        if transfer_hash == old_hash:
+            return
+        if old_hash:
+            owners = self._owners[old_hash]
+            owners.remove(torrent)
+            if not owners:
+                del self._owners[old_hash]
+        if transfer_hash:
+            self._owners.setdefault(transfer_hash, []).append(torrent)
+        self._indexed[id(torrent)] = transfer_hash
+
+    def owner_of(self, torrent):
+        """The first other tracked torrent transferring as torrent.id, or None."""
+        for owner in self._owners.get(torrent.id.lower(), ()):
+            if owner is not torrent:
+                return owner
+        return None
+
 class TorrentManager:
     def __init__(self, config, config_file, state_dir=None, history_service=None, history_config=None):
         self.torrents = TorrentList()
         self.config = config
         self.config_file = config_file
+        # Bumped on every config change so derived views (e.g. the sanitized
+        # /config payload) can be memoized until the config changes
+        self.config_version = 0
         self.media_managers = []
         self.download_clients = {}
         self.connections = {}  # Dict keyed by connection name
@@ -185,7 +230,7 @@ class TorrentManager:
             # so cleanup at TARGET_SEEDING can unregister properly
             elif (torrent.state and 
                   (torrent.state == TorrentState.COPIED or 
-                   str(torrent.state.name).startswith("TARGET")) and
+                   torrent.state in _TARGET_STATES) and
                   not torrent.transfer.get("cleaned_up")):
                 needs_registration = True
             
@@ -479,39 +524,68 @@ class TorrentManager:
             
             if not siblings:
                 return
-            
-            logger.info(
-                f"Removing {len(siblings)} cross-seed sibling(s) for "
-                f"'{torrent.name}' from {torrent.home_client.name}"
-            )
-            for sibling_hash in siblings:
-                try:
-                    torrent.home_client.remove_torrent(
-                        sibling_hash, remove_data=True
-                    )
-                    logger.debug(
-                        f"Removed cross-seed sibling {sibling_hash[:8]} "
-                        f"for '{torrent.name}'"
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to remove cross-seed sibling "
-                        f"{sibling_hash[:8]} for '{torrent.name}': {e}"
-                    )
         except Exception as e:
             logger.warning(
                 f"Failed to query cross-seed siblings for "
                 f"'{torrent.name}': {e}"
             )
+            return
+        
+        logger.info(
+            f"Removing {len(siblings)} cross-seed sibling(s) for "
+            f"'{torrent.name}' from {torrent.home_client.name}"
+        )
+        try:
+            failures = torrent.home_client.remove_torrents(siblings, remove_data=True)
+        except Exception as e:
+            logger.warning(
+                f"Failed to remove {len(siblings)} cross-seed sibling(s) for "
+                f"'{torrent.name}' from {torrent.home_client.name}: {e}"
+            )
+            return
+        for sibling_hash in siblings:
+            if sibling_hash in failures:
+                logger.warning(
+                    f"Failed to remove cross-seed sibling "
+                    f"{sibling_hash[:8]} for '{torrent.name}': {failures[sibling_hash]}"
+                )
+            else:
+                logger.debug(
+                    f"Removed cross-seed sibling {sibling_hash[:8]} "
+                    f"for '{torrent.name}'"
+                )
+
+    def bump_config_version(self):
+        """Mark the runtime config as changed."""
+        self.config_version += 1
 
     def save_config(self, updated_config):
-        """Save the updated configuration to the config file."""
+        """Save the updated configuration to the config file.
+
+        The file is written to a temp file and swapped in with os.replace, so a
+        failed save leaves the previous config file intact.
+        """
+        temp_path = None
         try:
-            with open(self.config_file, "w") as f:
+            fd, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(os.path.abspath(self.config_file)),
+                prefix="config.",
+                suffix=".json",
+            )
+            with os.fdopen(fd, "w") as f:
                 json.dump(updated_config, f, indent=4)
+            if os.path.exists(self.config_file):
+                shutil.copymode(self.config_file, temp_path)
+            os.replace(temp_path, self.config_file)
+            self.bump_config_version()
             return True
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
+            if temp_path:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
             return False
 
     def create_manual_transfers(self, hashes, source_client, dest_client,
@@ -694,23 +768,27 @@ class TorrentManager:
     def update_torrents(self):
         """Update the state of all torrents"""
         torrents_to_remove = []
+        # Built on first use, then kept current as torrents are processed
+        transfer_owners = None
+        previous = None
         for torrent in self.torrents:
+            # Processing a torrent may assign its transfer hash
+            if transfer_owners is not None and previous is not None:
+                transfer_owners.refresh(previous)
+            previous = torrent
+            
             # Skip TRANSFER_FAILED — requires explicit user action (Retry or Remove)
             if torrent.state == TorrentState.TRANSFER_FAILED:
                 continue
 
             ### First case is a torrent that was just added to the radarr queue, state is RADARR_QUEUE
-            if torrent.state in [TorrentState.MANAGER_QUEUED, TorrentState.UNCLAIMED, TorrentState.ERROR]:
+            if torrent.state in _UNPLACED_STATES:
                 ### Check if this is one of our transfer torrents (picked up by Radarr/Sonarr)
-                is_transfer = False
-                for other in self.torrents:
-                    if other is torrent:
-                        continue
-                    if other.transfer and other.transfer.get("hash", "").lower() == torrent.id.lower():
-                        logger.debug(f"Torrent {torrent.name} is a transfer torrent for {other.name}, skipping")
-                        is_transfer = True
-                        break
-                if is_transfer:
+                if transfer_owners is None:
+                    transfer_owners = _TransferOwnerIndex(self.torrents)
+                owner = transfer_owners.owner_of(torrent)
+                if owner is not None:
+                    logger.debug(f"Torrent {torrent.name} is a transfer torrent for {owner.name}, skipping")
                     torrents_to_remove.append(torrent)
                     continue
                 
@@ -748,7 +826,7 @@ class TorrentManager:
                         torrents_to_remove.append(torrent)
                         continue
             ### Next case is a torrent with any state that starts with HOME or COPYING (in which case we need to figure out what to do)
-            elif str(torrent.state.name).startswith("HOME"):
+            elif torrent.state in _HOME_STATES:
                 ### Gotta update its state first:
                 if torrent.home_client.has_torrent(torrent):
                     torrent.state = torrent.home_client.get_torrent_state(torrent)
@@ -830,9 +908,7 @@ class TorrentManager:
                     if not connection_found:
                         logger.warning(f"Could not find appropriate connection for torrent {torrent.name} from {torrent.home_client.name} to {torrent.target_client.name}")
             ### Handle torrent-based transfer states
-            elif torrent.state in [TorrentState.TORRENT_CREATE_QUEUE, TorrentState.TORRENT_CREATING,
-                                   TorrentState.TORRENT_TARGET_ADDING,
-                                   TorrentState.TORRENT_DOWNLOADING, TorrentState.TORRENT_SEEDING]:
+            elif torrent.state in TORRENT_TRANSFER_STATES:
                 if not self.torrent_transfer_handler:
                     logger.error(f"Torrent {torrent.name} in {torrent.state.name} but no transfer handler available")
                     torrent.state = TorrentState.ERROR
@@ -863,7 +939,7 @@ class TorrentManager:
                 elif torrent.state == TorrentState.TORRENT_SEEDING:
                     self.torrent_transfer_handler.handle_seeding(torrent, connection)
             ### If state begins with TARGET
-            elif str(torrent.state.name).startswith("TARGET") or torrent.state == TorrentState.COPIED:
+            elif torrent.state in _TARGET_STATES or torrent.state == TorrentState.COPIED:
                 ### Gotta update its state first:
                 if torrent.target_client.has_torrent(torrent):
                     torrent.state = torrent.target_client.get_torrent_state(torrent)
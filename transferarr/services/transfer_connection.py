@@ -1,5 +1,6 @@
 import logging
 import os
+from base64 import b64encode
 from pathlib import Path
 from transferarr.utils import get_paths_to_copy
 from transferarr.models.torrent import TorrentState
@@ -254,6 +255,8 @@ class TransferConnection:
         ## Copy .torrent file to tmp dir
         torrent.state = TorrentState.COPYING
         dot_torrent_file_path = str(Path(self.source_dot_torrent_path).joinpath(f"{torrent.id}.torrent"))
+        # Where the .torrent is written and then loaded from by the target client
+        dest_dot_torrent_path = str(Path(self.destination_dot_torrent_tmp_dir).joinpath(f"{torrent.id}.torrent"))
         
         # Get transfer_id for history tracking
         transfer_id = torrent._transfer_id
@@ -265,25 +268,70 @@ class TransferConnection:
         if transfer_id and self.history_service:
             self.history_service.start_transfer(transfer_id)
 
+        # One connection per side for the .torrent file and every data path
+        try:
+            with transfer_client.session():
+                copied = self._copy_torrent_data(
+                    torrent, transfer_client, dot_torrent_file_path, dest_dot_torrent_path, transfer_id
+                )
+        except Exception as e:
+            logger.error(f"Transfer connection failed for {torrent.name}: {e}")
+            torrent.state = TorrentState.ERROR
+            if transfer_id and self.history_service:
+                self.history_service.fail_transfer(transfer_id, f"Transfer connection failed: {e}")
+            return
+        if copied is None:
+            return
+        file_dump, bytes_transferred = copied
+                
+        if torrent.state == TorrentState.COPIED:
+            try:
+                self.to_client.add_torrent_file(dest_dot_torrent_path, file_dump, {})
+                self.to_client_info = self.to_client.get_torrent_info(torrent)
+                torrent.state = self.to_client.get_torrent_state(torrent)
+                logger.info(f"Torrent added successfully: {torrent.name}")
+                # Mark transfer as completed in history
+                if transfer_id and self.history_service:
+                    # Force final progress update to ensure bytes are accurate
+                    total_size = getattr(torrent, 'size', bytes_transferred) or bytes_transferred
+                    self.history_service.update_progress(transfer_id, total_size, force=True)
+                    self.history_service.complete_transfer(transfer_id)
+            except Exception as e:
+                logger.error(f"Error adding torrent: {e}")
+                if transfer_id and self.history_service:
+                    self.history_service.fail_transfer(transfer_id, f"Error adding torrent to target client: {e}")
+                torrent.state = TorrentState.ERROR
+    
+    def _copy_torrent_data(self, torrent, transfer_client, dot_torrent_file_path, dest_dot_torrent_path, transfer_id):
+        """Copy the .torrent file and every data path of a torrent.
+        
+        Sets torrent.state to COPIED or ERROR (recording failures in history).
+        
+        Returns:
+            (base64 .torrent dump, bytes transferred), or None if the
+            .torrent file could not be copied
+        """
         if not transfer_client.file_exists_on_source(dot_torrent_file_path):
             logger.error(f"Source .torrent file does not exist: {dot_torrent_file_path}")
             torrent.state = TorrentState.ERROR
             if transfer_id and self.history_service:
                 self.history_service.fail_transfer(transfer_id, f"Source .torrent file not found: {dot_torrent_file_path}")
-            return
+            return None
         
-        file_dump = transfer_client.get_dot_torrent_file_dump(dot_torrent_file_path)
+        # Read the .torrent once: the same bytes are written to the target
+        # and, base64 encoded, handed to the target client
+        dot_torrent_data = transfer_client.read_source_file(dot_torrent_file_path)
+        file_dump = b64encode(dot_torrent_data)
 
         torrent.current_file = os.path.basename(dot_torrent_file_path)
-        success = transfer_client.upload(dot_torrent_file_path, self.destination_dot_torrent_tmp_dir, torrent)
+        success = transfer_client.write_target_file(dot_torrent_data, dest_dot_torrent_path)
         if not success:
             torrent.state = TorrentState.ERROR
             logger.error(f"Failed to copy .torrent file: {dot_torrent_file_path}")
             if transfer_id and self.history_service:
                 self.history_service.fail_transfer(transfer_id, f"Failed to copy .torrent file: {dot_torrent_file_path}")
-            return
+            return None
             
-        dest_dot_torrent_path = str(Path(self.destination_dot_torrent_tmp_dir).joinpath(f"{torrent.id}.torrent"))
         paths_to_copy = get_paths_to_copy(torrent)
         bytes_transferred = 0
         
@@ -311,25 +359,7 @@ class TransferConnection:
                 break
                 
         torrent.current_file = ""  # Clear current file when all transfers are complete
-                
-        if torrent.state == TorrentState.COPIED:
-            try:
-                self.to_client.add_torrent_file(dest_dot_torrent_path, file_dump, {})
-                self.to_client_info = self.to_client.get_torrent_info(torrent)
-                torrent.state = self.to_client.get_torrent_state(torrent)
-                logger.info(f"Torrent added successfully: {torrent.name}")
-                # Mark transfer as completed in history
-                if transfer_id and self.history_service:
-                    # Force final progress update to ensure bytes are accurate
-                    total_size = getattr(torrent, 'size', bytes_transferred) or bytes_transferred
-                    self.history_service.update_progress(transfer_id, total_size, force=True)
-                    self.history_service.complete_transfer(transfer_id)
-            except Exception as e:
-                logger.error(f"Error adding torrent: {e}")
-                if transfer_id and self.history_service:
-                    self.history_service.fail_transfer(transfer_id, f"Error adding torrent to target client: {e}")
-                torrent.state = TorrentState.ERROR
-
+        return file_dump, bytes_transferred
     
     def get_active_transfers(self):
         """Get a list of currently transferring torrents"""
@@ -6,7 +6,6 @@ import secrets
 import string
 from pathlib import Path
 from urllib.parse import quote, unquote, urlparse, parse_qs
-from flask import jsonify
 
 logger = logging.getLogger(__name__)
 
@@ -121,52 +120,107 @@ def transfer_file_scp_cli(source, server, destination):
     except subprocess.CalledProcessError as e:
         logger.error(f"SCP transfer failed: {e}")
 
+# Values returned unchanged by decode_bytes
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
+def _decode_dict(obj):
+    # bytes and scalars (the bulk of Deluge results) are handled inline
+    # to avoid a recursive call per leaf
+    return {
+        (key.decode('utf-8') if type(key) is bytes
+         else key if type(key) is str else decode_bytes(key)):
+        (value.decode('utf-8') if type(value) is bytes
+         else value if type(value) in _SCALAR_TYPES else decode_bytes(value))
+        for key, value in obj.items()
+    }
+
+
+def _decode_list(obj):
+    return [
+        item.decode('utf-8') if type(item) is bytes
+        else item if type(item) in _SCALAR_TYPES else decode_bytes(item)
+        for item in obj
+    ]
+
+
+def _decode_tuple(obj):
+    return tuple(_decode_list(obj))
+
+
+def _decode_utf8(obj):
+    return obj.decode('utf-8')
+
+
+# Exact-type dispatch; subclasses fall back to the isinstance checks below
+_DECODERS = {
+    dict: _decode_dict,
+    list: _decode_list,
+    tuple: _decode_tuple,
+    bytes: _decode_utf8,
+}
+
+
 def decode_bytes(obj):
+    """Recursively decode bytes (including dict keys) to str.
+    
+    Deluge RPC results are large nested dict/list structures, so bytes and
+    scalar leaves are handled inline by their container without a recursive
+    call, and containers dispatch on their exact type.
+    """
+    obj_type = type(obj)
+    if obj_type in _SCALAR_TYPES:
+        return obj
+    decoder = _DECODERS.get(obj_type)
+    if decoder is not None:
+        return decoder(obj)
     if isinstance(obj, dict):
-        return {decode_bytes(key): decode_bytes(value) 
-                for key, value in obj.items()}
+        return _decode_dict(obj)
     if isinstance(obj, list):
-        return [decode_bytes(item) for item in obj]
+        return _decode_list(obj)
     if isinstance(obj, tuple):
-        return tuple(decode_bytes(item) for item in obj)
+        return _decode_tuple(obj)
     if isinstance(obj, bytes):
-        return obj.decode('utf-8')
+        return _decode_utf8(obj)
     return obj
 
 def get_paths_to_copy(torrent):
-    paths = set()
-    files = torrent.home_client_info['files']
-    for file in files:
-        paths.add(file['path'].split(os.sep)[0])
-    return paths
+    """Get the distinct top-level paths (files or directories) of a torrent."""
+    sep = os.sep
+    return {file['path'].partition(sep)[0] for file in torrent.home_client_info['files']}
 
 def connection_modal_browse(path, connection_type, connection_config):
+    """List a local or SFTP directory for the connection modal.
+    
+    Returns:
+        The listing dict on success, or an (error dict, status code) tuple
+    """
     try:
         if connection_type == "local":
             return browse_local(path)
         
         elif connection_type == "sftp":
             if "sftp" not in connection_config:
-                return jsonify({
+                return {
                     "error": "SFTP configuration not provided",
                     "entries": [],
                     "current_path": path
-                }), 400
+                }, 400
             sftp_config = connection_config["sftp"]
             return browse_sftp(path, sftp_config)
         else:
-            return jsonify({
+            return {
                 "error": f"Unsupported connection type: {connection_type}",
                 "entries": [],
                 "current_path": path
-            }), 400
+            }, 400
             
     except Exception as e:
         logger.error(f"Error in browse_directory: {e}")
-        return jsonify({
+        return {
             "error": f"Server error: {str(e)}",
             "entries": []
-        }), 500
+        }, 500
 
 
 def browse_local(path):
@@ -175,30 +229,29 @@ def browse_local(path):
         
         # Check if path exists
         if not os.path.exists(expanded_path):
-            return jsonify({
+            return {
                 "error": f"Path does not exist: {path}",
                 "entries": [],
                 "current_path": path
-            }), 404
+            }, 404
         
         # Check if it's a directory
         if not os.path.isdir(expanded_path):
-            return jsonify({
+            return {
                 "error": f"Path is not a directory: {path}",
                 "entries": [],
                 "current_path": path
-            }), 400
+            }, 400
         
         # List directory contents
         entries = []
-        for entry in os.listdir(expanded_path):
-            entry_path = os.path.join(expanded_path, entry)
-            entries.append({
-                "name": entry,
-                "path": entry_path,
-                "is_dir": os.path.isdir(entry_path)
-                # "size": os.path.getsize(entry_path) if os.path.isfile(entry_path) else 0
-            })
+        with os.scandir(expanded_path) as dir_entries:
+            for entry in dir_entries:
+                entries.append({
+                    "name": entry.name,
+                    "path": entry.path,
+                    "is_dir": entry.is_dir()
+                })
         
         # Sort directories first, then files
         entries.sort(key=lambda x: (not x["is_dir"], x["name"].lower()))
@@ -206,19 +259,19 @@ def browse_local(path):
         # Get parent directory
         parent_path = os.path.dirname(os.path.abspath(expanded_path))
         
-        return jsonify({
+        return {
             "entries": entries,
             "parent": parent_path,
             "current_path": expanded_path
-        })
+        }
         
     except Exception as e:
         logger.error(f"Error browsing local directory {path}: {e}")
-        return jsonify({
+        return {
             "error": f"Error browsing directory: {str(e)}",
             "entries": [],
             "current_path": path
-        }), 500
+        }, 500
     
 def browse_sftp(path, sftp_config):
     # Import here to avoid circular import
@@ -231,11 +284,11 @@ def browse_sftp(path, sftp_config):
         print(f"sftp_client init took: {time.time() - start:.2f} seconds")
     except Exception as e:
         logger.error(f"Error connecting to SFTP via SSH config: {e}")
-        return jsonify({
+        return {
             "error": f"Error connecting to SFTP: {str(e)}",
             "entries": [],
             "current_path": path
-        }), 500
+        }, 500
     
     try:
         
@@ -256,17 +309,17 @@ def browse_sftp(path, sftp_config):
         if parent_path == "":
             parent_path = "/"
         
-        return jsonify({
+        return {
             "entries": entries,
             "parent": parent_path,
             "current_path": path
-        })
+        }
         
     except Exception as e:
         logger.error(f"Error browsing SFTP directory {path}: {e}")
         
-        return jsonify({
+        return {
             "error": f"Error browsing directory: {str(e)}",
             "entries": [],
             "current_path": path
-        }), 500
\ No newline at end of file
+        }, 500
\ No newline at end of file
@@ -3,9 +3,12 @@ from datetime import timedelta
 from flask import Flask
 from flask_login import LoginManager
 from flasgger import Swagger
+from werkzeug.middleware.proxy_fix import ProxyFix
 
 from transferarr import __version__
-from transferarr.auth import User, get_auth_config, get_or_create_secret_key
+from transferarr.auth import (
+    User, configure_password_hashing, get_auth_config, get_or_create_secret_key
+)
 
 login_manager = LoginManager()
 
@@ -22,6 +25,12 @@ def create_app(config, torrent_manager, state_dir: str):
     app.config['TORRENT_MANAGER'] = torrent_manager
     app.config['APP_CONFIG'] = config
     
+    # Request-independent services shared by all requests
+    from transferarr.web.services import ConnectionService, TorrentService
+    app.extensions['torrent_service'] = TorrentService(torrent_manager)
+    app.extensions['connection_service'] = ConnectionService(torrent_manager)
+    app.extensions['history_service'] = getattr(torrent_manager, 'history_service', None)
+    
     # Initialize Flask-Login
     login_manager.init_app(app)
     login_manager.login_view = 'auth.login'
@@ -36,6 +45,17 @@ def create_app(config, torrent_manager, state_dir: str):
     if timeout_minutes and timeout_minutes > 0:
         app.config['PERMANENT_SESSION_LIFETIME'] = timedelta(minutes=timeout_minutes)
     
+    # bcrypt cost for new password hashes (configured or calibrated)
+    configure_password_hashing(config)
+    
+    # Behind reverse proxies, take the client address from X-Forwarded-For
+    # so per-client login throttling sees real clients, not the proxy
+    trusted_proxies = config.get('auth', {}).get('trusted_proxies', 0)
+    if isinstance(trusted_proxies, bool) or not isinstance(trusted_proxies, int) or trusted_proxies < 0:
+        raise ValueError(f"auth.trusted_proxies must be a non-negative integer, got {trusted_proxies!r}")
+    if trusted_proxies:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=trusted_proxies)
+    
     @login_manager.user_loader
     def load_user(user_id):
         auth_config = get_auth_config(app.config['APP_CONFIG'])
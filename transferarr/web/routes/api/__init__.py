@@ -12,8 +12,7 @@ from flask import Blueprint, request, current_app
 from flask_login import current_user
 
 from transferarr.auth import (
-    is_auth_enabled,
-    is_auth_configured,
+    get_auth_state,
     is_api_key_required,
     check_api_key_in_request,
     get_api_config,
@@ -42,12 +41,13 @@ def check_api_auth():
     if request.endpoint == 'api.health_check':
         return None
     
+    user_auth_configured, user_auth_enabled = get_auth_state(config)
+    
     # If auth not configured, allow all (setup not done yet)
-    if not is_auth_configured(config):
+    if not user_auth_configured:
         return None
     
     # Check if any authentication is required
-    user_auth_enabled = is_auth_enabled(config)
     api_key_required = is_api_key_required(config)
     
     # If neither user auth nor API key is required, allow all
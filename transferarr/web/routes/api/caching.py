@@ -0,0 +1,102 @@
+"""
+Short-lived in-process response cache for read-heavy API routes.
+
+The dashboard polls a handful of GET endpoints every few seconds. Caching
+the encoded response for a short TTL lets repeated polls skip payload
+construction and JSON encoding entirely. Mutating routes invalidate the
+affected endpoints so writes are visible immediately.
+"""
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, request
+
+_EXTENSION_KEY = "transferarr_response_cache"
+
+
+class ResponseCache:
+    """Thread-safe map of endpoint[?query] -> (expires_at, body, status, mimetype, etag)."""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry
+
+    def set(self, key, timeout, body, status, mimetype, etag=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, body, status, mimetype, etag)
+
+    def delete_endpoints(self, endpoints):
+        """Drop every entry for the given endpoints, regardless of query string."""
+        with self._lock:
+            for key in list(self._entries):
+                if key.split("?", 1)[0] in endpoints:
+                    del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+def get_response_cache(app=None) -> ResponseCache:
+    """Get (or lazily create) the response cache for an app."""
+    app = app or current_app
+    cache = app.extensions.get(_EXTENSION_KEY)
+    if cache is None:
+        cache = app.extensions.setdefault(_EXTENSION_KEY, ResponseCache())
+    return cache
+
+
+def cached_response(timeout, query_string=False):
+    """Cache successful (200) responses of a GET route for ``timeout`` seconds.
+
+    Args:
+        timeout: Seconds a cached response stays valid
+        query_string: Include the query string in the cache key
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            key = request.endpoint
+            if query_string and request.query_string:
+                key = f"{key}?{request.query_string.decode()}"
+            cache = get_response_cache()
+            entry = cache.get(key)
+            if entry is not None:
+                _, body, status, mimetype, etag = entry
+                response = current_app.response_class(body, status=status, mimetype=mimetype)
+                if etag is None:
+                    return response
+                # Conditional views keep answering If-None-Match from cache
+                response.headers["ETag"] = etag
+                return response.make_conditional(request)
+
+            response = current_app.make_response(f(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                cache.set(
+                    key, timeout, response.get_data(), response.status_code,
+                    response.mimetype, response.headers.get("ETag"),
+                )
+            return response
+        return decorated_function
+    return decorator
+
+
+def invalidate_cached_responses(*view_names):
+    """Invalidate cached responses for views of the current blueprint.
+    
+    Args:
+        view_names: Endpoint names without the blueprint prefix (e.g. 'get_config')
+    """
+    prefix = f"{request.blueprint}." if request.blueprint else ""
+    get_response_cache().delete_endpoints({prefix + name for name in view_names})
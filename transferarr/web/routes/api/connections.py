@@ -6,9 +6,10 @@ from transferarr.web.services import (
     ConnectionService, NotFoundError, ConflictError, ConfigSaveError
 )
 from .responses import (
-    success_response, created_response, not_found_response,
+    success_response, conditional_success_response, created_response, not_found_response,
     error_response, server_error_response
 )
+from .converters import register_converters
 from .validation import validate_json
 from transferarr.web.schemas import ConnectionSchema, ConnectionUpdateSchema, ConnectionTestSchema
 import logging
@@ -16,33 +17,68 @@ import logging
 logger = logging.getLogger("transferarr")
 
 
+def _renamed_fields(*schema_classes) -> tuple:
+    """Collect (attribute, data_key) pairs for fields marshmallow renames on load."""
+    renames = {}
+    for schema_class in schema_classes:
+        for attr, field in schema_class._declared_fields.items():
+            if field.data_key and field.data_key != attr:
+                renames[attr] = field.data_key
+    return tuple(renames.items())
+
+
+# Resolved once at import: currently just ("from_", "from")
+_MARSHMALLOW_KEY_RENAMES = _renamed_fields(ConnectionSchema, ConnectionUpdateSchema, ConnectionTestSchema)
+
+
 def _convert_marshmallow_keys(data: dict) -> dict:
     """Convert marshmallow's from_ back to from for service layer.
     
     Marshmallow uses from_ because 'from' is a Python reserved word.
     This converts it back for the service/config layer.
     
-    For torrent configs, transfer_config has no from_ key (no nested from/to).
+    transfer_config is loaded as a plain Dict field, so its nested
+    from/to keys are never renamed and need no conversion.
     """
-    if "from_" in data:
-        data["from"] = data.pop("from_")
-    if "transfer_config" in data and "from_" in data["transfer_config"]:
-        data["transfer_config"]["from"] = data["transfer_config"].pop("from_")
+    for attr, data_key in _MARSHMALLOW_KEY_RENAMES:
+        if attr in data:
+            data[data_key] = data.pop(attr)
     return data
 
 
-def register_routes(bp):
-    """Register connection routes with the given blueprint."""
+def _get_connection_service() -> ConnectionService:
+    """Get the app-scoped ConnectionService, creating it on first use.
+    
+    Sharing one instance keeps its connection name index warm across
+    requests.
+    """
+    service = current_app.extensions.get('connection_service')
+    if service is None:
+        service = current_app.extensions.setdefault(
+            'connection_service', ConnectionService(current_app.config['TORRENT_MANAGER'])
+        )
+    return service
+
+
+class ConnectionRoutes:
+    """Connection route handlers, registered as bound methods on a blueprint."""
+    
+    def __init__(self, bp):
+        register_converters(bp)
+        bp.add_url_rule("/connections", view_func=self.get_connections)
+        bp.add_url_rule("/connections", view_func=self.add_connection, methods=["POST"])
+        bp.add_url_rule("/connections/test", view_func=self.test_connections, methods=["POST"])
+        bp.add_url_rule("/connections/<iname:connection_name>", view_func=self.edit_connection, methods=["PUT"])
+        bp.add_url_rule("/connections/<iname:connection_name>", view_func=self.delete_connection, methods=["DELETE"])
     
-    @bp.route("/connections")
-    def get_connections():
+    def get_connections(self):
         """Get all configured transfer connections.
         ---
         tags:
           - Connections
         responses:
           200:
-            description: List of connections
+            description: List of connections (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -89,15 +125,14 @@ def register_routes(bp):
                         type: string
         """
         try:
-            service = ConnectionService(current_app.config['TORRENT_MANAGER'])
-            return success_response(service.list_connections())
+            service = _get_connection_service()
+            return conditional_success_response([view.to_dict() for view in service.list_connections()])
         except Exception as e:
             logger.error(f"Error getting connections: {e}")
             return server_error_response(str(e))
 
-    @bp.route("/connections", methods=["POST"])
     @validate_json(ConnectionSchema)
-    def add_connection():
+    def add_connection(self):
         """Add a new transfer connection.
         ---
         tags:
@@ -175,7 +210,7 @@ def register_routes(bp):
           500:
             description: Server error
         """
-        service = ConnectionService(current_app.config['TORRENT_MANAGER'])
+        service = _get_connection_service()
         
         # Convert marshmallow format (from_ -> from) for service
         data = _convert_marshmallow_keys(dict(request.validated_data))
@@ -197,9 +232,8 @@ def register_routes(bp):
             logger.error(f"Error adding connection: {e}")
             return server_error_response(str(e))
 
-    @bp.route("/connections/test", methods=["POST"])
     @validate_json(ConnectionTestSchema)
-    def test_connections():
+    def test_connections(self):
         """Test a connection between two download clients.
         ---
         tags:
@@ -250,7 +284,7 @@ def register_routes(bp):
           500:
             description: Server error
         """
-        service = ConnectionService(current_app.config['TORRENT_MANAGER'])
+        service = _get_connection_service()
         
         # Convert marshmallow format (from_ -> from) for service
         data = _convert_marshmallow_keys(dict(request.validated_data))
@@ -263,13 +297,14 @@ def register_routes(bp):
             )
         except NotFoundError as e:
             return not_found_response(e.resource_type, e.identifier)
+        except ConflictError as e:
+            return error_response("AMBIGUOUS_CONNECTION", str(e), status_code=409)
         except Exception as e:
             logger.error(f"Error testing connections: {e}")
             return server_error_response(str(e))
 
-    @bp.route("/connections/<connection_name>", methods=["PUT"])
     @validate_json(ConnectionUpdateSchema)
-    def edit_connection(connection_name):
+    def edit_connection(self, connection_name):
         """Update an existing connection.
         ---
         tags:
@@ -345,7 +380,7 @@ def register_routes(bp):
           500:
             description: Server error
         """
-        service = ConnectionService(current_app.config['TORRENT_MANAGER'])
+        service = _get_connection_service()
         
         # Convert marshmallow format (from_ -> from) for service
         data = _convert_marshmallow_keys(dict(request.validated_data))
@@ -368,8 +403,7 @@ def register_routes(bp):
             logger.error(f"Error updating connection: {e}")
             return server_error_response(str(e))
         
-    @bp.route("/connections/<connection_name>", methods=["DELETE"])
-    def delete_connection(connection_name):
+    def delete_connection(self, connection_name):
         """Delete an existing connection.
         ---
         tags:
@@ -385,18 +419,27 @@ def register_routes(bp):
             description: Connection deleted successfully
           404:
             description: Connection not found
+          409:
+            description: Connection name matches several connections
           500:
             description: Server error
         """
-        service = ConnectionService(current_app.config['TORRENT_MANAGER'])
+        service = _get_connection_service()
         
         try:
             service.delete_connection(connection_name)
             return success_response(None, f"Connection '{connection_name}' deleted successfully")
         except NotFoundError as e:
             return not_found_response(e.resource_type, e.identifier)
+        except ConflictError as e:
+            return error_response("AMBIGUOUS_CONNECTION", str(e), status_code=409)
         except ConfigSaveError as e:
             return server_error_response(str(e))
         except Exception as e:
             logger.error(f"Error deleting connection: {e}")
             return server_error_response(str(e))
+
+
+def register_routes(bp):
+    """Register connection routes with the given blueprint."""
+    return ConnectionRoutes(bp)
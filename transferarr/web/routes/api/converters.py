@@ -0,0 +1,29 @@
+"""
+URL converters for API routes.
+"""
+import sys
+
+from werkzeug.routing import UnicodeConverter
+
+
+class InternedStringConverter(UnicodeConverter):
+    """Path segment converter that interns the matched name.
+
+    Client and connection names are short and reused on every request,
+    so interning them lets the config/runtime dict lookups that follow
+    hit the identity-compare fast path.
+    """
+
+    def to_python(self, value):
+        return sys.intern(value)
+
+
+def register_converters(bp):
+    """Register the API URL converters on the app the blueprint attaches to.
+
+    Must be called before any route using the converters is added to
+    ``bp``, since rules are compiled in the order they were recorded.
+    """
+    bp.record_once(
+        lambda state: state.app.url_map.converters.setdefault("iname", InternedStringConverter)
+    )
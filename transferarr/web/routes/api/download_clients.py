@@ -7,9 +7,10 @@ from transferarr.web.services import (
     DownloadClientService, NotFoundError, ConflictError, ValidationError, ConfigSaveError
 )
 from .responses import (
-    success_response, created_response, not_found_response,
+    success_response, conditional_success_response, created_response, not_found_response,
     error_response, validation_error_response, server_error_response
 )
+from .converters import register_converters
 from .validation import validate_json
 import logging
 
@@ -18,6 +19,7 @@ logger = logging.getLogger("transferarr")
 
 def register_routes(bp):
     """Register download client routes with the given blueprint."""
+    register_converters(bp)
     
     @bp.route("/download_clients", methods=["GET"])
     def get_download_clients():
@@ -27,7 +29,7 @@ def register_routes(bp):
           - Download Clients
         responses:
           200:
-            description: Dictionary of download clients wrapped in data envelope
+            description: Dictionary of download clients wrapped in data envelope (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -62,7 +64,7 @@ def register_routes(bp):
         """
         try:
             service = DownloadClientService(current_app.config['TORRENT_MANAGER'])
-            return success_response(service.list_clients())
+            return conditional_success_response(service.list_clients())
         except Exception as e:
             logger.error(f"Error getting download clients: {e}")
             return server_error_response(str(e))
@@ -152,7 +154,7 @@ def register_routes(bp):
             logger.error(f"Error adding download client: {e}")
             return server_error_response(str(e))
 
-    @bp.route("/download_clients/<name>", methods=["PUT"])
+    @bp.route("/download_clients/<iname:name>", methods=["PUT"])
     @validate_json(DownloadClientUpdateSchema)
     def edit_download_client(name):
         """Update an existing download client.
@@ -228,7 +230,7 @@ def register_routes(bp):
             logger.error(f"Error updating download client: {e}")
             return server_error_response(str(e))
 
-    @bp.route("/download_clients/<name>", methods=["DELETE"])
+    @bp.route("/download_clients/<iname:name>", methods=["DELETE"])
     def delete_download_client(name):
         """Delete a download client.
         ---
@@ -7,7 +7,30 @@ All API responses follow the minimal envelope format:
 
 This provides consistent structure for frontend parsing and error handling.
 """
-from flask import jsonify
+from flask import current_app, request, stream_with_context
+
+
+# Same compact separators jsonify uses outside debug mode
+_COMPACT_SEPARATORS = (",", ":")
+
+
+def _dumps(obj):
+    """Encode ``obj`` compactly with the app's JSON provider."""
+    return current_app.json.dumps(obj, separators=_COMPACT_SEPARATORS)
+
+
+def _json_response(body, status_code):
+    """Wrap an already-encoded JSON body in a response."""
+    return current_app.response_class(body, mimetype=current_app.json.mimetype), status_code
+
+
+def _success_bare(data, status_code):
+    """Build a message-less success response without the envelope dict.
+    
+    The envelope is spliced around the encoded payload directly, so only
+    ``data`` goes through the JSON encoder.
+    """
+    return _json_response('{"data":' + _dumps(data) + '}\n', status_code)
 
 
 def success_response(data=None, message=None, status_code=200, warnings=None):
@@ -22,12 +45,71 @@ def success_response(data=None, message=None, status_code=200, warnings=None):
     Returns:
         tuple: (Flask response, status_code)
     """
+    if not message and warnings is None:
+        return _success_bare(data, status_code)
     response = {"data": data}
     if message:
         response["message"] = message
     if warnings is not None:
         response["warnings"] = warnings
-    return jsonify(response), status_code
+    return _json_response(_dumps(response) + "\n", status_code)
+
+
+STREAM_ITEMS_PER_CHUNK = 64
+
+
+def success_stream_response(mapping, status_code=200):
+    """Success response for a large dict, encoded and sent incrementally.
+    
+    Produces the same {"data": {...}} envelope as success_response, but
+    each key/value pair is encoded on the fly and flushed in batches, so
+    the whole document is never held in memory as one string.
+    
+    Args:
+        mapping: Dict to send as the data payload
+        status_code: HTTP status code (default 200)
+    
+    Returns:
+        tuple: (streamed Flask response, status_code)
+    """
+    dumps = _dumps
+    
+    def generate():
+        yield '{"data":{'
+        batch = []
+        for index, (key, value) in enumerate(mapping.items()):
+            prefix = ',' if index else ''
+            batch.append(f"{prefix}{dumps(str(key))}:{dumps(value)}")
+            if len(batch) >= STREAM_ITEMS_PER_CHUNK:
+                yield ''.join(batch)
+                batch = []
+        if batch:
+            yield ''.join(batch)
+        yield '}}\n'
+    
+    response = current_app.response_class(
+        stream_with_context(generate()), mimetype=current_app.json.mimetype
+    )
+    return response, status_code
+
+
+def conditional_success_response(data=None):
+    """Success response tagged with a weak ETag for conditional GETs.
+    
+    The ETag is derived from the encoded body, so any change in the
+    payload (including runtime stats) yields a new tag. When the client's
+    If-None-Match matches, the body is dropped and 304 is returned.
+    
+    Args:
+        data: The response data
+    
+    Returns:
+        Flask response (200 with ETag, or 304 Not Modified)
+    """
+    response, status_code = success_response(data)
+    response.status_code = status_code
+    response.add_etag(weak=True)
+    return response.make_conditional(request)
 
 
 def error_response(code, message, details=None, status_code=400):
@@ -50,7 +132,7 @@ def error_response(code, message, details=None, status_code=400):
     }
     if details:
         response["error"]["details"] = details
-    return jsonify(response), status_code
+    return _json_response(_dumps(response) + "\n", status_code)
 
 
 def created_response(data, message=None, warnings=None):
@@ -88,15 +88,26 @@ def register_routes(bp):
         """
         # Return a sanitized version of the config (without sensitive information)
         torrent_manager = current_app.config['TORRENT_MANAGER']
-        
-        # Deep copy and mask passwords in download_clients
-        safe_download_clients = {}
-        for name, client_config in torrent_manager.config.get("download_clients", {}).items():
-            safe_client = dict(client_config)
-            safe_client["password"] = "***"  # Mask password
-            safe_download_clients[name] = safe_client
-        
-        safe_config = {
-            "download_clients": safe_download_clients
+        return success_response(_get_sanitized_config(torrent_manager))
+
+
+def _get_sanitized_config(torrent_manager) -> dict:
+    """Build the sanitized /config payload, memoized per config version.
+    
+    The download client config rarely changes, so the masked copy is
+    rebuilt only when torrent_manager.config_version moves.
+    """
+    version = torrent_manager.config_version
+    cached = getattr(torrent_manager, '_sanitized_config_cache', None)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    # Copy each client config and mask its password
+    safe_config = {
+        "download_clients": {
+            name: {**client_config, "password": "***"}
+            for name, client_config in torrent_manager.config.get("download_clients", {}).items()
         }
-        return success_response(safe_config)
+    }
+    torrent_manager._sanitized_config_cache = (version, safe_config)
+    return safe_config
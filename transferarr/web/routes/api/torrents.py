@@ -3,12 +3,30 @@ Torrent routes for listing and status information.
 """
 from flask import current_app
 from transferarr.web.services import NotFoundError, ServiceUnavailableError, TorrentService
-from .responses import not_found_response, success_response, server_error_response, error_response
+from .caching import cached_response
+from .responses import (
+    conditional_success_response, not_found_response, success_response, success_stream_response,
+    server_error_response, error_response
+)
 import logging
 
 logger = logging.getLogger("transferarr")
 
 
+def _get_torrent_service() -> TorrentService:
+    """Get the app-scoped TorrentService, creating it on first use.
+    
+    TorrentService only holds a reference to the torrent manager, so a
+    single instance is shared across requests.
+    """
+    service = current_app.extensions.get('torrent_service')
+    if service is None:
+        service = current_app.extensions.setdefault(
+            'torrent_service', TorrentService(current_app.config['TORRENT_MANAGER'])
+        )
+    return service
+
+
 def register_routes(bp):
     """Register torrent routes with the given blueprint."""
     
@@ -22,6 +40,7 @@ def register_routes(bp):
         return None
 
     @bp.route("/torrents")
+    @cached_response(timeout=2)
     def get_torrents():
         """Get all tracked torrents and their states.
         ---
@@ -29,7 +48,7 @@ def register_routes(bp):
           - Torrents
         responses:
           200:
-            description: List of tracked torrents
+            description: List of tracked torrents (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -80,8 +99,8 @@ def register_routes(bp):
             description: Server error
         """
         try:
-            service = TorrentService(current_app.config['TORRENT_MANAGER'])
-            return success_response(service.list_tracked_torrents())
+            service = _get_torrent_service()
+            return conditional_success_response(service.list_tracked_torrents())
         except Exception as e:
             logger.error(f"Error getting torrents: {e}")
             return server_error_response(str(e))
@@ -117,8 +136,8 @@ def register_routes(bp):
             description: Server error
         """
         try:
-            service = TorrentService(current_app.config['TORRENT_MANAGER'])
-            return success_response(service.get_client_torrents(client_name))
+            service = _get_torrent_service()
+            return success_stream_response(service.get_client_torrents(client_name))
         except NotFoundError as e:
             return not_found_response(e.resource_type, e.identifier)
         except ServiceUnavailableError as e:
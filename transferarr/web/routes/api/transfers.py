@@ -1,12 +1,25 @@
 """
 Transfer history routes for listing and viewing transfer records.
 """
+import base64
+import json
+from datetime import date
+
 from flask import current_app, request
-from .responses import success_response, error_response, not_found_response, server_error_response
+from .caching import cached_response, invalidate_cached_responses
+from .responses import (
+    conditional_success_response, success_response, error_response, not_found_response, server_error_response
+)
 import logging
 
 logger = logging.getLogger("transferarr")
 
+_VALID_STATUSES = frozenset({'pending', 'transferring', 'completed', 'failed', 'cancelled'})
+_VALID_STATUSES_MSG = ', '.join(sorted(_VALID_STATUSES))
+# Statuses clear_transfers may delete (never in-flight transfers)
+_CLEARABLE_STATUSES = frozenset({'completed', 'failed', 'cancelled'})
+_CLEARABLE_STATUSES_MSG = ', '.join(sorted(_CLEARABLE_STATUSES))
+
 
 def register_routes(bp):
     """Register transfer history routes with the given blueprint."""
@@ -77,9 +90,23 @@ def register_routes(bp):
             type: string
             enum: [automatic, manual]
             description: Filter by trigger type
+          - in: query
+            name: cursor
+            type: string
+            description: |
+              Opaque seek cursor from a previous response's next_cursor.
+              When given, page is ignored and results are read directly after
+              the cursor position (only valid with sort=created_at).
+          - in: query
+            name: include_total
+            type: boolean
+            default: true
+            description: |
+              Count all matching transfers. Set to false to skip the count
+              (total and pages are null) and rely on has_more instead.
         responses:
           200:
-            description: Paginated list of transfers
+            description: Paginated list of transfers (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -92,16 +119,22 @@ def register_routes(bp):
                         $ref: '#/definitions/Transfer'
                     total:
                       type: integer
-                      description: Total number of matching transfers
+                      description: Total number of matching transfers (null when include_total=false)
                     page:
                       type: integer
                     per_page:
                       type: integer
                     pages:
                       type: integer
-                      description: Total number of pages
+                      description: Total number of pages (page-based requests only, null when include_total=false)
+                    has_more:
+                      type: boolean
+                      description: Whether another page follows this one
+                    next_cursor:
+                      type: string
+                      description: Cursor for the next page (sort=created_at only), null on the last page
           400:
-            description: Invalid status parameter
+            description: Invalid status, cursor, or sort/cursor combination
           503:
             description: Transfer history service not available
           500:
@@ -123,19 +156,20 @@ def register_routes(bp):
             source = request.args.get('source')
             target = request.args.get('target')
             search = request.args.get('search')
-            from_date = request.args.get('from_date')
-            to_date = request.args.get('to_date')
+            from_date_arg = request.args.get('from_date')
+            to_date_arg = request.args.get('to_date')
             transfer_method = request.args.get('transfer_method')
             trigger = request.args.get('trigger')
             sort = request.args.get('sort', 'created_at')
             order = request.args.get('order', 'desc')
+            cursor = request.args.get('cursor')
+            include_total = request.args.get('include_total', 'true').lower() != 'false'
             
             # Validate status if provided
-            valid_statuses = ('pending', 'transferring', 'completed', 'failed', 'cancelled')
-            if status and status not in valid_statuses:
+            if status and status not in _VALID_STATUSES:
                 return error_response(
                     "VALIDATION_ERROR",
-                    f"Invalid status '{status}'. Must be one of: {', '.join(valid_statuses)}",
+                    f"Invalid status '{status}'. Must be one of: {_VALID_STATUSES_MSG}",
                     status_code=400
                 )
             
@@ -157,7 +191,19 @@ def register_routes(bp):
                     status_code=400
                 )
             
-            transfers, total = history_service.list_transfers(
+            # Parse date bounds up front so malformed values fail fast and
+            # the service gets typed dates for its created_at range scan
+            try:
+                from_date = date.fromisoformat(from_date_arg) if from_date_arg else None
+                to_date = date.fromisoformat(to_date_arg) if to_date_arg else None
+            except ValueError:
+                return error_response(
+                    "VALIDATION_ERROR",
+                    "Invalid date. from_date and to_date must be YYYY-MM-DD",
+                    status_code=400
+                )
+            
+            filters = dict(
                 status=status,
                 source=source,
                 target=target,
@@ -166,21 +212,71 @@ def register_routes(bp):
                 end_date=to_date,
                 transfer_method=transfer_method,
                 trigger=trigger,
-                page=page,
-                per_page=per_page,
-                sort=sort,
-                order=order
             )
             
-            # Calculate total pages
-            pages = (total + per_page - 1) // per_page if per_page > 0 else 0
+            if cursor:
+                if sort != 'created_at':
+                    return error_response(
+                        "VALIDATION_ERROR",
+                        "Cursor pagination only supports sort=created_at",
+                        status_code=400
+                    )
+                try:
+                    after = _decode_cursor(cursor)
+                except ValueError:
+                    return error_response("VALIDATION_ERROR", "Invalid cursor", status_code=400)
+                
+                transfers, total, next_key = history_service.list_transfers_keyset(
+                    **filters,
+                    after=after,
+                    per_page=per_page,
+                    order=order,
+                    include_total=include_total
+                )
+                return conditional_success_response({
+                    "transfers": transfers,
+                    "total": total,
+                    "per_page": per_page,
+                    "has_more": next_key is not None,
+                    "next_cursor": _encode_cursor(next_key) if next_key else None
+                })
             
-            return success_response({
+            if include_total:
+                transfers, total = history_service.list_transfers(
+                    **filters,
+                    page=page,
+                    per_page=per_page,
+                    sort=sort,
+                    order=order
+                )
+                # Calculate total pages
+                pages = (total + per_page - 1) // per_page if per_page > 0 else 0
+                has_more = page * per_page < total
+            else:
+                # Probe one row past the page instead of counting
+                transfers, has_more = history_service.list_transfers_probe(
+                    **filters,
+                    page=page,
+                    per_page=per_page,
+                    sort=sort,
+                    order=order
+                )
+                total = pages = None
+            
+            # Let clients switch to seek pagination from here on
+            next_cursor = None
+            if sort == 'created_at' and transfers and has_more:
+                last = transfers[-1]
+                next_cursor = _encode_cursor((last['created_at'], last['id']))
+            
+            return conditional_success_response({
                 "transfers": transfers,
                 "total": total,
                 "page": page,
                 "per_page": per_page,
-                "pages": pages
+                "pages": pages,
+                "has_more": has_more,
+                "next_cursor": next_cursor
             })
         except Exception as e:
             logger.error(f"Error listing transfers: {e}")
@@ -194,7 +290,7 @@ def register_routes(bp):
           - Transfers
         responses:
           200:
-            description: List of active transfers
+            description: List of active transfers (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -217,12 +313,13 @@ def register_routes(bp):
                 )
             
             transfers = history_service.get_active_transfers()
-            return success_response(transfers)
+            return conditional_success_response(transfers)
         except Exception as e:
             logger.error(f"Error getting active transfers: {e}")
             return server_error_response(str(e))
     
     @bp.route("/transfers/stats")
+    @cached_response(timeout=5, query_string=True)
     def get_transfer_stats():
         """Get aggregate transfer statistics.
         ---
@@ -230,7 +327,7 @@ def register_routes(bp):
           - Transfers
         responses:
           200:
-            description: Transfer statistics
+            description: Transfer statistics (weak ETag set; 304 on matching If-None-Match)
             schema:
               type: object
               properties:
@@ -273,7 +370,7 @@ def register_routes(bp):
                 )
             
             stats = history_service.get_stats()
-            return success_response(stats)
+            return conditional_success_response(stats)
         except Exception as e:
             logger.error(f"Error getting transfer stats: {e}")
             return server_error_response(str(e))
@@ -371,22 +468,19 @@ def register_routes(bp):
                     status_code=503
                 )
             
-            # Check if transfer exists
-            transfer = history_service.get_transfer(transfer_id)
-            if not transfer:
-                return not_found_response("Transfer", transfer_id)
-            
             # Block deletion of active transfers unless force=true
             force = request.args.get('force', 'false').lower() == 'true'
-            if not force and transfer['status'] in ('pending', 'transferring'):
+            result = history_service.delete_transfer_conditional(transfer_id, force=force)
+            if result == 'not_found':
+                return not_found_response("Transfer", transfer_id)
+            if result == 'active':
                 return error_response(
                     "VALIDATION_ERROR",
                     "Cannot delete active transfer. Wait for it to complete, or use force=true to delete stuck transfers.",
                     status_code=400
                 )
             
-            deleted = history_service.delete_transfer(transfer_id)
-            # We already checked existence above, so this should always succeed
+            invalidate_cached_responses("get_transfer_stats")
             
             return success_response({"deleted": True}, f"Transfer {transfer_id} deleted")
         except Exception as e:
@@ -437,14 +531,15 @@ def register_routes(bp):
             status = request.args.get('status')
             
             # Validate status if provided
-            if status and status not in ('completed', 'failed', 'cancelled'):
+            if status and status not in _CLEARABLE_STATUSES:
                 return error_response(
                     "VALIDATION_ERROR",
-                    f"Invalid status '{status}'. Must be one of: completed, failed, cancelled",
+                    f"Invalid status '{status}'. Must be one of: {_CLEARABLE_STATUSES_MSG}",
                     status_code=400
                 )
             
             deleted_count = history_service.clear_history(status)
+            invalidate_cached_responses("get_transfer_stats")
             
             status_msg = f" with status '{status}'" if status else ""
             return success_response(
@@ -456,9 +551,34 @@ def register_routes(bp):
             return server_error_response(str(e))
 
 
+def _encode_cursor(key: tuple) -> str:
+    """Encode a (created_at, id) seek key as an opaque URL-safe token."""
+    return base64.urlsafe_b64encode(json.dumps(list(key)).encode()).decode()
+
+
+def _decode_cursor(token: str) -> tuple:
+    """Decode a cursor token back to its (created_at, id) seek key.
+    
+    Raises:
+        ValueError: If the token is malformed
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode()))
+    except ValueError as e:  # binascii.Error, UnicodeDecodeError, JSONDecodeError
+        raise ValueError("Invalid cursor") from e
+    if not (isinstance(key, list) and len(key) == 2 and all(isinstance(k, str) for k in key)):
+        raise ValueError("Invalid cursor")
+    return tuple(key)
+
+
 def _get_history_service():
-    """Get the history service from the torrent manager."""
-    torrent_manager = current_app.config.get('TORRENT_MANAGER')
-    if torrent_manager:
-        return getattr(torrent_manager, 'history_service', None)
-    return None
+    """Get the history service, resolved once per app.
+    
+    create_app registers it in ``app.extensions``; apps assembled without
+    the factory resolve it from the torrent manager on first use.
+    """
+    extensions = current_app.extensions
+    if 'history_service' not in extensions:
+        torrent_manager = current_app.config.get('TORRENT_MANAGER')
+        extensions.setdefault('history_service', getattr(torrent_manager, 'history_service', None))
+    return extensions['history_service']
@@ -3,7 +3,7 @@ Utility routes for file browsing and other helpers.
 """
 from flask import request
 from transferarr.utils import connection_modal_browse
-from .responses import success_response, validation_error_response, server_error_response
+from .responses import success_response, not_found_response, validation_error_response, server_error_response
 import logging
 
 logger = logging.getLogger("transferarr")
@@ -78,8 +78,10 @@ def register_routes(bp):
             description: Server error
         """
         try:
-            data = request.json
-            if not data:
+            # silent=True: malformed or non-JSON bodies come back as None
+            # instead of raising, and are rejected as a validation error
+            data = request.get_json(silent=True)
+            if not data or not isinstance(data, dict):
                 return validation_error_response("Invalid request data")
             
             # Validate required fields
@@ -94,24 +96,20 @@ def register_routes(bp):
             connection_type = data.get("type", "local")
             connection_config = data.get("config", {})
 
-            # connection_modal_browse returns Flask Response objects (jsonify)
-            # We need to extract the data and wrap it in our envelope
             result = connection_modal_browse(path, connection_type, connection_config)
             
-            # Handle tuple (response, status_code) for errors
+            # Handle tuple (data, status_code) for errors
             if isinstance(result, tuple):
-                response_obj, status_code = result
-                response_data = response_obj.get_json()
+                response_data, status_code = result
                 if status_code >= 400:
                     error_msg = response_data.get("error", "Unknown error")
                     if status_code == 404:
-                        from .responses import not_found_response
-                        return not_found_response(error_msg)
+                        return not_found_response("Path", path)
                     return validation_error_response(error_msg)
                 return success_response(response_data)
             
-            # Single Response object - success case
-            return success_response(result.get_json())
+            # Plain dict - success case
+            return success_response(result)
                 
         except Exception as e:
             logger.error(f"Error in browse_directory: {e}")
@@ -5,12 +5,22 @@ This module provides the @validate_json decorator that validates
 incoming request JSON against a marshmallow schema before the
 route handler executes.
 """
-from functools import wraps
+from functools import lru_cache, wraps
 from flask import request
 from marshmallow import ValidationError
 from .responses import error_response
 
 
+@lru_cache(maxsize=None)
+def _schema_for(schema_class):
+    """Return a shared instance of schema_class.
+    
+    Schemas carry no per-request state for load(), so one instance per
+    class is reused instead of re-running field setup on every request.
+    """
+    return schema_class()
+
+
 def validate_json(schema_class):
     """Decorator to validate request JSON against a marshmallow schema.
     
@@ -30,15 +40,24 @@ def validate_json(schema_class):
     On validation failure:
         Returns 400 error response with VALIDATION_ERROR code and
         detailed error messages in the details field.
+    
+    On a non-JSON Content-Type:
+        Returns 415 error response without reading the body.
     """
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            schema = schema_class()
+            if not request.is_json:
+                return error_response(
+                    code="UNSUPPORTED_MEDIA_TYPE",
+                    message="Expected application/json request body",
+                    status_code=415
+                )
+            schema = _schema_for(schema_class)
             try:
-                # Load and validate the request JSON
+                # Load and validate the request JSON (malformed bodies validate as {})
                 # schema.load() returns deserialized data and raises ValidationError on failure
-                data = schema.load(request.json or {})
+                data = schema.load(request.get_json(silent=True) or {}, partial=False)
                 # Attach validated data to request for handler to use
                 request.validated_data = data
             except ValidationError as err:
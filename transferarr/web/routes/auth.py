@@ -1,14 +1,47 @@
 """Authentication routes for login, logout, and first-run setup."""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
 from flask import Blueprint, render_template, redirect, url_for, request, flash, current_app, session
 from flask_login import login_user, logout_user, login_required, current_user
 
 from transferarr.auth import (
-    User, verify_password, hash_password, get_auth_config,
+    LoginRateLimiter, User, verify_credentials, hash_password, needs_rehash,
     is_auth_enabled, is_auth_configured, save_auth_config
 )
 
 auth_bp = Blueprint('auth', __name__)
 
+# bcrypt checks run on a small shared pool, so a burst of logins queues up
+# instead of occupying every CPU that other requests need
+PASSWORD_VERIFY_WORKERS = min(4, os.cpu_count() or 1)
+# Checks running or queued at once; beyond this, logins get 503 straight away.
+# At ~0.4s per check a full queue drains well inside the timeout.
+PASSWORD_VERIFY_MAX_PENDING = 2 * PASSWORD_VERIFY_WORKERS
+PASSWORD_VERIFY_TIMEOUT = 5  # seconds, including time spent queued
+
+
+def _get_password_pool() -> ThreadPoolExecutor:
+    """Get the app-scoped password verification pool, creating it on first use."""
+    pool = current_app.extensions.get('password_pool')
+    if pool is None:
+        pool = current_app.extensions.setdefault('password_pool', ThreadPoolExecutor(
+            max_workers=PASSWORD_VERIFY_WORKERS,
+            thread_name_prefix='password-verify',
+        ))
+    return pool
+
+
+def _get_password_slots() -> threading.BoundedSemaphore:
+    """Get the app-scoped cap on pending password checks, creating it on first use."""
+    slots = current_app.extensions.get('password_slots')
+    if slots is None:
+        slots = current_app.extensions.setdefault(
+            'password_slots', threading.BoundedSemaphore(PASSWORD_VERIFY_MAX_PENDING)
+        )
+    return slots
+
 
 def needs_setup() -> bool:
     """Check if first-run setup is needed.
@@ -18,6 +51,24 @@ def needs_setup() -> bool:
     return not is_auth_configured(current_app.config['APP_CONFIG'])
 
 
+def _get_login_limiter() -> LoginRateLimiter:
+    """Get the app-scoped login rate limiter, creating it on first use."""
+    limiter = current_app.extensions.get('login_limiter')
+    if limiter is None:
+        limiter = current_app.extensions.setdefault('login_limiter', LoginRateLimiter())
+    return limiter
+
+
+def _log_in(username: str, remember: bool) -> None:
+    """Log in a user with a permanent (timeout-bound) session.
+    
+    The session is marked permanent before login_user writes to it, so
+    both changes land in the single session save at the end of the request.
+    """
+    session.permanent = True  # Enable session timeout
+    login_user(User(username), remember=remember)
+
+
 @auth_bp.route('/setup', methods=['GET', 'POST'])
 def setup():
     """First-run setup page.
@@ -64,9 +115,7 @@ def setup():
                 })
                 
                 # Log in the user
-                user = User(username)
-                login_user(user, remember=True)
-                session.permanent = True  # Enable session timeout
+                _log_in(username, remember=True)
                 
                 flash('Authentication configured successfully', 'success')
                 return redirect(url_for('ui.dashboard_page'))
@@ -99,12 +148,38 @@ def login():
         password = request.form.get('password', '')
         remember = request.form.get('remember', False) == 'on'
         
-        auth_config = get_auth_config(current_app.config['APP_CONFIG'])
+        # Throttle per client before doing any bcrypt work (remote_addr is the
+        # real client when auth.trusted_proxies enables ProxyFix)
+        limiter = _get_login_limiter()
+        client_key = request.remote_addr
+        if not limiter.allow(client_key):
+            flash('Too many login attempts, please wait a minute and try again', 'error')
+            return render_template('pages/login.html'), 429
         
-        if username == auth_config['username'] and verify_password(password, auth_config['password_hash']):
-            user = User(username)
-            login_user(user, remember=remember)
-            session.permanent = True  # Enable session timeout
+        config = current_app.config['APP_CONFIG']
+        slots = _get_password_slots()
+        if not slots.acquire(blocking=False):
+            flash('Too many login attempts in progress, please try again', 'error')
+            return render_template('pages/login.html'), 503
+        future = _get_password_pool().submit(verify_credentials, config, username, password)
+        # Runs on completion or cancellation, so every slot is given back
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            valid = future.result(timeout=PASSWORD_VERIFY_TIMEOUT)
+        except FutureTimeoutError:
+            # Drop the check if it is still queued; a running one can't be stopped
+            future.cancel()
+            flash('Too many login attempts in progress, please try again', 'error')
+            return render_template('pages/login.html'), 503
+        
+        if valid:
+            limiter.reset(client_key)
+            
+            # Upgrade hashes created with a lower cost than the configured one
+            if needs_rehash(config['auth']['password_hash']):
+                save_auth_config(config, {'password_hash': hash_password(password)})
+            
+            _log_in(username, remember=remember)
             
             # Redirect to requested page or dashboard
             # Sanitize next_page to prevent open redirect attacks
@@ -1,9 +1,23 @@
 from functools import wraps
 
-from flask import Blueprint, render_template, redirect, url_for, current_app
-from flask_login import login_required
+from flask import Blueprint, render_template, redirect, request, url_for, current_app
+from flask_login import current_user, login_required
 
-from transferarr.auth import is_auth_enabled, is_auth_configured
+from transferarr.auth import get_auth_config_version, get_auth_state
+
+
+def _get_auth_state():
+    """Get (auth configured, auth enabled) for the current app.
+    
+    Both flags only change through save_auth_config, so they are cached in
+    app.extensions and recomputed when the auth config version moves.
+    """
+    version = get_auth_config_version()
+    cached = current_app.extensions.get('auth_state')
+    if cached is None or cached[0] != version:
+        cached = (version, *get_auth_state(current_app.config['APP_CONFIG']))
+        current_app.extensions['auth_state'] = cached
+    return cached[1], cached[2]
 
 
 def auth_required(f):
@@ -11,18 +25,54 @@ def auth_required(f):
     
     Also redirects to setup page if auth is not yet configured.
     """
+    # Wrap once at decoration time; the enabled flag picks a variant per request
+    protected = login_required(f)
+    
     @wraps(f)
     def decorated_function(*args, **kwargs):
+        configured, enabled = _get_auth_state()
         # Redirect to setup if not configured
-        if not is_auth_configured(current_app.config['APP_CONFIG']):
+        if not configured:
             return redirect(url_for('auth.setup'))
         # Apply login_required if auth is enabled
-        if is_auth_enabled(current_app.config['APP_CONFIG']):
-            return login_required(f)(*args, **kwargs)
+        if enabled:
+            return protected(*args, **kwargs)
         return f(*args, **kwargs)
     return decorated_function
 
 
+# Rendered pages kept before the page cache is emptied and refilled
+PAGE_CACHE_MAX_ENTRIES = 64
+
+
+def _render_page(template_name):
+    """Render a UI page, reusing earlier output for the same request context.
+    
+    Page templates take no arguments; their output only depends on the
+    logged-in user (sidebar), the URL prefix url_for() builds links with
+    and the request path (active nav item). The rendered HTML is cached in
+    app.extensions under those, and dropped whenever the auth config
+    changes. Caching is skipped when templates auto-reload.
+    """
+    if current_app.jinja_env.auto_reload:
+        return render_template(template_name)
+    
+    version = get_auth_config_version()
+    cached = current_app.extensions.get('page_cache')
+    if cached is None or cached[0] != version or len(cached[1]) >= PAGE_CACHE_MAX_ENTRIES:
+        cached = (version, {})
+        current_app.extensions['page_cache'] = cached
+    pages = cached[1]
+    
+    user_id = current_user.id if current_user.is_authenticated else None
+    key = (template_name, user_id, request.script_root, request.path)
+    html = pages.get(key)
+    if html is None:
+        html = render_template(template_name)
+        pages[key] = html
+    return html
+
+
 ui_bp = Blueprint('ui', __name__)
 
 
@@ -30,25 +80,25 @@ ui_bp = Blueprint('ui', __name__)
 @auth_required
 def dashboard_page():
     """Render the dashboard page."""
-    return render_template("pages/dashboard.html")
+    return _render_page("pages/dashboard.html")
 
 
 @ui_bp.route("/torrents")
 @auth_required
 def torrents_page():
     """Render the torrents page."""
-    return render_template("pages/torrents.html")
+    return _render_page("pages/torrents.html")
 
 
 @ui_bp.route("/history")
 @auth_required
 def history_page():
     """Render the transfer history page."""
-    return render_template("pages/history.html")
+    return _render_page("pages/history.html")
 
 
 @ui_bp.route("/settings")
 @auth_required
 def settings_page():
     """Render the settings page."""
-    return render_template("pages/settings.html")
\ No newline at end of file
+    return _render_page("pages/settings.html")
\ No newline at end of file
@@ -3,37 +3,90 @@ Service for transfer connection CRUD operations.
 """
 from transferarr.services.transfer_connection import TransferConnection, test_torrent_client_connectivity, _test_sftp_connectivity, _test_local_state_dir, is_torrent_transfer
 from . import NotFoundError, ConflictError, ConfigSaveError
-import copy
+import threading
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Optional
+
+
+# Transfer config sections that may carry SFTP credentials: "source" for
+# torrent transfers, "from"/"to" for file transfers
+_SFTP_SECTIONS = ("source", "from", "to")
 
 
 def _mask_sftp_passwords(transfer_config: dict) -> dict:
-    """Deep copy transfer_config and mask any SFTP passwords.
+    """Copy transfer_config with any SFTP passwords masked.
     
-    Handles both file transfer configs (from/to SFTP) and
-    torrent configs (source.sftp).
+    Only the dicts on the path to a masked password are copied; everything
+    else is shared with the original, which is never mutated. Handles both
+    file transfer configs (from/to SFTP) and torrent configs (source.sftp).
     """
-    safe_config = copy.deepcopy(transfer_config)
-    # Torrent config: mask source.sftp password
-    if (safe_config.get("source", {}) or {}).get("sftp", {}).get("password"):
-        safe_config["source"]["sftp"]["password"] = "***"
-    # File transfer config: mask from/to SFTP passwords
-    if (safe_config.get("from", {}).get("sftp") or {}).get("password"):
-        safe_config["from"]["sftp"]["password"] = "***"
-    if (safe_config.get("to", {}).get("sftp") or {}).get("password"):
-        safe_config["to"]["sftp"]["password"] = "***"
+    safe_config = dict(transfer_config)
+    for section_name in _SFTP_SECTIONS:
+        section = safe_config.get(section_name)
+        if not isinstance(section, dict):
+            continue
+        sftp = section.get("sftp")
+        if isinstance(sftp, dict) and sftp.get("password"):
+            safe_config[section_name] = {**section, "sftp": {**sftp, "password": "***"}}
     return safe_config
 
 
-def _find_connection_by_name(connections: dict, name: str) -> tuple:
-    """Case-insensitive connection lookup.
+# File-transfer path attributes, in ConnectionView field order
+_PATH_ATTRS = attrgetter(
+    "source_dot_torrent_path", "source_torrent_download_path",
+    "destination_dot_torrent_tmp_dir", "destination_torrent_download_path",
+)
+_NO_PATHS = (None, None, None, None)
+
+
+@dataclass
+class ConnectionView:
+    """Read-only API view of a runtime connection.
     
-    Returns:
-        (actual_name, connection) or (None, None) if not found
+    Slotted so large connection listings polled by the UI stay cheap.
+    Path fields are None for torrent transfers and omitted from to_dict().
     """
-    for conn_name, conn in connections.items():
-        if conn_name.lower() == name.lower():
-            return conn_name, conn
-    return None, None
+    __slots__ = (
+        "name", "from_client", "to_client", "transfer_config", "transfer_type",
+        "active_transfers", "max_transfers", "total_transfers", "status",
+        "source_dot_torrent_path", "source_torrent_download_path",
+        "destination_dot_torrent_tmp_dir", "destination_torrent_download_path",
+    )
+    name: str
+    from_client: str
+    to_client: str
+    transfer_config: dict
+    transfer_type: str
+    active_transfers: int
+    max_transfers: int
+    total_transfers: int
+    status: str
+    source_dot_torrent_path: Optional[str]
+    source_torrent_download_path: Optional[str]
+    destination_dot_torrent_tmp_dir: Optional[str]
+    destination_torrent_download_path: Optional[str]
+    
+    def to_dict(self) -> dict:
+        """Serialize to the API response shape (from/to keys)."""
+        result = {
+            "name": self.name,
+            "from": self.from_client,
+            "to": self.to_client,
+            "transfer_config": self.transfer_config,
+            "transfer_type": self.transfer_type,
+            "active_transfers": self.active_transfers,
+            "max_transfers": self.max_transfers,
+            "total_transfers": self.total_transfers,
+            "status": self.status,
+        }
+        # Include path fields only for file transfers
+        if self.transfer_type == "file":
+            result["source_dot_torrent_path"] = self.source_dot_torrent_path
+            result["source_torrent_download_path"] = self.source_torrent_download_path
+            result["destination_dot_torrent_tmp_dir"] = self.destination_dot_torrent_tmp_dir
+            result["destination_torrent_download_path"] = self.destination_torrent_download_path
+        return result
 
 
 def _build_chain_warning(
@@ -96,38 +149,125 @@ class ConnectionService:
     
     def __init__(self, torrent_manager):
         self.torrent_manager = torrent_manager
+        # Lowercase name -> actual names; built lazily, then kept current by
+        # add/update/delete and rebuilt only if the runtime connections change
+        # behind the service's back
+        self._name_index: Optional[dict[str, list]] = None
+        self._indexed_count = 0
+        self._name_index_lock = threading.Lock()
+        # Connection name -> (transfer_config, masked copy) from the last listing
+        self._mask_cache: dict[str, tuple] = {}
+    
+    def _name_matches(self, key: str) -> list:
+        """Actual connection names whose lowercase form is ``key``."""
+        connections = self.torrent_manager.connections
+        with self._name_index_lock:
+            index = self._name_index
+            matches = index.get(key) if index is not None else None
+            if (index is None or self._indexed_count != len(connections)
+                    or (matches and any(match not in connections for match in matches))):
+                index = {}
+                for conn_name in connections:
+                    index.setdefault(conn_name.lower(), []).append(conn_name)
+                self._name_index = index
+                self._indexed_count = len(connections)
+                matches = index.get(key)
+            return list(matches or ())
+    
+    def _index_add(self, name: str) -> None:
+        """Record a connection added to the runtime state."""
+        with self._name_index_lock:
+            if self._name_index is None:
+                return
+            names = self._name_index.setdefault(name.lower(), [])
+            if name not in names:
+                names.append(name)
+            self._indexed_count = len(self.torrent_manager.connections)
+    
+    def _index_remove(self, name: str) -> None:
+        """Forget a connection removed from the runtime state."""
+        with self._name_index_lock:
+            if self._name_index is None:
+                return
+            names = self._name_index.get(name.lower(), [])
+            if name in names:
+                names.remove(name)
+                if not names:
+                    del self._name_index[name.lower()]
+            self._indexed_count = len(self.torrent_manager.connections)
+    
+    def _find_connection(self, name: str) -> tuple:
+        """Case-insensitive connection lookup.
+        
+        Uses the lowercase name index. An exact match wins over names that
+        differ only by case.
+        
+        Returns:
+            (actual_name, connection) or (None, None) if not found
+            
+        Raises:
+            ConflictError: Several connections match and none exactly
+        """
+        matches = self._name_matches(name.lower())
+        if not matches:
+            return None, None
+        if name in matches:
+            actual_name = name
+        elif len(matches) == 1:
+            actual_name = matches[0]
+        else:
+            raise ConflictError(
+                f"Connection name '{name}' is ambiguous: matches {', '.join(matches)}"
+            )
+        connection = self.torrent_manager.connections.get(actual_name)
+        if connection is None:
+            return None, None
+        return actual_name, connection
     
     def list_connections(self) -> list:
-        """Get all connections with masked passwords and runtime stats."""
+        """Get all connections with masked passwords and runtime stats.
+        
+        Returns:
+            List of ConnectionView (use to_dict() for the API shape)
+        """
         connections_data = []
+        mask_cache = {}
         for name, connection in self.torrent_manager.connections.items():
             # Determine transfer_type for API response:
             # runtime transfer_type is "sftp" for all file transfers, "torrent" for torrent
             # normalize "sftp" -> "file" for the API since SFTP/local is a config detail
-            transfer_type = "torrent" if connection.is_torrent_transfer else "file"
-            
-            conn_data = {
-                "name": name,
-                "from": connection.from_client.name,
-                "to": connection.to_client.name,
-                "transfer_config": _mask_sftp_passwords(connection.transfer_config),
-                "transfer_type": transfer_type,
-                "active_transfers": connection.get_active_transfers_count(),
-                "max_transfers": connection.max_transfers,
-                "total_transfers": connection.get_total_transfers_count(),
-                "status": "active"
-            }
+            is_file = not connection.is_torrent_transfer
+            paths = _PATH_ATTRS(connection) if is_file else _NO_PATHS
             
-            # Include path fields only for file transfers
-            if not connection.is_torrent_transfer:
-                conn_data["source_dot_torrent_path"] = connection.source_dot_torrent_path
-                conn_data["source_torrent_download_path"] = connection.source_torrent_download_path
-                conn_data["destination_dot_torrent_tmp_dir"] = connection.destination_dot_torrent_tmp_dir
-                conn_data["destination_torrent_download_path"] = connection.destination_torrent_download_path
-            
-            connections_data.append(conn_data)
+            connections_data.append(ConnectionView(
+                name,
+                connection.from_client.name,
+                connection.to_client.name,
+                self._masked_transfer_config(name, connection.transfer_config, mask_cache),
+                "file" if is_file else "torrent",
+                connection.get_active_transfers_count(),
+                connection.max_transfers,
+                connection.get_total_transfers_count(),
+                "active",
+                *paths,
+            ))
+        # Drop entries for connections that no longer exist
+        self._mask_cache = mask_cache
         return connections_data
     
+    def _masked_transfer_config(self, name: str, transfer_config: dict, mask_cache: dict) -> dict:
+        """Return the masked transfer_config for a connection, reusing the last result.
+        
+        Connections are rebuilt with a new transfer_config whenever they are
+        edited, so the cached copy is reused only while it was made from the
+        very same config object.
+        """
+        cached = self._mask_cache.get(name)
+        if cached is None or cached[0] is not transfer_config:
+            cached = (transfer_config, _mask_sftp_passwords(transfer_config))
+        mask_cache[name] = cached
+        return cached[1]
+    
     def add_connection(self, data: dict) -> dict:
         """Add a new connection.
         
@@ -148,8 +288,7 @@ class ConnectionService:
         transfer_config = data["transfer_config"]
         
         # Case-insensitive uniqueness check
-        existing_names = {n.lower() for n in self.torrent_manager.connections.keys()}
-        if name.lower() in existing_names:
+        if self._find_connection(name)[0] is not None:
             raise ConflictError(f"Connection '{name}' already exists")
         
         # Validate clients exist
@@ -172,12 +311,10 @@ class ConnectionService:
             connection_config["destination_dot_torrent_tmp_dir"] = data["destination_dot_torrent_tmp_dir"]
             connection_config["destination_torrent_download_path"] = data["destination_torrent_download_path"]
         
-        # Update config
-        updated_config = dict(self.torrent_manager.config)
-        existing_connections = updated_config.get("connections")
-        updated_connections = dict(existing_connections) if isinstance(existing_connections, dict) else {}
+        # Update config (copy only the connections mapping being changed)
+        updated_connections = self._copy_config_connections()
         updated_connections[name] = connection_config
-        updated_config["connections"] = updated_connections
+        updated_config = {**self.torrent_manager.config, "connections": updated_connections}
 
         warnings = _build_chain_warnings(updated_connections, from_client, to_client)
         
@@ -192,6 +329,7 @@ class ConnectionService:
         from_client_obj.add_connection(new_connection)
         to_client_obj.add_connection(new_connection)
         self.torrent_manager.connections[name] = new_connection
+        self._index_add(name)
         
         return {
             "connection": {"name": name, "from": from_client, "to": to_client},
@@ -213,7 +351,7 @@ class ConnectionService:
             ConflictError: New name conflicts with existing
             ConfigSaveError: Failed to save config
         """
-        actual_name, connection = _find_connection_by_name(self.torrent_manager.connections, name)
+        actual_name, connection = self._find_connection(name)
         if not connection:
             raise NotFoundError("Connection", name)
         
@@ -225,9 +363,8 @@ class ConnectionService:
         # Handle renaming
         final_name = new_name.strip() if new_name else actual_name
         if final_name.lower() != actual_name.lower():
-            for existing_name in self.torrent_manager.connections.keys():
-                if existing_name.lower() == final_name.lower():
-                    raise ConflictError(f"Connection '{final_name}' already exists")
+            if self._find_connection(final_name)[0] is not None:
+                raise ConflictError(f"Connection '{final_name}' already exists")
         
         # Validate clients
         if from_client not in self.torrent_manager.download_clients:
@@ -235,9 +372,7 @@ class ConnectionService:
         if to_client not in self.torrent_manager.download_clients:
             raise NotFoundError("Client", to_client)
         
-        updated_config = dict(self.torrent_manager.config)
-        existing_connections = updated_config.get("connections")
-        updated_connections = dict(existing_connections) if isinstance(existing_connections, dict) else {}
+        updated_connections = self._copy_config_connections()
         existing_conn_config = updated_connections.get(actual_name, {})
         
         # Preserve SFTP passwords if masked/empty (handles both file from/to and torrent source.sftp)
@@ -261,7 +396,7 @@ class ConnectionService:
         if actual_name != final_name:
             del updated_connections[actual_name]
         updated_connections[final_name] = connection_config
-        updated_config["connections"] = updated_connections
+        updated_config = {**self.torrent_manager.config, "connections": updated_connections}
 
         warnings = _build_chain_warnings(updated_connections, from_client, to_client)
         
@@ -277,6 +412,7 @@ class ConnectionService:
         to_client_obj = self.torrent_manager.download_clients[to_client]
         new_connection = TransferConnection(final_name, connection_config, from_client_obj, to_client_obj)
         self.torrent_manager.connections[final_name] = new_connection
+        self._index_add(final_name)
         from_client_obj.add_connection(new_connection)
         to_client_obj.add_connection(new_connection)
         
@@ -295,12 +431,15 @@ class ConnectionService:
             NotFoundError: Connection not found
             ConfigSaveError: Failed to save config
         """
-        actual_name, connection = _find_connection_by_name(self.torrent_manager.connections, name)
+        actual_name, connection = self._find_connection(name)
         if not connection:
             raise NotFoundError("Connection", name)
         
-        updated_config = dict(self.torrent_manager.config)
-        del updated_config["connections"][actual_name]
+        # Copy the connections mapping so the runtime config is untouched
+        # unless the save succeeds
+        updated_connections = self._copy_config_connections()
+        updated_connections.pop(actual_name, None)
+        updated_config = {**self.torrent_manager.config, "connections": updated_connections}
         
         if not self.torrent_manager.save_config(updated_config):
             raise ConfigSaveError("Failed to save configuration")
@@ -343,7 +482,7 @@ class ConnectionService:
             source = transfer_config.get("source")
             # Resolve stored SFTP password if editing an existing connection
             if source and source.get("type") == "sftp" and source.get("sftp") and existing_name:
-                actual_name, _ = _find_connection_by_name(self.torrent_manager.connections, existing_name)
+                actual_name, _ = self._find_connection(existing_name)
                 if actual_name:
                     stored_config = self.torrent_manager.config.get("connections", {}).get(actual_name, {})
                     stored_source = stored_config.get("transfer_config", {}).get("source", {})
@@ -355,7 +494,7 @@ class ConnectionService:
         # File transfer: create temp TransferConnection and test SFTP/local connectivity
         # Look up stored passwords if editing
         if existing_name:
-            actual_name, _ = _find_connection_by_name(self.torrent_manager.connections, existing_name)
+            actual_name, _ = self._find_connection(existing_name)
             if actual_name:
                 stored_config = self.torrent_manager.config.get("connections", {}).get(actual_name, {})
                 transfer_config = self._preserve_sftp_passwords(transfer_config, stored_config)
@@ -440,6 +579,11 @@ class ConnectionService:
         
         return transfer_config
     
+    def _copy_config_connections(self) -> dict:
+        """Shallow copy of the config's connections mapping ({} if missing)."""
+        connections = self.torrent_manager.config.get("connections")
+        return dict(connections) if isinstance(connections, dict) else {}
+    
     def _cleanup_connection(self, name: str) -> None:
         """Remove connection from runtime state."""
         if name not in self.torrent_manager.connections:
@@ -453,3 +597,4 @@ class ConnectionService:
         connection.from_client.remove_connection(connection)
         connection.to_client.remove_connection(connection)
         del self.torrent_manager.connections[name]
+        self._index_remove(name)
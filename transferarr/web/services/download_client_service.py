@@ -7,6 +7,15 @@ from transferarr.clients.config import ClientConfig
 from . import NotFoundError, ConflictError, ValidationError, ConfigSaveError
 
 
+def _require_supported_type(client_type: str) -> None:
+    """Raise ValidationError unless client_type is a registered client type."""
+    if not ClientRegistry.is_supported(client_type):
+        raise ValidationError(
+            f"Unsupported client type: {client_type}. "
+            f"Supported: {ClientRegistry.get_supported_types_text()}"
+        )
+
+
 class DownloadClientService:
     """Service for managing download clients."""
     
@@ -15,19 +24,8 @@ class DownloadClientService:
     
     def _serialize_client(self, client: DownloadClientBase) -> dict:
         """Serialize a client to dict with masked password."""
-        result = {
-            "name": client.name,
-            "type": client.type,
-            "host": client.host,
-            "port": client.port,
-            "username": client.username,
-            "password": "***",
-        }
-        # Include connection_type if the client has it (Deluge-specific)
-        if hasattr(client, 'connection_type'):
-            result["connection_type"] = client.connection_type
-        # Include delete_cross_seeds setting
-        result["delete_cross_seeds"] = client.delete_cross_seeds
+        result = {field: getattr(client, field) for field in client.API_FIELDS}
+        result["password"] = "***"
         return result
     
     def _create_client_config(self, name: str, data: dict) -> ClientConfig:
@@ -55,6 +53,11 @@ class DownloadClientService:
         config = self._create_client_config(name, data)
         return ClientRegistry.create(config)
     
+    def _copy_config_clients(self) -> dict:
+        """Shallow copy of the config's download_clients mapping ({} if missing)."""
+        clients = self.torrent_manager.config.get("download_clients")
+        return dict(clients) if isinstance(clients, dict) else {}
+    
     def list_clients(self) -> dict:
         """Get all download clients with masked passwords."""
         return {
@@ -91,21 +94,19 @@ class DownloadClientService:
             raise ConflictError(f"Client with name '{name}' already exists")
         
         client_type = client_data.get("type", "deluge")
-        if not ClientRegistry.is_supported(client_type):
-            supported = ", ".join(ClientRegistry.get_supported_types())
-            raise ValidationError(f"Unsupported client type: {client_type}. Supported: {supported}")
+        _require_supported_type(client_type)
         
-        # Update config
-        updated_config = dict(self.torrent_manager.config)
-        if "download_clients" not in updated_config:
-            updated_config["download_clients"] = {}
-        updated_config["download_clients"][name] = client_data
+        # Update config (copy only the clients mapping being changed)
+        updated_clients = self._copy_config_clients()
+        updated_clients[name] = client_data
+        updated_config = {**self.torrent_manager.config, "download_clients": updated_clients}
         
         if not self.torrent_manager.save_config(updated_config):
             raise ConfigSaveError("Failed to save configuration")
         
         # Update runtime state
         self.torrent_manager.config.update(updated_config)
+        self.torrent_manager.bump_config_version()
         self.torrent_manager.download_clients[name] = self._create_client_instance(name, client_data)
         
         return {"name": name, **client_data, "password": "***"}
@@ -124,35 +125,44 @@ class DownloadClientService:
             NotFoundError: Client not found
             ConfigSaveError: Failed to save config
         """
-        updated_config = dict(self.torrent_manager.config)
+        updated_clients = self._copy_config_clients()
         
-        if name not in updated_config.get("download_clients", {}):
+        if name not in updated_clients:
             raise NotFoundError("Client", name)
         
         # Preserve password if not provided
         if not client_data.get("password"):
-            client_data["password"] = updated_config["download_clients"][name].get("password", "")
+            client_data["password"] = updated_clients[name].get("password", "")
+        
+        # Unchanged settings (e.g. a form re-submitted as is): nothing to save,
+        # and no reason to reconnect the client or rebuild its connections
+        if client_data == updated_clients[name] and name in self.torrent_manager.download_clients:
+            return {"name": name, **client_data, "password": "***"}
         
-        updated_config["download_clients"][name] = client_data
+        updated_clients[name] = client_data
+        updated_config = {**self.torrent_manager.config, "download_clients": updated_clients}
         
         if not self.torrent_manager.save_config(updated_config):
             raise ConfigSaveError("Failed to save configuration")
         
         self.torrent_manager.config.update(updated_config)
+        self.torrent_manager.bump_config_version()
         
-        # Find connections that use this client (need to rebuild them)
+        # Connections that use this client need rebuilding. The client keeps
+        # its own list of them, so there is no need to scan every connection;
+        # a connection whose from and to are this client appears twice.
         connections_to_rebuild = []
         existing_client = self.torrent_manager.download_clients.get(name)
         if existing_client:
-            for conn_name, conn in list(self.torrent_manager.connections.items()):
-                if conn.from_client.name == name or conn.to_client.name == name:
-                    connections_to_rebuild.append(conn_name)
-                    # Cleanup old connection
-                    if hasattr(conn, 'shutdown') and callable(conn.shutdown):
-                        conn.shutdown()
-                    conn.from_client.remove_connection(conn)
-                    conn.to_client.remove_connection(conn)
-                    del self.torrent_manager.connections[conn_name]
+            client_connections = {conn.name: conn for conn in existing_client.connections}
+            for conn_name, conn in client_connections.items():
+                connections_to_rebuild.append(conn_name)
+                # Cleanup old connection
+                if hasattr(conn, 'shutdown') and callable(conn.shutdown):
+                    conn.shutdown()
+                conn.from_client.remove_connection(conn)
+                conn.to_client.remove_connection(conn)
+                self.torrent_manager.connections.pop(conn_name, None)
         
         # Create new client instance
         self.torrent_manager.download_clients[name] = self._create_client_instance(name, client_data)
@@ -178,9 +188,9 @@ class DownloadClientService:
             ConflictError: Client is used in connections
             ConfigSaveError: Failed to save config
         """
-        updated_config = dict(self.torrent_manager.config)
+        updated_clients = self._copy_config_clients()
         
-        if name not in updated_config.get("download_clients", {}):
+        if name not in updated_clients:
             raise NotFoundError("Client", name)
         
         # Check if client is used in connections
@@ -188,12 +198,16 @@ class DownloadClientService:
             if connection["from"] == name or connection["to"] == name:
                 raise ConflictError(f"Client '{name}' is used in connections and cannot be deleted")
         
-        del updated_config["download_clients"][name]
+        # Copy the clients mapping so the runtime config is untouched
+        # unless the save succeeds
+        del updated_clients[name]
+        updated_config = {**self.torrent_manager.config, "download_clients": updated_clients}
         
         if not self.torrent_manager.save_config(updated_config):
             raise ConfigSaveError("Failed to save configuration")
         
         self.torrent_manager.config.update(updated_config)
+        self.torrent_manager.bump_config_version()
         if name in self.torrent_manager.download_clients:
             del self.torrent_manager.download_clients[name]
     
@@ -222,9 +236,7 @@ class DownloadClientService:
             raise ValidationError("Password is required (provide password or existing client name)")
         
         client_type = client_data.get("type", "deluge")
-        if not ClientRegistry.is_supported(client_type):
-            supported = ", ".join(ClientRegistry.get_supported_types())
-            raise ValidationError(f"Unsupported client type: {client_type}. Supported: {supported}")
+        _require_supported_type(client_type)
         
         # Build data dict with resolved password for helper
         test_data = dict(client_data)